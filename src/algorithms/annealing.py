@@ -1,45 +1,211 @@
-def simulated_annealing(maze, start, goal, max_iterations=1000, initial_temp=1000, cooling_rate=0.95):
-    import random
-    import math
-
-    def heuristic(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-    def get_neighbors(position):
-        neighbors = []
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        for direction in directions:
-            neighbor = (position[0] + direction[0], position[1] + direction[1])
-            if 0 <= neighbor[0] < len(maze) and 0 <= neighbor[1] < len(maze[0]) and maze[neighbor[0]][neighbor[1]] == ".":
-                neighbors.append(neighbor)
-        return neighbors
-
-    current_position = start
-    current_temp = initial_temp
-    best_path = [start]
-    best_cost = heuristic(start, goal)
-
-    found_goal = False
-    for iteration in range(max_iterations):
-        if current_position == goal:
-            found_goal = True
+import math
+import random
+
+from maze.grid import Maze
+from algorithms.workspace import SearchWorkspace
+
+# Independent chains tried per query, each with its own seeded RNG stream
+DEFAULT_CHAINS = 8
+
+# Iterations without a new best distance to goal before a chain is reheated
+# to its initial temperature, and before it gives up and restarts from start
+DEFAULT_REHEAT_AFTER = 100
+DEFAULT_RESTART_AFTER = 400
+
+# Energy added per earlier visit of a cell, pushing chains out of explored
+# dead ends (see benchmarks/annealing.py for the effect on success rate)
+DEFAULT_REVISIT_PENALTY = 0.5
+
+
+def simulated_annealing(maze, start, goal, max_iterations=1000, initial_temp=2.0, cooling_rate=0.99,
+                        stats=None, chains=DEFAULT_CHAINS, seed=None, reheat_after=DEFAULT_REHEAT_AFTER,
+                        restart_after=DEFAULT_RESTART_AFTER, revisit_penalty=DEFAULT_REVISIT_PENALTY,
+                        workers=None, workspace=None):
+    """Multi-chain simulated annealing walk from start to goal, returns (path, steps) like bfs().
+
+    Each chain is a random walk whose energy is the Manhattan distance to
+    goal plus revisit_penalty for every earlier visit of the cell: a
+    proposed move to a random neighbour is taken if it lowers the energy,
+    and otherwise with probability exp(-increase / temperature), the
+    temperature shrinking by cooling_rate per iteration. The chain's state
+    is the path it has walked so far, kept free of loops: stepping back onto
+    a cell already on the path cuts the path back to that cell, so dead ends
+    are backtracked out of and the returned path never repeats a cell.
+
+    A chain that has not come closer to goal in reheat_after iterations is
+    reheated to initial_temp; after restart_after such iterations it starts
+    over from start. Each chain runs for at most max_iterations. Chains get
+    independent RNG streams drawn from seed (None for an unseeded run) and
+    are tried in order until one reaches goal, so a seeded call always
+    returns the same path. With workers > 1 the chains run in a process pool
+    and the lowest-numbered successful chain wins, as in a serial run.
+    Serial chains keep their visit counts and path positions in workspace
+    (an algorithms.workspace.SearchWorkspace) if given; pool workers use
+    their own.
+
+    Returns ([], 0) if no chain reaches goal.
+    """
+    grid = Maze.coerce(maze)
+    start_index = start[0] * grid.width + start[1]
+    goal_index = goal[0] * grid.width + goal[1]
+    master = random.Random(seed)
+    chain_seeds = [master.getrandbits(64) for _ in range(chains)]
+    settings = (max_iterations, initial_temp, cooling_rate, reheat_after, restart_after, revisit_penalty)
+
+    if workers is not None and workers > 1 and chains > 1:
+        outcomes = _run_chains_parallel(grid, start_index, goal_index, chain_seeds, settings, workers,
+                                        counting=stats is not None)
+    else:
+        workspace = SearchWorkspace.for_search(grid, workspace)
+        outcomes = (run_chain(grid, start_index, goal_index, chain_seed, *settings, workspace=workspace,
+                              counting=stats is not None)
+                    for chain_seed in chain_seeds)
+
+    # Search counters (see algorithms.stats) add up over the chains tried:
+    # each move onto a cell expands it, the frontier is the path being walked
+    path = None
+    for path, counters in outcomes:
+        if stats is not None:
+            stats.record(*counters)
+        if path is not None:
             break
+    outcomes.close()
+
+    if path is None:
+        return [], 0
+    width = grid.width
+    return [divmod(index, width) for index in path], len(path) - 1
 
-        neighbors = get_neighbors(current_position)
+
+def run_chain(grid, start_index, goal_index, seed, max_iterations, initial_temp, cooling_rate,
+              reheat_after, restart_after, revisit_penalty, workspace=None, counting=True):
+    """One annealing chain; returns (path as cell indices or None, counters for SearchStats.record).
+
+    Visit counts are kept in workspace.scores for cells stamped with the
+    chain's generation, and each cell's place on the path in the mirror's
+    parent array for cells stamped with the current walk's generation, so
+    a restart only starts a new generation of the mirror. The counters are
+    only kept when counting is true, and are None otherwise.
+    """
+    rng = random.Random(seed)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    goal_row, goal_col = divmod(goal_index, width)
+    exp, uniform, choice = math.exp, rng.random, rng.choice
+
+    def distance(index):
+        row, col = divmod(index, width)
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    seen = workspace.begin()
+    # Visit counts are kept across restarts, so a chain does not redo
+    # explored dead ends
+    stamps, visits = workspace.stamps, workspace.scores
+    walk = workspace.mirror
+    on_path = walk.begin()
+    path_stamps, position = walk.stamps, walk.parent  # Cell -> its place on path
+
+    path = [start_index]
+    path_stamps[start_index] = on_path
+    position[start_index] = 0
+    stamps[start_index] = seen
+    visits[start_index] = 1
+    current = start_index
+    current_energy = best_distance = distance(start_index)
+    temp = initial_temp
+    stall = 0
+
+    # Pushes are recovered afterwards: every cell put on the path was either
+    # cut off it again or is still on it
+    generated = pops = reexpanded = 0
+    visited = peak_path = 1
+    for _ in range(max_iterations):
+        if current == goal_index:
+            break
+        neighbors = steps[masks[current]]
         if not neighbors:
             break
 
-        next_position = random.choice(neighbors)
-        next_cost = heuristic(next_position, goal)
+        if counting:
+            generated += 1
+        # Proposal: a random neighbour; the move is taken on the Metropolis rule
+        proposal = current + choice(neighbors)
+        proposal_distance = distance(proposal)
+        proposal_energy = proposal_distance + revisit_penalty * (visits[proposal] if stamps[proposal] == seen else 0)
+        increase = proposal_energy - current_energy
+        if increase <= 0 or uniform() < exp(-increase / temp):
+            if path_stamps[proposal] != on_path:
+                path_stamps[proposal] = on_path
+                position[proposal] = len(path)
+                path.append(proposal)
+                if counting and len(path) > peak_path:
+                    peak_path = len(path)
+            else:
+                # Stepping back onto the path: drop the loop
+                place = position[proposal]
+                for cell in path[place + 1:]:
+                    path_stamps[cell] = 0
+                if counting:
+                    pops += len(path) - place - 1
+                del path[place + 1:]
+            if stamps[proposal] == seen:
+                visits[proposal] += 1
+                if counting:
+                    reexpanded += 1
+            else:
+                stamps[proposal] = seen
+                visits[proposal] = 1
+                if counting:
+                    visited += 1
+            current, current_energy = proposal, proposal_energy
+            if proposal_distance < best_distance:
+                best_distance = proposal_distance
+                stall = 0
+                temp *= cooling_rate
+                continue
 
-        if next_cost < best_cost or random.uniform(0, 1) < math.exp((best_cost - next_cost) / current_temp):
-            current_position = next_position
-            best_path.append(current_position)
-            best_cost = next_cost
+        stall += 1
+        if stall >= restart_after:
+            if counting:
+                pops += len(path) - 1
+            path = [start_index]
+            on_path = walk.begin()
+            path_stamps[start_index] = on_path
+            position[start_index] = 0
+            current = start_index
+            current_energy = best_distance = distance(start_index)
+            temp = initial_temp
+            stall = 0
+        elif stall % reheat_after == 0:
+            temp = initial_temp
+        else:
+            temp *= cooling_rate
 
-        current_temp *= cooling_rate
+    counters = None
+    if counting:
+        counters = (visited, generated, peak_path, pops + len(path), pops, reexpanded)
+    return (path if current == goal_index else None), counters
 
-    if found_goal:
-        return best_path, len(best_path) - 1 if best_path else 0
-    else:
-        return [], 0
\ No newline at end of file
+
+def _run_chains_parallel(grid, start_index, goal_index, chain_seeds, settings, workers, counting=True):
+    # Yields chain outcomes in chain order; the pool is shut down (pending
+    # chains cancelled) as soon as the caller stops at a success
+    from concurrent.futures import ProcessPoolExecutor
+
+    maze_state = (grid.height, grid.width, bytes(grid.cells))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chain_task, maze_state, start_index, goal_index, chain_seed, settings, counting)
+                   for chain_seed in chain_seeds]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _run_chain_task(maze_state, start_index, goal_index, seed, settings, counting=True):
+    height, width, cells = maze_state
+    return run_chain(Maze(height, width, bytearray(cells)), start_index, goal_index, seed, *settings,
+                     counting=counting)
@@ -1,36 +1,105 @@
-def astar(maze, start, goal):
-    from queue import PriorityQueue
+from maze.grid import Maze
+from algorithms.stats import count_generated
+from algorithms.workspace import SearchWorkspace
 
-    # Initialize the open and closed sets
-    open_set = PriorityQueue()
-    open_set.put((0, start))
-    came_from = {}
-    
-    # Initialize g_score and f_score dictionaries
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
 
-    while not open_set.empty():
-        current = open_set.get()[1]
+def astar(maze, start, goal, heuristic=None, stats=None, workspace=None):
+    path, _ = astar_search(maze, start, goal, heuristic, stats, workspace)
+    return path  # None if no path is found
+
+
+def astar_search(maze, start, goal, heuristic=None, stats=None, workspace=None):
+    """A* over a binary heap with lazy deletion.
+
+    Returns (path, expanded) where expanded is the number of nodes taken off
+    the open set and closed. Stale heap entries (a node pushed again after its
+    g score improved) are skipped when popped instead of being searched for.
+    heuristic(node, goal) overrides the Manhattan distance, e.g. with the
+    landmark bound of algorithms.oracle.DistanceOracle.heuristic. Pass a
+    SearchStats as stats to collect search counters.
+
+    g scores and parents are array('i')s indexed by row * width + col, valid
+    for cells whose stamp is the search's generation (reached) or the
+    generation + 1 (closed), so no per-cell dict entries are made. The
+    arrays come from workspace (an algorithms.workspace.SearchWorkspace)
+    when one is given, so repeated queries on one maze allocate nothing.
+    """
+    from heapq import heappush, heappop
+
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal_row, goal_col = goal
+    if heuristic is None:
+        start_h = abs(start[0] - goal_row) + abs(start[1] - goal_col)
+    else:
+        start_h = heuristic(start, goal)
+
+    # Heap entries are (f, cell index); row-major indices break ties the same
+    # way (row, col) tuples did
+    open_heap = [(start_h, start_index)]
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    closed = reached + 1
+    stamps, came_from, g_score = workspace.stamps, workspace.parent, workspace.scores
+    stamps[start_index] = reached
+    came_from[start_index] = -1
+    g_score[start_index] = 0
+    expanded = 0
+
+    # Search counters (see algorithms.stats); pushes and generated are
+    # recovered afterwards, the latter from a log of the closed cells
+    counting = stats is not None
+    if counting:
+        log = workspace.queue
+    pops = peak_frontier = 0
+    path = None
+    while open_heap:
+        f, current = heappop(open_heap)
+        if counting:
+            pops += 1
+            if len(open_heap) >= peak_frontier:
+                peak_frontier = len(open_heap) + 1  # Its size before the pop
+            if stamps[current] != closed:
+                log[expanded] = current
+        if stamps[current] == closed:
+            continue  # Stale entry, a better one was already expanded
+        stamps[current] = closed
+        expanded += 1
 
         # Check if we reached the goal
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal_index:
+            path = [divmod(node, width) for node in walk_parents(came_from, current)]
+            break
 
         # Explore neighbors
-        for neighbor in get_neighbors(maze, current):
-            tentative_g_score = g_score[current] + 1  # Assuming cost between nodes is 1
-
-            if tentative_g_score < g_score.get(neighbor, float('inf')):
+        tentative_g_score = g_score[current] + 1  # Assuming cost between nodes is 1
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            mark = stamps[neighbor]
+            if mark == closed:
+                continue
+            if mark != reached or tentative_g_score < g_score[neighbor]:
                 # This path to neighbor is better than any previous one
+                stamps[neighbor] = reached
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-
-                if neighbor not in [i[1] for i in open_set.queue]:
-                    open_set.put((f_score[neighbor], neighbor))
+                if heuristic is None:
+                    row, col = divmod(neighbor, width)
+                    h = abs(row - goal_row) + abs(col - goal_col)
+                else:
+                    h = heuristic(divmod(neighbor, width), goal)
+                heappush(open_heap, (tentative_g_score + h, neighbor))
 
-    return None  # Return None if no path is found
+    if counting:
+        # Every push was either popped or is still on the heap. Closed nodes
+        # are never reopened, so nothing is re-expanded; the goal is closed
+        # but not expanded.
+        searched = log[:expanded - (path is not None)]
+        stats.record(expanded, count_generated(adjacency, searched), peak_frontier, pops + len(open_heap), pops)
+    return path, expanded
 
 
 def heuristic(a, b):
@@ -39,13 +108,10 @@ def heuristic(a, b):
 
 
 def get_neighbors(maze, node):
-    neighbors = []
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-    for direction in directions:
-        neighbor = (node[0] + direction[0], node[1] + direction[1])
-        if 0 <= neighbor[0] < len(maze) and 0 <= neighbor[1] < len(maze[0]) and maze[neighbor[0]][neighbor[1]] == ".":
-            neighbors.append(neighbor)
-    return neighbors
+    grid = Maze.coerce(maze)
+    width = grid.width
+    # Up, Down, Left, Right
+    return [divmod(neighbor, width) for neighbor in grid.adjacency().neighbors(node[0] * width + node[1])]
 
 
 def reconstruct_path(came_from, current):
@@ -54,4 +120,14 @@ def reconstruct_path(came_from, current):
         current = came_from[current]
         total_path.append(current)
     total_path.reverse()  # Reverse the path to get it from start to goal
-    return total_path
\ No newline at end of file
+    return total_path
+
+
+def walk_parents(parent, current):
+    """Cell indices from the root to current, following a parent array where the root holds -1"""
+    total_path = [current]
+    while parent[current] != -1:
+        current = parent[current]
+        total_path.append(current)
+    total_path.reverse()
+    return total_path
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+from maze.grid import Maze
+from algorithms.bfs import bfs_tree, tree_path
+from algorithms.registry import SOLVERS, Solver
+from algorithms.workspace import SearchWorkspace
+
+# Solvers that return shortest paths on a unit-cost grid; their queries can be
+# answered from one shared breadth-first tree per start cell
+TREE_ALGORITHMS = {"bfs", "astar"}
+
+# Default number of BFS trees solve_many keeps at once, each an array('i') of
+# one entry per cell
+DEFAULT_MAX_TREES = 8
+
+
+def solve_many(maze, pairs, algorithm="bfs", max_trees=DEFAULT_MAX_TREES):
+    """Solve many (start, goal) queries against one maze.
+
+    Yields one (path, steps) tuple per pair, in the same format as bfs() and in
+    the same order as the input. For shortest-path algorithms ("bfs", "astar")
+    queries are grouped by start: the first query for a start grows one BFS
+    tree until every goal asked of that start is reached, and the tree is
+    dropped once its last query has been answered. At most max_trees trees
+    are kept at once; past that the least recently used one is dropped, and
+    grown again if its start comes back. Other algorithms are run
+    once per pair; registered solvers share one SearchWorkspace over the
+    whole batch, so the queries allocate no per-cell buffers. A pair with
+    start or goal outside the maze gives (None, 0).
+    """
+    grid = Maze.coerce(maze)
+    grid.adjacency()  # Build the shared neighbour index once, up front
+
+    if isinstance(algorithm, Solver):
+        solver = algorithm
+        algorithm = algorithm.name
+    elif callable(algorithm):
+        solver = algorithm
+        algorithm = getattr(algorithm, "__name__", "")
+    elif algorithm in SOLVERS:
+        solver = SOLVERS[algorithm]
+    else:
+        raise ValueError(f"Unknown algorithm {algorithm!r}, expected one of {sorted(SOLVERS)}")
+
+    if algorithm not in TREE_ALGORITHMS:
+        workspace = SearchWorkspace(grid) if isinstance(solver, Solver) else None
+        for start, goal in pairs:
+            if not (grid.in_bounds(*start) and grid.in_bounds(*goal)):
+                yield None, 0
+            elif workspace is not None:
+                yield _normalize(solver(grid, start, goal, workspace=workspace))
+            else:
+                yield _normalize(solver(grid, start, goal))
+        return
+
+    pairs = [(tuple(start), tuple(goal)) for start, goal in pairs]
+
+    # Goals and number of outstanding queries for each distinct start
+    goals_by_start = {}
+    for start, goal in pairs:
+        goals_by_start.setdefault(start, []).append(goal)
+    remaining = {start: len(goals) for start, goals in goals_by_start.items()}
+
+    trees = OrderedDict()  # Least recently used first
+    for start, goal in pairs:
+        if not grid.in_bounds(*start):
+            yield None, 0
+            continue
+
+        parent = trees.get(start)
+        if parent is None:
+            if len(trees) >= max_trees:
+                trees.popitem(last=False)
+            parent = trees[start] = bfs_tree(grid, start, goals_by_start[start])
+        else:
+            trees.move_to_end(start)
+
+        path = tree_path(parent, grid.width, goal)
+        yield (path, len(path) - 1) if path else (None, 0)
+
+        remaining[start] -= 1
+        if not remaining[start]:
+            del trees[start]
+
+
+def _normalize(result):
+    """Convert any solver's return value to bfs()'s (path, steps) format"""
+    if isinstance(result, tuple):
+        path = result[0]
+    else:
+        path = result
+    if not path:
+        return None, 0
+    return path, len(path) - 1
@@ -1,37 +1,117 @@
-def bfs(maze, start, goal):
-    from collections import deque
+from maze.grid import Maze
+from algorithms.stats import count_generated
+from algorithms.workspace import SearchWorkspace
+
+
+def bfs(maze, start, goal, stats=None, workspace=None):
+    """Breadth-first search; returns (path, steps), or (None, 0) if goal cannot be reached.
+
+    Search state lives in flat arrays indexed by cell (row * width + col)
+    rather than dicts: a cell is reached once its stamp is the search's
+    generation, parent holds the cell it was reached from (the start is its
+    own parent), and the queue is an array of cells in the order they were
+    reached, read from a moving head instead of popped. The arrays come from
+    workspace (an algorithms.workspace.SearchWorkspace) when one is given,
+    so repeated queries on one maze allocate nothing.
+    """
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    stamps, parent, queue = workspace.stamps, workspace.parent, workspace.queue
+    stamps[start_index] = reached
+    parent[start_index] = start_index
+    queue[0] = start_index
+    head, tail = 0, 1
+
+    # Peak queue size is the only counter kept during the search (see
+    # algorithms.stats); the rest is recovered from queue afterwards
+    counting = stats is not None
+    peak_frontier = 0
+    result = None, 0
+    while head < tail:
+        if counting and tail - head > peak_frontier:
+            peak_frontier = tail - head
+        current = queue[head]
+        head += 1
 
-    # Initialize the queue and visited set
-    queue = deque([start])
-    visited = set()
-    visited.add(start)
-    
-    # To keep track of the path
-    parent = {start: None}
-    
-    while queue:
-        current = queue.popleft()
-        
         # Check if we reached the goal
-        if current == goal:
-            path = []
-            while current is not None:
-                path.append(current)
+        if current == goal_index:
+            path = [divmod(current, width)]
+            while current != start_index:
                 current = parent[current]
+                path.append(divmod(current, width))
             path.reverse()
-            return path, len(path) - 1 if path else 0
-        
+            result = path, len(path) - 1
+            break
+
         # Explore neighbors
-        for direction in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            neighbor = (current[0] + direction[0], current[1] + direction[1])
-            if (0 <= neighbor[0] < len(maze) and
-                0 <= neighbor[1] < len(maze[0]) and
-                maze[neighbor[0]][neighbor[1]] == '.' and
-                neighbor not in visited):
-                
-                visited.add(neighbor)
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            if stamps[neighbor] != reached:
+                stamps[neighbor] = reached
+                parent[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+
+    if counting:
+        # Every visited cell was pushed once, in queue order, and the first
+        # head of them were popped
+        searched = queue[:head - (result[0] is not None)]  # Popped cells other than the goal
+        stats.record(head, count_generated(adjacency, searched), peak_frontier, tail, head)
+    return result  # (None, 0) if no path is found
+
+
+def bfs_tree(maze, start, goals=None):
+    """Breadth-first search tree rooted at start.
+
+    Returns a parent array indexed by cell (row * width + col): the root is its
+    own parent and unreached cells hold -1. If goals is given the search stops
+    as soon as every goal in it has been reached, otherwise the tree spans the
+    whole reachable area. Any number of goals can then be answered from the
+    same tree with tree_path().
+    """
+    from array import array
+    from collections import deque
+
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+
+    parent = array('i', [-1]) * grid.size
+    parent[start_index] = start_index
+    pending = None
+    if goals is not None:
+        pending = {goal[0] * width + goal[1] for goal in goals}
+        pending.discard(start_index)
+
+    queue = deque([start_index])
+    while queue and (pending is None or pending):
+        current = queue.popleft()
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            if parent[neighbor] == -1:
                 parent[neighbor] = current
                 queue.append(neighbor)
-    
-    # If no path is found
-    return None, 0
\ No newline at end of file
+                if pending is not None:
+                    pending.discard(neighbor)
+
+    return parent
+
+
+def tree_path(parent, width, goal):
+    """Read the path from the root of a bfs_tree() to goal, or None if unreached"""
+    current = goal[0] * width + goal[1]
+    if not (0 <= goal[1] < width and 0 <= current < len(parent)) or parent[current] == -1:
+        return None
+    path = [divmod(current, width)]
+    while parent[current] != current:
+        current = parent[current]
+        path.append(divmod(current, width))
+    path.reverse()
+    return path
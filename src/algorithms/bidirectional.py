@@ -0,0 +1,203 @@
+from maze.grid import Maze
+from algorithms.workspace import SearchWorkspace
+
+
+def bidirectional_bfs(maze, start, goal, stats=None, workspace=None):
+    """Breadth-first search from both ends, returns (path, steps) like bfs().
+
+    The smaller frontier is expanded one full level at a time. When a level
+    touches cells already reached from the other end, the shortest of those
+    meetings is taken once the whole level is done: finishing the level is
+    what makes the result a shortest path. Each side keeps its stamps,
+    parents and depths in the arrays of a SearchWorkspace: workspace for the
+    forward side and its mirror for the backward side. A goal on a wall is
+    never reached, as in bfs(), while a start on a wall is left through its
+    open neighbours.
+    """
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+
+    if start_index == goal_index:
+        if stats is not None:
+            stats.record(expanded=1, peak_frontier=1, pushes=1, pops=1)
+        return [tuple(start)], 0
+    if not grid.cells[goal_index]:
+        return None, 0  # Searching back from a wall would end the path inside it
+
+    # stamps, parent and depth per side, indexed by cell; a side has reached
+    # a cell when the cell's stamp is that side's generation
+    workspaces = _sides(grid, workspace)
+    marks = tuple(side.begin() for side in workspaces)
+    stamps = tuple(side.stamps for side in workspaces)
+    parents = tuple(side.parent for side in workspaces)
+    depths = tuple(side.scores for side in workspaces)
+    for side, root in enumerate((start_index, goal_index)):
+        stamps[side][root] = marks[side]
+        parents[side][root] = -1
+        depths[side][root] = 0
+    frontiers = ([start_index], [goal_index])
+
+    # Search counters (see algorithms.stats); every reached cell is pushed once
+    expanded = generated = peak_frontier = 0
+    pushes = 2
+    result = None, 0
+    while frontiers[0] and frontiers[1]:
+        if len(frontiers[0]) + len(frontiers[1]) > peak_frontier:
+            peak_frontier = len(frontiers[0]) + len(frontiers[1])
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, depth, stamp, mark = parents[side], depths[side], stamps[side], marks[side]
+        other_depth, other_stamp, other_mark = depths[1 - side], stamps[1 - side], marks[1 - side]
+
+        best, meeting = None, None
+        next_frontier = []
+        expanded += len(frontiers[side])
+        for current in frontiers[side]:
+            current_depth = depth[current] + 1
+            neighbors = steps[masks[current]]
+            generated += len(neighbors)
+            for step in neighbors:
+                neighbor = current + step
+                if stamp[neighbor] == mark:
+                    continue
+                stamp[neighbor] = mark
+                parent[neighbor] = current
+                depth[neighbor] = current_depth
+                next_frontier.append(neighbor)
+                if other_stamp[neighbor] == other_mark:
+                    total = current_depth + other_depth[neighbor]
+                    if best is None or total < best:
+                        best, meeting = total, neighbor
+        pushes += len(next_frontier)
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+
+        if meeting is not None:
+            path = join_paths(parents[0], parents[1], meeting, width)
+            result = path, len(path) - 1
+            break
+
+    if stats is not None:
+        stats.record(expanded, generated, peak_frontier, pushes, expanded)
+    return result
+
+
+def bidirectional_astar(maze, start, goal, stats=None, workspace=None):
+    """A* from both ends with Manhattan heuristics, returns (path, steps) like bfs().
+
+    The forward search estimates the distance to goal and the backward search
+    the distance to start. Whichever open set has the lower best f is
+    expanded next. Every time the searches touch, the best connecting cost mu
+    is updated. The search stops once either open set's best f reaches mu:
+    with consistent heuristics no path through an unexpanded node on that side
+    can be shorter. Like bidirectional_bfs() it keeps each side's state in
+    workspace and its mirror, and never reaches a goal on a wall.
+    """
+    from heapq import heappush, heappop
+
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+
+    if start_index == goal_index:
+        if stats is not None:
+            stats.record(expanded=1, peak_frontier=1, pushes=1, pops=1)
+        return [tuple(start)], 0
+    if not grid.cells[goal_index]:
+        return None, 0  # Searching back from a wall would end the path inside it
+
+    targets = (tuple(goal), tuple(start))
+    heaps = ([(heuristic(start, goal), start_index)], [(heuristic(goal, start), goal_index)])
+    # Per side: stamps (the side's generation once reached, + 1 once
+    # closed), g scores and parents, indexed by cell
+    workspaces = _sides(grid, workspace)
+    marks = tuple(side.begin() for side in workspaces)
+    stamps = tuple(side.stamps for side in workspaces)
+    g_scores = tuple(side.scores for side in workspaces)
+    parents = tuple(side.parent for side in workspaces)
+    for side, root in enumerate((start_index, goal_index)):
+        stamps[side][root] = marks[side]
+        g_scores[side][root] = 0
+        parents[side][root] = -1
+    best, meeting = float('inf'), None
+
+    # Search counters (see algorithms.stats)
+    expanded = generated = pushes = pops = peak_frontier = 0
+    while heaps[0] and heaps[1]:
+        if len(heaps[0]) + len(heaps[1]) > peak_frontier:
+            peak_frontier = len(heaps[0]) + len(heaps[1])
+        # Drop stale entries so the tops are the real best f of each side
+        for side in (0, 1):
+            heap, stamp, closed = heaps[side], stamps[side], marks[side] + 1
+            while heap and stamp[heap[0][1]] == closed:
+                heappop(heap)
+                pops += 1
+        if not heaps[0] or not heaps[1]:
+            break
+        if heaps[0][0][0] >= best or heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        heap, g_score, parent = heaps[side], g_scores[side], parents[side]
+        stamp, reached = stamps[side], marks[side]
+        closed = reached + 1
+        other_g, other_stamp, other_reached = g_scores[1 - side], stamps[1 - side], marks[1 - side]
+        target_row, target_col = targets[side]
+
+        current = heappop(heap)[1]
+        pops += 1
+        stamp[current] = closed
+        expanded += 1
+        tentative_g_score = g_score[current] + 1
+        neighbors = steps[masks[current]]
+        generated += len(neighbors)
+        for step in neighbors:
+            neighbor = current + step
+            mark = stamp[neighbor]
+            if mark == closed:
+                continue
+            if mark != reached or tentative_g_score < g_score[neighbor]:
+                stamp[neighbor] = reached
+                parent[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                row, col = divmod(neighbor, width)
+                heappush(heap, (tentative_g_score + abs(row - target_row) + abs(col - target_col), neighbor))
+                pushes += 1
+                if other_stamp[neighbor] >= other_reached and tentative_g_score + other_g[neighbor] < best:
+                    best, meeting = tentative_g_score + other_g[neighbor], neighbor
+
+    if stats is not None:
+        stats.record(expanded, generated, peak_frontier, pushes + 2, pops)
+    if meeting is None:
+        return None, 0
+    path = join_paths(parents[0], parents[1], meeting, width)
+    return path, len(path) - 1
+
+
+def heuristic(a, b):
+    # Using Manhattan distance as heuristic
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def join_paths(forward_parent, backward_parent, meeting, width):
+    """Stitch start -> meeting and meeting -> goal into one list of (row, col); roots' parents are -1"""
+    path = []
+    current = meeting
+    while current != -1:
+        path.append(divmod(current, width))
+        current = forward_parent[current]
+    path.reverse()
+    current = backward_parent[meeting]
+    while current != -1:
+        path.append(divmod(current, width))
+        current = backward_parent[current]
+    return path
+
+
+def _sides(grid, workspace):
+    # Forward and backward workspaces
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    return workspace, workspace.mirror
@@ -1,31 +1,72 @@
-def dfs(maze, start, goal):
-    stack = [start]
-    visited = set()
-    parent = {start: None}
+from maze.grid import Maze
+from algorithms.stats import count_generated
+from algorithms.workspace import SearchWorkspace
+
+
+def dfs(maze, start, goal, stats=None, workspace=None):
+    """Depth-first search; returns (path, found, number of expanded cells).
+
+    A cell is expanded once its stamp is the search's generation + 1, and
+    parent, an array('i') indexed by row * width + col, holds the cell it
+    was last pushed from; the path is read back by walking parent to the
+    start. The arrays come from workspace (an
+    algorithms.workspace.SearchWorkspace) when one is given, so repeated
+    queries on one maze allocate nothing.
+    """
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    visited = workspace.begin() + 1
+    stamps, parent = workspace.stamps, workspace.parent
+    current = start_index
+    stack = [current]
+    expanded = 0
     path_found = False
 
+    # Search counters (see algorithms.stats); pushes and generated are
+    # recovered afterwards, the latter from a log of the expanded cells
+    counting = stats is not None
+    if counting:
+        log = workspace.queue
+    pops = peak_frontier = logged = 0
     while stack:
         current = stack.pop()
-        if current == goal:
+        if counting:
+            pops += 1
+            if len(stack) >= peak_frontier:
+                peak_frontier = len(stack) + 1  # Its size before the pop
+            if stamps[current] != visited:
+                log[logged] = current
+                logged += 1
+        if current == goal_index:
             path_found = True
             break
-        if current not in visited:
-            visited.add(current)
-            x, y = current
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                neighbor = (x + dx, y + dy)
-                if (0 <= neighbor[0] < len(maze) and
-                        0 <= neighbor[1] < len(maze[0]) and
-                        maze[neighbor[0]][neighbor[1]] == '.' and
-                        neighbor not in visited):
+        if stamps[current] != visited:
+            stamps[current] = visited
+            expanded += 1
+            for step in steps[masks[current]]:
+                neighbor = current + step
+                if stamps[neighbor] != visited:
                     stack.append(neighbor)
                     parent[neighbor] = current
 
+    if counting:
+        # Every push was either popped or is still on the stack; the goal is
+        # logged last but not expanded
+        searched = log[:logged - path_found]
+        stats.record(expanded + path_found, count_generated(adjacency, searched),
+                     peak_frontier, pops + len(stack), pops)
+
     path = []
     if path_found:
-        while current is not None:
-            path.append(current)
+        path.append(divmod(current, width))
+        while current != start_index:
             current = parent[current]
+            path.append(divmod(current, width))
         path.reverse()
 
-    return path, path_found, len(visited)
\ No newline at end of file
+    return path, path_found, expanded
@@ -0,0 +1,82 @@
+import numpy as np
+
+from maze.grid import Maze
+
+UNREACHED = -1
+
+
+def distance_field(maze, start, goal=None):
+    """Breadth-first distance field computed a whole frontier at a time.
+
+    Returns a (height, width) int32 array holding the number of steps from
+    start to every reachable cell and -1 everywhere else. If goal is given the
+    expansion stops at the level that reaches it, leaving farther cells at -1.
+
+    Each level is expanded with vectorised index arithmetic over a copy of the
+    wall mask padded with a one-cell wall border, so no bounds checks are
+    needed and the work per level is proportional to the frontier size.
+    """
+    grid = Maze.coerce(maze)
+    height, width = grid.height, grid.width
+    padded_width = width + 2
+
+    free = np.zeros((height + 2, padded_width), dtype=bool)
+    free[1:-1, 1:-1] = grid.to_numpy()
+    free = free.ravel()
+    dist = np.full(free.shape, UNREACHED, dtype=np.int32)
+
+    offsets = np.array([-padded_width, padded_width, -1, 1], dtype=np.intp)
+    start_index = (start[0] + 1) * padded_width + start[1] + 1
+    goal_index = None if goal is None else (goal[0] + 1) * padded_width + goal[1] + 1
+
+    # unvisited[i] is True for free cells not yet given a distance
+    unvisited = free
+    dist[start_index] = 0
+    unvisited[start_index] = False
+    frontier = np.array([start_index], dtype=np.intp)
+    level = 0
+    while frontier.size and (goal_index is None or dist[goal_index] == UNREACHED):
+        level += 1
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[unvisited[candidates]]
+        # Cells reached from two frontier cells appear twice; keep exactly one
+        # occurrence of each without sorting
+        dist[candidates] = np.arange(candidates.size, dtype=np.int32)
+        frontier = candidates[dist[candidates] == np.arange(candidates.size, dtype=np.int32)]
+        dist[frontier] = level
+        unvisited[frontier] = False
+
+    return dist.reshape(height + 2, padded_width)[1:-1, 1:-1].copy()
+
+
+def descend_path(dist, goal):
+    """Walk down the distance gradient from goal back to the field's source.
+
+    Returns the path from source to goal as (row, col) tuples, or None if goal
+    was not reached. Neighbours are tried in Up, Down, Left, Right order.
+    """
+    height, width = dist.shape
+    row, col = goal
+    if not (0 <= row < height and 0 <= col < width) or dist[row, col] == UNREACHED:
+        return None
+
+    path = [(row, col)]
+    remaining = int(dist[row, col])
+    while remaining:
+        remaining -= 1
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + dr, col + dc
+            if 0 <= r < height and 0 <= c < width and dist[r, c] == remaining:
+                row, col = r, c
+                break
+        path.append((row, col))
+    path.reverse()
+    return path
+
+
+def bfs_numpy(maze, start, goal):
+    """Drop-in replacement for bfs() backed by distance_field(), returns (path, steps)"""
+    path = descend_path(distance_field(maze, start, goal), goal)
+    if path is None:
+        return None, 0
+    return path, len(path) - 1
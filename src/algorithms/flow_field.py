@@ -0,0 +1,216 @@
+from array import array
+from collections import OrderedDict, deque
+
+from maze.grid import Maze
+from maze.adjacency import UP, DOWN, LEFT, RIGHT
+
+UNREACHED = -1
+
+# Move codes stored per cell: 0 for "no move" (the goal itself, walls and
+# cells that cannot reach the goal), otherwise the direction of the next step
+NO_MOVE = 0
+MOVE_CODES = {UP: 1, DOWN: 2, LEFT: 3, RIGHT: 4}
+
+# Default memory cap of a FlowFieldScheduler's cache, in bytes
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class FlowField:
+    """Next step towards one goal from every cell of a maze.
+
+    Built by one reverse search from the goal: breadth-first on unit-cost
+    mazes, Dijkstra over the cost layer otherwise. Per cell it keeps the
+    direction of the first move of a cheapest path to the goal (one byte)
+    and the cost of that path (an int32, -1 if the goal cannot be reached),
+    so next_step() and distance() are single lookups however many agents
+    share the goal. Agents standing on a wall, which the other solvers
+    accept as a start, first step onto their best free neighbour; a goal on
+    a wall gives an empty field, which no cell can reach.
+    """
+
+    __slots__ = ("goal", "grid", "width", "version", "moves", "distances", "offsets")
+
+    def __init__(self, maze, goal):
+        grid = Maze.coerce(maze)
+        width = grid.width
+        self.goal = tuple(goal)
+        self.grid = grid
+        self.width = width
+        self.version = grid.version
+        self.offsets = (0, -width, width, -1, 1)  # Index step for each move code
+        self.moves = bytearray(grid.size)
+        self.distances = array('i', [UNREACHED]) * grid.size
+        goal_index = goal[0] * width + goal[1]
+        if not grid.cells[goal_index]:
+            return  # A wall goal is never reached: every cell stays UNREACHED
+        self.distances[goal_index] = 0
+        if grid.costs is None:
+            self._reverse_bfs(grid, goal_index)
+        else:
+            self._reverse_dijkstra(grid, goal_index)
+
+    def _reverse_bfs(self, grid, goal_index):
+        masks, moves, distances = grid.adjacency().masks, self.moves, self.distances
+        back = _back_steps(grid.width)
+        queue = deque([goal_index])
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            for step, code in back[masks[current]]:
+                neighbor = current + step
+                if distances[neighbor] == UNREACHED:
+                    distances[neighbor] = distance
+                    moves[neighbor] = code
+                    queue.append(neighbor)
+
+    def _reverse_dijkstra(self, grid, goal_index):
+        # A cell's distance is the cost of every cell entered on the way to
+        # the goal, so stepping back from current onto neighbor adds the cost
+        # of entering current
+        from algorithms.weighted import BucketQueue, _cost_range
+
+        masks, costs, moves, distances = grid.adjacency().masks, grid.costs, self.moves, self.distances
+        back = _back_steps(grid.width)
+        _, max_cost = grid.derived("cost_range", _cost_range)
+        queue = BucketQueue(max_cost + 1)
+        queue.push(0, goal_index)
+        done = bytearray(grid.size)
+        while queue.size:
+            distance, current = queue.pop()
+            if done[current]:
+                continue
+            done[current] = 1
+            distance += costs[current]
+            for step, code in back[masks[current]]:
+                neighbor = current + step
+                if not done[neighbor] and (distances[neighbor] == UNREACHED or distance < distances[neighbor]):
+                    distances[neighbor] = distance
+                    moves[neighbor] = code
+                    queue.push(distance, neighbor)
+
+    def next_step(self, cell):
+        """The cell to move to from cell: goal itself at the goal, None if it cannot be reached"""
+        index = cell[0] * self.width + cell[1]
+        code = self.moves[index]
+        if code:
+            return divmod(index + self.offsets[code], self.width)
+        if self.distances[index] == 0:
+            return self.goal
+        neighbor, _ = self._off_field(index)
+        return None if neighbor is None else divmod(neighbor, self.width)
+
+    def distance(self, cell):
+        """Cost of the remaining path from cell to the goal, None if unreachable"""
+        index = cell[0] * self.width + cell[1]
+        distance = self.distances[index]
+        if distance == UNREACHED:
+            distance = self._off_field(index)[1]
+        return None if distance == UNREACHED else distance
+
+    def path(self, start):
+        """Follow the field from start to the goal, a list of (row, col) or None"""
+        index = start[0] * self.width + start[1]
+        path = [divmod(index, self.width)]
+        if self.distances[index] == UNREACHED:
+            index, _ = self._off_field(index)
+            if index is None:
+                return None
+            path.append(divmod(index, self.width))
+        moves, offsets = self.moves, self.offsets
+        while moves[index]:
+            index += offsets[moves[index]]
+            path.append(divmod(index, self.width))
+        return path
+
+    def _off_field(self, index):
+        # (best neighbour, distance through it) for a cell the reverse search
+        # never entered, or (None, UNREACHED) if no neighbour reaches the goal
+        grid, distances = self.grid, self.distances
+        adjacency = grid.adjacency()
+        best, best_distance = None, UNREACHED
+        for step in adjacency.steps[adjacency.masks[index]]:
+            neighbor = index + step
+            if distances[neighbor] == UNREACHED:
+                continue
+            distance = distances[neighbor] + (grid.costs[neighbor] if grid.costs is not None else 1)
+            if best is None or distance < best_distance:
+                best, best_distance = neighbor, distance
+        return best, best_distance
+
+    @property
+    def nbytes(self):
+        return len(self.moves) + self.distances.itemsize * len(self.distances)
+
+
+class FlowFieldScheduler:
+    """Routes many agents towards a few shared goals with one FlowField per goal.
+
+    Fields are built on first use and kept in an LRU cache capped at
+    max_bytes (the least recently used fields are dropped first, but the
+    field just asked for is always kept). When the maze changes (its version
+    moves on) every cached field is dropped. hits, misses and evictions count
+    cache traffic.
+    """
+
+    def __init__(self, maze, max_bytes=DEFAULT_MAX_BYTES):
+        self.maze = Maze.coerce(maze)
+        self.max_bytes = max_bytes
+        self.fields = OrderedDict()  # goal -> FlowField, least recently used first
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def field(self, goal):
+        """The FlowField for goal, building it if it is not cached"""
+        goal = tuple(goal)
+        fields = self.fields
+        if fields and next(iter(fields.values())).version != self.maze.version:
+            self.clear()
+        field = fields.get(goal)
+        if field is not None:
+            self.hits += 1
+            fields.move_to_end(goal)
+            return field
+
+        self.misses += 1
+        field = fields[goal] = FlowField(self.maze, goal)
+        self.nbytes += field.nbytes
+        while self.nbytes > self.max_bytes and len(fields) > 1:
+            _, evicted = fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+        return field
+
+    def next_step(self, cell, goal):
+        return self.field(goal).next_step(cell)
+
+    def step_all(self, agents):
+        """Next cell for each (position, goal) pair, in order (None where the goal is unreachable)"""
+        steps = []
+        current_goal = field = None
+        for position, goal in agents:
+            if goal != current_goal:
+                field, current_goal = self.field(goal), goal
+            steps.append(field.next_step(position))
+        return steps
+
+    def path(self, start, goal):
+        return self.field(goal).path(start)
+
+    def clear(self):
+        self.fields.clear()
+        self.nbytes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _back_steps(width):
+    """Per neighbour mask, (index step to the neighbour, move code from the neighbour back)"""
+    offsets = ((UP, -width, MOVE_CODES[DOWN]), (DOWN, width, MOVE_CODES[UP]),
+               (LEFT, -1, MOVE_CODES[RIGHT]), (RIGHT, 1, MOVE_CODES[LEFT]))
+    return tuple(
+        tuple((step, code) for bit, step, code in offsets if mask & bit)
+        for mask in range(16)
+    )
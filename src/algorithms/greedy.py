@@ -1,36 +1,79 @@
+from maze.grid import Maze
+from algorithms.stats import count_generated
+from algorithms.workspace import SearchWorkspace
+
+
 def heuristic(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1]) # Finds the distance between start and goal (absolute difference)
 # value of a = (row, col)
 
-def greedy(maze, start, goal):
-    from queue import PriorityQueue
+def greedy(maze, start, goal, stats=None, workspace=None):
+    """Greedy best-first search on the Manhattan distance to goal.
+
+    Returns the path as a list of (row, col), or None if goal cannot be
+    reached. The open set is a binary heap of (h, order, cell) entries,
+    where order counts pushes, so cells at the same distance come out first
+    in, first out and runs are deterministic. A cell is marked reached when
+    it is first pushed and never pushed again, so every cell is queued and
+    expanded at most once, its parent is the cell that first reached it and
+    the heap never holds more entries than there are cells. Parents are kept
+    in an array('i') indexed by row * width + col, valid for cells whose
+    stamp is the search's generation, with the start its own parent, so
+    reaching a cell allocates nothing. The arrays come from workspace (an
+    algorithms.workspace.SearchWorkspace) when one is given, so repeated
+    queries on one maze allocate nothing either.
+    """
+    from heapq import heappush, heappop
 
-    open_set = PriorityQueue()
-    open_set.put((heuristic(start, goal), start))
-    came_from = {}
-    visited = set()
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal_row, goal_col = goal
 
-    while not open_set.empty():
-        current = open_set.get()[1]
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
+    open_heap = [(heuristic(start, goal), 0, start_index)]
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    stamps, came_from = workspace.stamps, workspace.parent  # came_from: cell each cell was reached from
+    stamps[start_index] = reached
+    came_from[start_index] = start_index
+    order = 1
+
+    # Only the peak heap size and a log of popped cells are kept during the
+    # search (see algorithms.stats); the rest is recovered afterwards
+    counting = stats is not None
+    if counting:
+        log = workspace.queue
+    peak_frontier = pops = 0
+    path = None
+    while open_heap:
+        current = heappop(open_heap)[2]
+        if counting:
+            if len(open_heap) >= peak_frontier:
+                peak_frontier = len(open_heap) + 1  # Its size before the pop
+            log[pops] = current
+            pops += 1
+        if current == goal_index:
+            path = [divmod(current, width)]
+            while current != start_index:
                 current = came_from[current]
-            path.append(start)
+                path.append(divmod(current, width))
             path.reverse()
-            return path
-
-        visited.add(current)
-        neighbors = [(current[0] + dx, current[1] + dy) for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]]
-        for neighbor in neighbors:
-            if (
-                0 <= neighbor[0] < len(maze)
-                and 0 <= neighbor[1] < len(maze[0])
-                and maze[neighbor[0]][neighbor[1]] == "."
-                and neighbor not in visited
-            ):
+            break
+
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            if stamps[neighbor] != reached:
+                stamps[neighbor] = reached
                 came_from[neighbor] = current
-                open_set.put((heuristic(neighbor, goal), neighbor))
+                row, col = divmod(neighbor, width)
+                heappush(open_heap, (abs(row - goal_row) + abs(col - goal_col), order, neighbor))
+                order += 1
 
-    return None  # Return None if no path is found
\ No newline at end of file
+    if counting:
+        # Every reached cell was pushed once, and every popped one but the
+        # goal was expanded
+        searched = log[:pops - (path is not None)]
+        stats.record(pops, count_generated(adjacency, searched), peak_frontier, order, pops)
+    return path  # None if no path is found
@@ -0,0 +1,162 @@
+from maze.grid import Maze
+
+INF = float('inf')
+
+
+class IncrementalPlanner:
+    """D* Lite planner that repairs its search when cells open or close.
+
+    The search runs backwards from goal, keeping g (current cost-to-goal) and
+    rhs (one-step lookahead) for every touched cell, with the same heap and
+    lazy deletion as astar() and its Manhattan heuristic towards start. When
+    cells change only their own and their neighbours' values are updated and
+    replan() re-expands just the inconsistent part of the search, instead of
+    rerunning astar() from scratch.
+
+        planner = IncrementalPlanner(maze, start, goal)
+        path = planner.replan()
+        planner.update_cells([((5, 7), False)])  # A door closes
+        path = planner.replan()
+
+    Changes are written to the planner's Maze (see Maze.set_open), so any
+    other solver given the same Maze sees them too. A start on a wall is
+    accepted as by astar(): its rhs is worked out from its free neighbours,
+    which are the only cells that update it.
+    """
+
+    def __init__(self, maze, start, goal):
+        self.maze = Maze.coerce(maze)
+        width = self.maze.width
+        # Maze.set_open patches this index in place, so it stays current
+        adjacency = self.maze.adjacency()
+        self._masks, self._steps, self._width = adjacency.masks, adjacency.steps, width
+        self.start = start[0] * width + start[1]
+        self.goal = goal[0] * width + goal[1]
+        self.expanded = 0  # Nodes expanded by the last replan()
+
+        self._g = {}
+        self._rhs = {self.goal: 0}
+        self._km = 0
+        self._heap = []
+        self._queued = {}  # Node -> its current key; other heap entries are stale
+        self._push(self.goal, (self._h(self.goal), 0))
+        self._start_around = self._wall_start_around()
+
+    def update_cells(self, changes):
+        """Apply ((row, col), is_open) changes and mark the affected cells"""
+        maze, width = self.maze, self.maze.width
+        touched = set()
+        for (row, col), is_open in changes:
+            maze.set_open(row, col, is_open)
+            index = row * width + col
+            touched.add(index)
+            touched.update(self._around(index))
+        for node in touched:
+            self._update_vertex(node)
+        self._start_around = self._wall_start_around()
+        if not maze.cells[self.start]:
+            self._update_vertex(self.start)
+
+    def move_start(self, start):
+        """Move the search start (e.g. the agent advanced along its path)"""
+        new_start = start[0] * self.maze.width + start[1]
+        self._km += self._h(new_start, self.start)
+        self.start = new_start
+        self._start_around = self._wall_start_around()
+        if not self.maze.cells[new_start]:
+            self._update_vertex(new_start)
+
+    def replan(self):
+        """Bring the search up to date and return the path from start to goal, or None"""
+        self.expanded = self._compute_shortest_path()
+        return self.path()
+
+    def path(self):
+        g, width = self._g, self.maze.width
+        current = self.start
+        if self._rhs.get(current, INF) == INF:
+            return None
+        path = [divmod(current, width)]
+        while current != self.goal:
+            current = min(self._around(current), key=lambda node: g.get(node, INF))
+            path.append(divmod(current, width))
+        return path
+
+    def _h(self, node, other=None):
+        width = self._width
+        other = self.start if other is None else other
+        return abs(node // width - other // width) + abs(node % width - other % width)
+
+    def _key(self, node):
+        width, start = self._width, self.start
+        best = min(self._g.get(node, INF), self._rhs.get(node, INF))
+        h = abs(node // width - start // width) + abs(node % width - start % width)
+        return best + h + self._km, best
+
+    def _around(self, node):
+        # Free cells next to node
+        return [node + step for step in self._steps[self._masks[node]]]
+
+    def _wall_start_around(self):
+        # Free cells next to a start on a wall, whose changes must reach the
+        # start; empty if the start is free (it is then in their _around())
+        if self.maze.cells[self.start]:
+            return frozenset()
+        return frozenset(self._around(self.start))
+
+    def _update_around(self, node):
+        for neighbor in self._around(node):
+            self._update_vertex(neighbor)
+        if node in self._start_around:
+            self._update_vertex(self.start)
+
+    def _push(self, node, key):
+        from heapq import heappush
+
+        self._queued[node] = key
+        heappush(self._heap, (key, node))
+
+    def _top(self):
+        from heapq import heappop
+
+        heap, queued = self._heap, self._queued
+        while heap and queued.get(heap[0][1]) != heap[0][0]:
+            heappop(heap)  # Stale entry
+        return heap[0] if heap else None
+
+    def _update_vertex(self, node):
+        g, rhs = self._g, self._rhs
+        if node != self.goal:
+            best = INF
+            if self.maze.cells[node] or node == self.start:
+                for step in self._steps[self._masks[node]]:
+                    cost = g.get(node + step, INF)
+                    if cost < best:
+                        best = cost
+            rhs[node] = best + 1
+        self._queued.pop(node, None)
+        if g.get(node, INF) != rhs.get(node, INF):
+            self._push(node, self._key(node))
+
+    def _compute_shortest_path(self):
+        g, rhs = self._g, self._rhs
+        expanded = 0
+        while True:
+            top = self._top()
+            start_key = self._key(self.start)
+            if top is None or (top[0] >= start_key and rhs.get(self.start, INF) == g.get(self.start, INF)):
+                return expanded
+
+            old_key, node = top
+            new_key = self._key(node)
+            expanded += 1
+            if old_key < new_key:
+                self._push(node, new_key)
+            elif g.get(node, INF) > rhs.get(node, INF):
+                g[node] = rhs[node]
+                del self._queued[node]
+                self._update_around(node)
+            else:
+                g[node] = INF
+                self._update_vertex(node)
+                self._update_around(node)
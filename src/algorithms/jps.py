@@ -0,0 +1,207 @@
+from maze.grid import Maze
+from algorithms.astar import heuristic, walk_parents
+from algorithms.workspace import SearchWorkspace
+
+
+def jps(maze, start, goal, stats=None, workspace=None):
+    path, _ = jps_search(maze, start, goal, stats, workspace)
+    return path  # None if no path is found
+
+
+def jps_search(maze, start, goal, stats=None, workspace=None):
+    """Jump Point Search on a 4-connected uniform-cost grid.
+
+    Same contract as astar_search(): returns (path, expanded), with the full
+    cell-by-cell path or None. Canonical paths move vertically first and
+    horizontally last. A horizontal jump runs until it reaches the goal or a
+    cell with a forced vertical neighbour: a free cell above or below whose
+    own predecessor in that row is blocked, so it can only be reached through
+    here. A vertical jump stops at any row where a horizontal jump in either
+    direction would find something. Only jump points enter the open set, so
+    straight corridors and open rooms are crossed without per-cell heap work.
+
+    Jump distances are precomputed once per maze (JumpTable, cached on the
+    Maze), so every jump is a table lookup plus a check for the goal. g
+    scores, parents and closed marks of jump points are kept by cell index
+    in the arrays of workspace (an algorithms.workspace.SearchWorkspace) if
+    given, as in astar_search().
+    """
+    from heapq import heappush, heappop
+
+    grid = Maze.coerce(maze)
+    cells, height, width = grid.cells, grid.height, grid.width
+    goal = tuple(goal)
+    goal_row, goal_col = goal
+
+    def free(r, c):
+        return 0 <= r < height and 0 <= c < width and cells[r * width + c]
+
+    table = grid.derived("jump_table", JumpTable)
+    east, west, north, south = table.east, table.west, table.north, table.south
+
+    def jump_horizontal(r, c, dc):
+        i = r * width + c
+        distance = east[i] if dc > 0 else west[i]
+        if r == goal_row and 0 < (goal_col - c) * dc <= abs(distance):
+            return goal
+        if distance > 0:
+            return r, c + dc * distance
+        return None
+
+    def jump_vertical(r, c, dr):
+        distance = (south if dr > 0 else north)[r * width + c]
+        stop = distance if distance > 0 else None
+        # The goal row is a stop too if the goal is in this column or within
+        # horizontal reach of it
+        rows_to_goal = (goal_row - r) * dr
+        if 0 < rows_to_goal <= abs(distance) and (stop is None or rows_to_goal < stop):
+            i = goal_row * width + c
+            if (goal_col == c or 0 < goal_col - c <= abs(east[i]) or 0 < c - goal_col <= abs(west[i])):
+                stop = rows_to_goal
+        if stop is None:
+            return None
+        return r + dr * stop, c
+
+    def successors(node, parent):
+        r, c = node
+        if parent is None:
+            return [jump_vertical(r, c, -1), jump_vertical(r, c, 1), jump_horizontal(r, c, -1), jump_horizontal(r, c, 1)]
+        if parent[1] == c:
+            # Arrived vertically: keep going and branch both ways horizontally
+            dr = 1 if r > parent[0] else -1
+            return [jump_vertical(r, c, dr), jump_horizontal(r, c, -1), jump_horizontal(r, c, 1)]
+        # Arrived horizontally: keep going, plus any forced vertical turns
+        dc = 1 if c > parent[1] else -1
+        found = [jump_horizontal(r, c, dc)]
+        for dr in (-1, 1):
+            if free(r + dr, c) and not free(r + dr, c - dc):
+                found.append(jump_vertical(r, c, dr))
+        return found
+
+    start = tuple(start)
+    open_heap = [(heuristic(start, goal), start)]
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    closed = reached + 1
+    stamps, came_from, g_score = workspace.stamps, workspace.parent, workspace.scores
+    start_index = start[0] * width + start[1]
+    stamps[start_index] = reached
+    came_from[start_index] = -1
+    g_score[start_index] = 0
+    expanded = 0
+
+    # Search counters (see algorithms.stats); only jump points are
+    # generated, and pushes are recovered afterwards
+    counting = stats is not None
+    generated = pops = peak_frontier = 0
+    path = None
+    while open_heap:
+        f, current = heappop(open_heap)
+        if counting:
+            pops += 1
+            if len(open_heap) >= peak_frontier:
+                peak_frontier = len(open_heap) + 1  # Its size before the pop
+        index = current[0] * width + current[1]
+        if stamps[index] == closed:
+            continue
+        stamps[index] = closed
+        expanded += 1
+
+        if current == goal:
+            path = expand_jumps([divmod(node, width) for node in walk_parents(came_from, index)])
+            break
+
+        parent = came_from[index]
+        g = g_score[index]
+        for jump_point in successors(current, divmod(parent, width) if parent != -1 else None):
+            if jump_point is None:
+                continue
+            if counting:
+                generated += 1
+            jump_index = jump_point[0] * width + jump_point[1]
+            mark = stamps[jump_index]
+            if mark == closed:
+                continue
+            tentative_g_score = g + heuristic(current, jump_point)
+            if mark != reached or tentative_g_score < g_score[jump_index]:
+                stamps[jump_index] = reached
+                came_from[jump_index] = index
+                g_score[jump_index] = tentative_g_score
+                heappush(open_heap, (tentative_g_score + heuristic(jump_point, goal), jump_point))
+
+    if counting:
+        # Every push, the start's included, was either popped or is still queued
+        stats.record(expanded, generated, peak_frontier, pops + len(open_heap), pops)
+    return path, expanded
+
+
+class JumpTable:
+    """Precomputed jump distances for every cell and direction.
+
+    east[i] > 0 is the number of steps from cell i to the next jump point when
+    moving east; east[i] <= 0 means the move hits a wall after -east[i] free
+    cells without meeting one. west, north and south work the same way. A
+    vertical jump point is a cell from which a horizontal jump succeeds.
+    """
+    __slots__ = ("east", "west", "north", "south")
+
+    def __init__(self, maze):
+        from array import array
+
+        height, width, cells = maze.height, maze.width, maze.cells
+        east = array('i', bytes(4 * height * width))
+        west = array('i', east)
+        north = array('i', east)
+        south = array('i', east)
+
+        def extend(table, i, j, is_jump_point):
+            # Distance from i given that the next cell j is free
+            if is_jump_point:
+                table[i] = 1
+            else:
+                distance = table[j]
+                table[i] = distance + 1 if distance > 0 else distance - 1
+
+        for r in range(height):
+            has_up, has_down = r > 0, r < height - 1
+            base = r * width
+            for c in range(width - 2, -1, -1):
+                i = base + c
+                j = i + 1
+                if cells[j]:
+                    forced = ((has_up and cells[j - width] and not cells[i - width]) or
+                              (has_down and cells[j + width] and not cells[i + width]))
+                    extend(east, i, j, forced)
+            for c in range(1, width):
+                i = base + c
+                j = i - 1
+                if cells[j]:
+                    forced = ((has_up and cells[j - width] and not cells[i - width]) or
+                              (has_down and cells[j + width] and not cells[i + width]))
+                    extend(west, i, j, forced)
+
+        for r in range(height - 2, -1, -1):
+            for i in range(r * width, (r + 1) * width):
+                j = i + width
+                if cells[j]:
+                    extend(south, i, j, east[j] > 0 or west[j] > 0)
+        for r in range(1, height):
+            for i in range(r * width, (r + 1) * width):
+                j = i - width
+                if cells[j]:
+                    extend(north, i, j, east[j] > 0 or west[j] > 0)
+
+        self.east, self.west, self.north, self.south = east, west, north, south
+
+
+def expand_jumps(jump_points):
+    """Fill in the straight runs between consecutive jump points"""
+    path = [jump_points[0]]
+    for r, c in jump_points[1:]:
+        row, col = path[-1]
+        dr = (r > row) - (r < row)
+        dc = (c > col) - (c < col)
+        while (row, col) != (r, c):
+            row, col = row + dr, col + dc
+            path.append((row, col))
+    return path
@@ -0,0 +1,353 @@
+"""
+Memory-bounded searches for grids too large for A*'s per-cell tables
+
+A* keeps g scores, parents and a closed set for every cell it reaches, so
+its memory grows with the searched area. The two searches here trade time
+for memory instead:
+
+- ida_star: iterative-deepening A*. Depth-first searches with a rising f
+  bound, holding the current path and a transposition table of at most
+  table_size cells; cells are expanded again in every iteration.
+- sma_star: a simplified memory-bounded A* (SMA*). Best-first like A*, but
+  never holds more than node_budget nodes: when full, it forgets the worst
+  leaf and remembers its f in the parent, which is expanded again if that
+  branch becomes the best one.
+
+Both return (path, peak nodes held) and fill a SearchStats given as stats,
+with that peak as peak_frontier, their budget as budget and a search that
+ran out of it as a cutoff; reexpanded is the time paid for the memory
+saved. Neither keeps a per-cell array to tell it, so it is worked out from
+what they hold anyway (see each search). benchmarks/memory_bounded.py
+compares both with A* per grid size.
+"""
+
+from heapq import heapify, heappush, heappop
+
+from maze.grid import Maze
+from algorithms.astar import heuristic as manhattan
+
+# Default cap on expansions for ida_star, which gives up past it
+DEFAULT_MAX_EXPANSIONS = 10_000_000
+
+# Default number of cells in ida_star's transposition table
+DEFAULT_TABLE_SIZE = 100_000
+
+# Default number of nodes sma_star may hold
+DEFAULT_NODE_BUDGET = 100_000
+
+
+def ida_star(maze, start, goal, heuristic=None, stats=None, max_expansions=DEFAULT_MAX_EXPANSIONS,
+             workspace=None, table_size=DEFAULT_TABLE_SIZE):
+    """Iterative-deepening A*; returns (path, peak nodes held) or (None, peak).
+
+    heuristic(node, goal) defaults to astar.heuristic (Manhattan distance)
+    and must be admissible for the path to be shortest. Each iteration is a
+    depth-first search that cuts off any cell whose f = g + h exceeds the
+    bound; the next bound is the smallest f that was cut off. Plain IDA*
+    searches every route to a cell, exponentially many on open grids, so
+    each iteration also keeps the smallest g it reached each cell at, for
+    up to table_size cells, and skips a cell reached again no cheaper (once
+    the table is full, only cells on the current path are skipped). The
+    search gives up, returning no path, once max_expansions expansions have
+    been spent (None for no cap). Memory is the current path plus the table,
+    a dict of at most table_size entries (about 100 bytes each) cleared
+    between iterations, however large the maze; no per-cell array is kept,
+    so workspace is accepted for the registry's sake and not used.
+
+    With stats, expansions in the last iteration count as expanded and
+    those of the iterations before it as reexpanded.
+    """
+    if heuristic is None:
+        heuristic = manhattan
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal = tuple(goal)
+
+    spent = 0  # Expansions over all iterations, checked against max_expansions
+    last = 0  # Expansions before the current iteration
+    generated = 0
+    peak = 1
+    found = None
+    cut_off = False
+
+    bound = heuristic(tuple(start), goal)
+    while found is None and bound != float('inf'):
+        last = spent
+        next_bound = float('inf')
+        path = [start_index]
+        on_path = {start_index}
+        best_g = {start_index: 0}
+        children = [iter(steps[masks[start_index]])]
+        spent += 1
+        if start_index == goal_index:
+            found = path
+            break
+        generated += len(steps[masks[start_index]])
+
+        while children:
+            step = next(children[-1], None)
+            if step is None:
+                children.pop()
+                on_path.discard(path.pop())
+                continue
+            node = path[-1] + step
+            g = len(path)
+            known = best_g.get(node)
+            if (known is not None and known <= g) or node in on_path:
+                continue
+            f = g + heuristic(divmod(node, width), goal)
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                continue
+            if known is not None or len(best_g) < table_size:
+                best_g[node] = g
+            path.append(node)
+            # The path is in the table until it fills up
+            held = len(best_g) if len(best_g) < table_size else table_size + len(path)
+            if held > peak:
+                peak = held
+            if node == goal_index:
+                found = path
+                break
+            if max_expansions is not None and spent >= max_expansions:
+                next_bound = float('inf')  # Out of budget: give up
+                cut_off = True
+                break
+            spent += 1
+            on_path.add(node)
+            children.append(iter(steps[masks[node]]))
+            generated += len(steps[masks[node]])
+        bound = next_bound
+
+    if stats is not None:
+        # A goal other than start is reached but not expanded; it counts as one
+        expanded = spent - last + (found is not None and len(found) > 1)
+        stats.record(expanded, generated, peak, expanded + last, expanded + last, last,
+                     max_expansions or 0, cut_off)
+    if found is None:
+        return None, peak
+    return [divmod(node, width) for node in found], peak
+
+
+def sma_star(maze, start, goal, node_budget=DEFAULT_NODE_BUDGET, heuristic=None, stats=None, workspace=None,
+             max_expansions=DEFAULT_MAX_EXPANSIONS):
+    """Simplified memory-bounded A*; returns (path, peak nodes held) or (None, peak).
+
+    Never holds more than node_budget nodes (cells with a g score and a
+    parent). Nodes come off the open set in f order, deepest first on ties,
+    and their children get f = max(parent f, g + h), so f never falls along
+    a path. Children are added best first; when the budget is full the open
+    leaf with the highest f (the shallowest on ties) is forgotten to make
+    room, and if that leaf is better than the child, the child is dropped
+    instead. Either way the parent remembers the child's f, and stays on
+    the open set at the smallest f remembered, to generate the child again
+    (at no less than that f) if it comes up. A child with no room for a path
+    to goal through it (deeper than node_budget - 1, or at that depth and
+    not the goal) gets f = infinity, so the search ends without a path when
+    the budget is too small.
+
+    Each cell is held at most once, at the smallest g found so far; reaching
+    a held cell more cheaply moves it under the new parent, releasing what
+    was searched below it. On a maze without loops, where every cell has a
+    single route from start, a path is then found, and a shortest one,
+    whenever node_budget is at least its length in cells (shortest depth +
+    1). Where routes meet, the search can need more: a cell held on one
+    route is skipped on the others, so what was learnt below it is lost
+    when it is forgotten. node_budget covering every cell the search
+    reaches (at most the free cells) always suffices, as nothing is then
+    forgotten and the search is A*. With too small a budget, telling that
+    no path fits can take exponentially many re-expansions, so the search
+    also gives up after max_expansions expansions (None for no cap). A None
+    result with stats.cutoffs counted means "not found within the budget".
+    workspace is accepted for the registry's sake and not used.
+
+    With stats, an expansion of a node that was expanded before and has
+    been held since counts as reexpanded; a node forgotten in between
+    counts as expanded again, so reexpanded is a lower bound.
+    """
+    if heuristic is None:
+        heuristic = manhattan
+    if node_budget < 1:
+        raise ValueError(f"node_budget must be at least 1, got {node_budget}")
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal = tuple(goal)
+
+    # Per held node: g, f, parent and held children; an expanded node also
+    # remembers the f of each child it is missing (at most one per step)
+    g_score = {start_index: 0}
+    f_score = {start_index: heuristic(tuple(start), goal)}
+    parent = {start_index: None}
+    children = {start_index: set()}
+    forgotten = {}
+    # Open nodes with their f: unexpanded leaves at f_score, expanded nodes
+    # at the smallest f remembered for a missing child. Kept in two lazy
+    # heaps, best first for expansion and worst first for forgetting;
+    # entries are checked against open_set when they surface
+    open_set = {start_index: f_score[start_index]}
+    best_heap = [(f_score[start_index], 0, 0, start_index)]
+    worst_heap = [(-f_score[start_index], 0, 0, start_index)]
+    order = 1
+
+    expanded = reexpanded = generated = pops = 0
+    peak = 1
+    found = False
+    limited = False  # Something was forgotten or cut off for want of room
+
+    def add_open(node, f):
+        nonlocal order
+        open_set[node] = f
+        g = g_score[node]
+        heappush(best_heap, (f, -g, order, node))
+        heappush(worst_heap, (-f, g, order, node))
+        order += 1
+
+    while open_set:
+        f, _, _, current = heappop(best_heap)
+        pops += 1
+        if open_set.get(current) != f:
+            continue  # Stale entry
+        if f == float('inf'):
+            break  # Every open branch is a known dead end
+        if current == goal_index:
+            found = True
+            break
+        if max_expansions is not None and expanded + reexpanded >= max_expansions:
+            limited = True  # Out of budget: give up
+            break
+        del open_set[current]
+
+        g = g_score[current] + 1
+        neighbors = steps[masks[current]]
+        generated += len(neighbors)
+        if current in forgotten:
+            reexpanded += 1
+        else:
+            expanded += 1
+        remembered = forgotten.pop(current, None) or {}
+        missing = forgotten[current] = {}
+
+        # Children, best first: cells not held yet, or held more expensively
+        # than through current (children held already are skipped)
+        candidates = []
+        for step in neighbors:
+            neighbor = current + step
+            known = g_score.get(neighbor)
+            if known is None or known > g:
+                if g >= node_budget or (g + 1 == node_budget and neighbor != goal_index):
+                    child_f = float('inf')  # No room for a path to goal through it
+                    limited = True
+                else:
+                    child_f = max(f, g + heuristic(divmod(neighbor, width), goal),
+                                  remembered.get(neighbor, f))
+                if child_f == float('inf'):
+                    missing[neighbor] = child_f  # A known dead end takes no room
+                else:
+                    candidates.append((child_f, neighbor))
+        candidates.sort()
+
+        for child_f, neighbor in candidates:
+            if neighbor in g_score:
+                # Move the node under current; whatever was searched below
+                # it from its old, dearer position is released first, and
+                # the old parent need not reach it again
+                _release_subtree(neighbor, parent, g_score, f_score, children, forgotten, open_set)
+                _forget(neighbor, parent, g_score, f_score, children, forgotten, open_set, add_open,
+                        float('inf'))
+            elif len(g_score) >= node_budget:
+                # Full: make room by forgetting the worst leaf, unless the
+                # worst leaf is better than this child, which is then dropped
+                limited = True
+                victim = _worst_leaf(worst_heap, open_set, children, g_score, start_index)
+                if victim is None or (open_set[victim], -g_score[victim]) <= (child_f, -g):
+                    missing[neighbor] = child_f
+                    continue
+                heappop(worst_heap)
+                _forget(victim, parent, g_score, f_score, children, forgotten, open_set, add_open)
+            g_score[neighbor] = g
+            f_score[neighbor] = child_f
+            parent[neighbor] = current
+            children[neighbor] = set()
+            children[current].add(neighbor)
+            add_open(neighbor, child_f)
+
+        if missing or not children[current]:
+            # Open again at the best f it is missing (infinite for a dead end)
+            add_open(current, min(missing.values(), default=float('inf')))
+        if len(g_score) > peak:
+            peak = len(g_score)
+        if len(best_heap) > 4 * len(open_set) + 64:
+            # Mostly stale entries: rebuild both heaps so memory stays in
+            # proportion to the budget
+            best_heap[:] = [entry for entry in best_heap if open_set.get(entry[3]) == entry[0]]
+            worst_heap[:] = [entry for entry in worst_heap if open_set.get(entry[3]) == -entry[0]]
+            heapify(best_heap)
+            heapify(worst_heap)
+
+    if len(g_score) > peak:
+        peak = len(g_score)
+    if stats is not None:
+        stats.record(expanded + found, generated, peak, order, pops, reexpanded,
+                     node_budget, not found and limited)
+    if not found:
+        return None, peak
+    path = []
+    current = goal_index
+    while current is not None:
+        path.append(divmod(current, width))
+        current = parent[current]
+    path.reverse()
+    return path, peak
+
+
+def _forget(node, parent, g_score, f_score, children, forgotten, open_set, add_open, node_f=None):
+    """Drop a leaf, leaving its f with its parent, which goes back on the open set.
+
+    The f left is node_f if given, otherwise the leaf's open f, which is
+    backed up from below it once it has been expanded.
+    """
+    node_parent = parent.pop(node)
+    del g_score[node], children[node], f_score[node]
+    open_f = open_set.pop(node, None)
+    if node_f is None:
+        node_f = open_f
+    forgotten.pop(node, None)
+    children[node_parent].discard(node)
+    missing = forgotten[node_parent]
+    missing[node] = node_f
+    add_open(node_parent, min(missing.values()))  # Also pushed again as a leaf for _worst_leaf
+
+
+def _release_subtree(node, parent, g_score, f_score, children, forgotten, open_set):
+    """Drop every node held below node, which is left unexpanded; nothing is backed up"""
+    pending = list(children[node])
+    children[node] = set()
+    forgotten.pop(node, None)
+    while pending:
+        descendant = pending.pop()
+        pending.extend(children.pop(descendant))
+        del parent[descendant], g_score[descendant], f_score[descendant]
+        forgotten.pop(descendant, None)
+        open_set.pop(descendant, None)
+
+
+def _worst_leaf(worst_heap, open_set, children, g_score, root):
+    """The open leaf with the highest f (shallowest on ties), left on top of worst_heap.
+
+    Stale entries above it are dropped, and so are entries of open nodes
+    that still hold children, which are pushed again when they become
+    leaves. Returns None if there is no open leaf or it is root.
+    """
+    while worst_heap:
+        negative_f, g, _, node = worst_heap[0]
+        if open_set.get(node) == -negative_f and g == g_score.get(node) and not children[node]:
+            return None if node == root else node
+        heappop(worst_heap)  # Stale entry, or not a leaf
+    return None
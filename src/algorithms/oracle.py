@@ -0,0 +1,150 @@
+from array import array
+
+import numpy as np
+
+from maze.grid import Maze
+from algorithms.distance_field import distance_field, UNREACHED
+
+# Grids with at most this many free cells get exact all-pairs distances;
+# larger ones get ALT landmark lower bounds
+MAX_EXACT_CELLS = 1024
+DEFAULT_LANDMARKS = 8
+
+
+class DistanceOracle:
+    """Precomputed distances for repeated queries on a static maze.
+
+    Holds one BFS distance row per source cell, -1 where unreachable. In
+    exact mode every free cell is a source and the rows only cover free
+    cells, shape (free, free), both axes in the order of sources, so
+    distance() answers any query with a lookup and the size depends on the
+    free cells alone, not on the grid around them. In landmark (ALT) mode
+    only a few well-spread cells are sources, with a row over every cell,
+    shape (sources, height * width), and the triangle inequality gives the
+    lower bound max |d(L, a) - d(L, b)| over landmarks L, which is admissible
+    and consistent and so can replace the Manhattan heuristic in astar().
+    """
+
+    def __init__(self, height, width, sources, distances, exact, fingerprint=None):
+        self.height = height
+        self.width = width
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.distances = np.asarray(distances, dtype=np.int32)
+        self.exact = bool(exact)
+        self.fingerprint = fingerprint
+        self._row_of = {int(source): row for row, source in enumerate(self.sources)}
+        self._field_goal = None
+        self._field = None
+
+    @classmethod
+    def build(cls, maze, landmarks=DEFAULT_LANDMARKS, max_exact_cells=MAX_EXACT_CELLS, seed=0):
+        """Build an exact oracle for small mazes and a landmark oracle otherwise"""
+        grid = Maze.coerce(maze)
+        free = np.flatnonzero(grid.to_numpy().ravel())
+        if free.size == 0:
+            raise ValueError("Maze has no free cells")
+
+        if free.size <= max_exact_cells:
+            sources = free
+            rows = [distance_field(grid, divmod(int(i), grid.width)).ravel()[free] for i in sources]
+            return cls(grid.height, grid.width, sources, np.array(rows), True, grid.fingerprint())
+
+        sources, rows = select_landmarks(grid, free, landmarks, seed)
+        return cls(grid.height, grid.width, sources, np.array(rows), False, grid.fingerprint())
+
+    def distance(self, a, b):
+        """Exact distance between two cells, None if unreachable (exact mode only)"""
+        if not self.exact:
+            raise ValueError("Landmark oracles only give lower bounds, use lower_bound()")
+        row = self._row_of.get(a[0] * self.width + a[1])
+        column = self._row_of.get(b[0] * self.width + b[1])
+        if row is None or column is None:
+            return None
+        d = int(self.distances[row, column])
+        return None if d == UNREACHED else d
+
+    def lower_bound_field(self, goal):
+        """Lower bound on the distance from every cell to goal, as a flat int32 array"""
+        goal_index = goal[0] * self.width + goal[1]
+        row = self._row_of.get(goal_index)
+        if self.exact:
+            field = np.zeros(self.height * self.width, dtype=np.int32)
+            if row is not None:
+                field[self.sources] = np.maximum(self.distances[row], 0)
+            return field
+
+        to_goal = self.distances[:, goal_index][:, None]
+        usable = (self.distances != UNREACHED) & (to_goal != UNREACHED)
+        bounds = np.where(usable, np.abs(self.distances - to_goal), 0)
+        return bounds.max(axis=0).astype(np.int32)
+
+    def lower_bound(self, a, b):
+        """Lower bound on the distance from a to b, from two columns: O(sources), not O(cells)"""
+        a_index, b_index = a[0] * self.width + a[1], b[0] * self.width + b[1]
+        if self.exact:
+            row, column = self._row_of.get(b_index), self._row_of.get(a_index)
+            if row is None or column is None:
+                return 0
+            return max(int(self.distances[row, column]), 0)
+
+        from_a, to_b = self.distances[:, a_index], self.distances[:, b_index]
+        usable = (from_a != UNREACHED) & (to_b != UNREACHED)
+        return int(np.abs(from_a[usable] - to_b[usable]).max(initial=0))
+
+    def heuristic(self, node, goal):
+        """astar() heuristic: the bound field for goal is computed once and reused"""
+        if goal != self._field_goal:
+            self._field = array("i", self.lower_bound_field(goal).astype(np.int32).tobytes())
+            self._field_goal = goal
+        return self._field[node[0] * self.width + node[1]]
+
+    def save(self, path):
+        """Write the oracle to an .npz file so it need not be rebuilt on restart"""
+        np.savez_compressed(
+            path,
+            shape=np.array([self.height, self.width], dtype=np.int64),
+            sources=self.sources,
+            distances=self.distances,
+            exact=np.array(self.exact),
+            fingerprint=np.array(self.fingerprint or ""),
+        )
+
+    @classmethod
+    def load(cls, path, maze=None):
+        """Read an oracle written by save(), checking it was built for maze if given"""
+        with np.load(path) as data:
+            height, width = (int(v) for v in data["shape"])
+            fingerprint = str(data["fingerprint"]) or None
+            oracle = cls(height, width, data["sources"], data["distances"], bool(data["exact"]), fingerprint)
+        if maze is not None and Maze.coerce(maze).fingerprint() != oracle.fingerprint:
+            raise ValueError(f"Oracle in {path} was built for a different maze")
+        return oracle
+
+    @property
+    def nbytes(self):
+        return self.distances.nbytes + self.sources.nbytes
+
+
+def select_landmarks(grid, free, count, seed=0):
+    """Pick landmarks by farthest-point selection, returning (sources, distance rows).
+
+    The first landmark is the cell farthest from a random free cell; each next
+    one is the cell whose distance to its nearest landmark so far is largest.
+    Spreading landmarks to the edges of the maze gives the tightest bounds.
+    """
+    rng = np.random.default_rng(seed)
+    seed_cell = int(free[rng.integers(free.size)])
+    nearest = distance_field(grid, divmod(seed_cell, grid.width)).ravel()
+
+    sources, rows = [], []
+    for _ in range(min(count, free.size)):
+        landmark = int(free[int(np.argmax(nearest[free]))])
+        row = distance_field(grid, divmod(landmark, grid.width)).ravel()
+        if rows:
+            closer = (row != UNREACHED) & ((nearest == UNREACHED) | (row < nearest))
+            nearest = np.where(closer, row, nearest)
+        else:
+            nearest = row
+        sources.append(landmark)
+        rows.append(row)
+    return sources, rows
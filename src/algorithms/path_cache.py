@@ -0,0 +1,177 @@
+"""
+LRU cache of solved queries, in front of any registered solver
+
+Entries are SearchResults keyed by (solver name, maze fingerprint, start,
+goal). The fingerprint is a content hash of the maze's cells and costs
+(Maze.fingerprint(), cached per maze version), so an edit to the maze
+changes every key and stale entries are never returned; they simply age out
+of the LRU. Two Maze objects with the same content share entries.
+
+Solvers registered as optimal also answer suffix queries: every cell of a
+cached shortest path to goal is indexed, and since any suffix of a shortest
+path is itself a shortest path, a query from such a cell to the same goal
+is answered by slicing the cached path, with no search at all.
+
+    cache = PathCache(max_entries=1024)
+    result = cache.solve(SOLVERS['astar'], maze, start, goal)
+    cache.hit_rate
+
+Given a SearchStats (algorithms.stats), solve() and get() also count each
+lookup there as a cache hit or miss, next to the search counters.
+"""
+
+from collections import OrderedDict
+
+from maze.grid import Maze
+from algorithms.registry import SearchResult, get_solver
+from algorithms.stats import SearchStats
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# Rough bookkeeping cost of one entry (key, SearchResult, dict slots) and of
+# one suffix index slot, added to the path bytes when checking max_bytes
+ENTRY_OVERHEAD = 400
+SUFFIX_SLOT_BYTES = 100
+
+
+class PathCache:
+    """Size- and byte-bounded LRU of SearchResults, see the module docstring.
+
+    hits counts queries answered by an exact entry, subpath_hits those
+    answered from a suffix of an optimal path, misses those that needed a
+    search. evictions counts entries dropped to stay within max_entries and
+    max_bytes (None for no byte limit).
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (SearchResult, bytes), least recently used first
+        self.nbytes = 0
+        # (solver name, fingerprint, goal index) -> {cell index: (key, position in path)}
+        self._suffixes = {}
+        self.hits = self.subpath_hits = self.misses = self.evictions = 0
+
+    def solve(self, solver, maze, start, goal, stats=None, workspace=None):
+        """Answer from the cache if possible, otherwise solver.solve() and store the result.
+
+        The lookup is counted in stats (a new one if None, kept by a result
+        that needed a search).
+        """
+        solver = get_solver(solver)
+        grid = Maze.coerce(maze)
+        if stats is None:
+            stats = SearchStats()
+        result = self.get(solver, grid, start, goal, stats=stats)
+        if result is None:
+            result = solver.solve(grid, start, goal, stats, workspace)
+            self.put(solver, grid, start, goal, result)
+        return result
+
+    def get(self, solver, maze, start, goal, subpaths=True, stats=None):
+        """The cached SearchResult for a query, or None (a miss) if there is none.
+
+        With subpaths=False only an entry stored for exactly this query
+        counts. The hit or miss is also counted in stats, if given.
+        """
+        solver = get_solver(solver)
+        grid = Maze.coerce(maze)
+        fingerprint, start_index, goal_index = self._locate(grid, start, goal)
+        key = (solver.name, fingerprint, start_index, goal_index)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            if stats is not None:
+                stats.record(cache_hits=1)
+            return entry[0]
+
+        if subpaths and solver.optimal:
+            located = self._suffixes.get((solver.name, fingerprint, goal_index), {}).get(start_index)
+            if located is not None:
+                source_key, position = located
+                self.entries.move_to_end(source_key)
+                self.subpath_hits += 1
+                if stats is not None:
+                    stats.record(cache_hits=1)
+                return _suffix(self.entries[source_key][0], position, grid)
+
+        self.misses += 1
+        if stats is not None:
+            stats.record(cache_misses=1)
+        return None
+
+    def put(self, solver, maze, start, goal, result):
+        """Store a SearchResult for a query, evicting least recently used entries as needed"""
+        solver = get_solver(solver)
+        grid = Maze.coerce(maze)
+        fingerprint, start_index, goal_index = self._locate(grid, start, goal)
+        key = (solver.name, fingerprint, start_index, goal_index)
+        if key in self.entries:
+            self._remove(key)
+
+        size = ENTRY_OVERHEAD + result.path.itemsize * len(result.path)
+        if solver.optimal and result.found:
+            suffixes = self._suffixes.setdefault((solver.name, fingerprint, goal_index), {})
+            for position, cell in enumerate(result.path):
+                suffixes[cell] = (key, position)
+            size += SUFFIX_SLOT_BYTES * len(result.path)
+        self.entries[key] = (result, size)
+        self.nbytes += size
+
+        while len(self.entries) > self.max_entries or (
+                self.max_bytes is not None and self.nbytes > self.max_bytes and len(self.entries) > 1):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self._suffixes.clear()
+        self.nbytes = 0
+
+    def _remove(self, key):
+        result, size = self.entries.pop(key)
+        self.nbytes -= size
+        name, fingerprint, _, goal_index = key
+        suffixes = self._suffixes.get((name, fingerprint, goal_index))
+        if suffixes is None:
+            return
+        for cell in result.path:
+            if suffixes.get(cell, (None,))[0] == key:
+                del suffixes[cell]
+        if not suffixes:
+            del self._suffixes[name, fingerprint, goal_index]
+
+    @staticmethod
+    def _locate(grid, start, goal):
+        fingerprint = grid.derived("fingerprint", Maze.fingerprint)
+        return fingerprint, start[0] * grid.width + start[1], goal[0] * grid.width + goal[1]
+
+    @property
+    def hit_rate(self):
+        """Share of lookups answered without a search, exact and subpath hits together"""
+        lookups = self.hits + self.subpath_hits + self.misses
+        return (self.hits + self.subpath_hits) / lookups if lookups else 0.0
+
+    def as_dict(self):
+        return {
+            'entries': len(self.entries),
+            'bytes': self.nbytes,
+            'hits': self.hits,
+            'subpath_hits': self.subpath_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate,
+        }
+
+    def __repr__(self):
+        return (f"PathCache({len(self.entries)} entries, hits={self.hits}, "
+                f"subpath_hits={self.subpath_hits}, misses={self.misses}, hit_rate={self.hit_rate:.2f})")
+
+
+def _suffix(result, position, grid):
+    """SearchResult for the tail of result's path from position on"""
+    path = result.path[position:]
+    costs = grid.costs
+    cost = sum(costs[cell] for cell in path[1:]) if costs is not None else None
+    return SearchResult(result.algorithm, path, result.width, 0.0, None, cost)
@@ -0,0 +1,241 @@
+"""
+Solver registry and the common result record
+
+Every solver is registered under a short name (used by solve.py and
+solve_many) and a display label (used by main.py and the analyzer), with a
+find_path function following one protocol:
+
+    find_path(maze, start, goal, stats=None, workspace=None) -> list of (row, col), or None
+
+Solver.solve() wraps a call in a SearchResult, so callers never need to know
+which tuple shape the underlying algorithm function returns. To plug in a new
+engine, write a find_path function and register it, either directly or by
+its 'module:function' name so that its module is only imported once the
+solver is first called:
+
+    register('my-engine', 'My Engine', my_find_path)
+    register('my-engine', 'My Engine', 'my_package.engine:my_find_path')
+
+after which main.py, solve.py and AlgorithmAnalyzer(algorithms=[...]) can all
+run and benchmark it. find_path functions must be module-level so that
+solvers can be sent to the analyzer's worker processes. workspace is an
+algorithms.workspace.SearchWorkspace to reuse across queries on one maze; it
+is only passed when the caller gives one, so find_path functions that do not
+take it still work.
+
+Solvers registered with optimal=True promise shortest paths (fewest moves,
+or cheapest over a cost layer for the weighted ones); algorithms.path_cache
+relies on this to answer queries from suffixes of cached paths.
+"""
+
+import time
+from array import array
+from importlib import import_module
+
+from maze.grid import Maze
+from algorithms.stats import SearchStats
+
+
+class SearchResult:
+    """Outcome of one Solver.solve() call.
+
+    path holds the cells of the path as row-major indices (row * width + col)
+    in an array('i'), 4 bytes per cell instead of a tuple per cell; it is
+    empty when no path was found. coords() gives the usual (row, col) list.
+    cost is the number of moves, or on a maze with a cost layer the summed
+    cost of every cell entered after start. measurement optionally holds the
+    utils.benchmark.benchmark() record of a timed run of the same query, so
+    a cached result can stand in for the whole measurement.
+    """
+
+    __slots__ = ("algorithm", "path", "width", "cost", "expansions", "elapsed", "stats", "measurement")
+
+    def __init__(self, algorithm, path, width, elapsed=0.0, stats=None, cost=None):
+        self.algorithm = algorithm
+        self.path = path
+        self.width = width
+        if cost is None:
+            cost = len(path) - 1 if path else 0  # Unit-cost moves
+        self.cost = cost
+        self.expansions = stats.expanded if stats is not None else None
+        self.elapsed = elapsed  # Seconds spent in find_path
+        self.stats = stats
+        self.measurement = None
+
+    @classmethod
+    def from_coords(cls, algorithm, coords, width, elapsed=0.0, stats=None, costs=None):
+        """Build from a (row, col) list; costs is the maze's cost layer, if any"""
+        path = array('i', [row * width + col for row, col in coords]) if coords else array('i')
+        cost = sum(costs[index] for index in path[1:]) if costs is not None else None
+        return cls(algorithm, path, width, elapsed, stats, cost)
+
+    @property
+    def found(self):
+        return len(self.path) > 0
+
+    def coords(self):
+        """The path as a list of (row, col) tuples, or None if no path was found"""
+        if not self.path:
+            return None
+        width = self.width
+        return [divmod(index, width) for index in self.path]
+
+    def as_dict(self):
+        return {
+            'algorithm': self.algorithm,
+            'path': self.coords(),
+            'cost': self.cost,
+            'expansions': self.expansions,
+            'elapsed': self.elapsed,
+            'stats': self.stats.as_dict() if self.stats is not None else None,
+        }
+
+    def __repr__(self):
+        return (f"SearchResult({self.algorithm}, found={self.found}, cost={self.cost}, "
+                f"expansions={self.expansions}, elapsed={self.elapsed:.6f})")
+
+
+class Solver:
+    """A registered search engine: name, display label, find_path function and optimality.
+
+    find_path may be given as a 'module:function' string, imported on first
+    use, so that registering an engine does not load it.
+    """
+
+    __slots__ = ("name", "label", "_find_path", "optimal")
+
+    def __init__(self, name, label, find_path, optimal=False):
+        self.name = name
+        self.label = label
+        self._find_path = find_path
+        self.optimal = optimal
+
+    @property
+    def find_path(self):
+        if isinstance(self._find_path, str):
+            module, function = self._find_path.split(':')
+            self._find_path = getattr(import_module(module), function)
+        return self._find_path
+
+    def solve(self, maze, start, goal, stats=None, workspace=None):
+        """Run one search and return a SearchResult; counters go into stats (a new one if None)"""
+        grid = Maze.coerce(maze)
+        if stats is None:
+            stats = SearchStats()
+        start_time = time.perf_counter()
+        path = self(grid, start, goal, stats, workspace)
+        elapsed = time.perf_counter() - start_time
+        return SearchResult.from_coords(self.name, path, grid.width, elapsed, stats, grid.costs)
+
+    def __call__(self, maze, start, goal, stats=None, workspace=None):
+        """find_path's path, or None without searching if start or goal is outside the maze"""
+        grid = Maze.coerce(maze)
+        if not (grid.in_bounds(*start) and grid.in_bounds(*goal)):
+            return None  # Flattened to row * width + col, it would alias another cell
+        if workspace is None:
+            return self.find_path(grid, start, goal, stats)
+        return self.find_path(grid, start, goal, stats, workspace)
+
+    def __repr__(self):
+        return f"Solver({self.name!r}, {self.label!r})"
+
+
+# Registered solvers by name, in registration order
+SOLVERS = {}
+
+
+def register(name, label, find_path, optimal=False):
+    """Add (or replace) a solver; returns the Solver"""
+    solver = SOLVERS[name] = Solver(name, label, find_path, optimal)
+    return solver
+
+
+def get_solver(key):
+    """Look up a solver by name or display label; Solver objects pass through"""
+    if isinstance(key, Solver):
+        return key
+    if key in SOLVERS:
+        return SOLVERS[key]
+    for solver in SOLVERS.values():
+        if solver.label == key:
+            return solver
+    raise ValueError(f"Unknown algorithm {key!r}, expected one of {sorted(SOLVERS)}")
+
+
+def solve(algorithm, maze, start, goal, stats=None, workspace=None):
+    """Solve one query with the named algorithm, returning a SearchResult"""
+    return get_solver(algorithm).solve(maze, start, goal, stats, workspace)
+
+
+# Adapters from each algorithm's own return shape to the find_path protocol;
+# each imports its engine on first call, so importing the registry stays cheap
+
+def bfs_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.bfs import bfs
+    return bfs(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def dfs_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.dfs import dfs
+    path, found, _ = dfs(maze, start, goal, stats=stats, workspace=workspace)
+    return path if found else None
+
+
+def astar_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.astar import astar
+    return astar(maze, start, goal, stats=stats, workspace=workspace)
+
+
+def annealing_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.annealing import simulated_annealing
+    return simulated_annealing(maze, start, goal, stats=stats, workspace=workspace)[0] or None
+
+
+def bidirectional_bfs_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.bidirectional import bidirectional_bfs
+    return bidirectional_bfs(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def bidirectional_astar_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.bidirectional import bidirectional_astar
+    return bidirectional_astar(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def dijkstra_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.weighted import dijkstra
+    return dijkstra(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def weighted_astar_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.weighted import weighted_astar
+    return weighted_astar(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def weighted_greedy_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.weighted import weighted_greedy
+    return weighted_greedy(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def ida_star_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.memory_bounded import ida_star
+    return ida_star(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+def sma_star_path(maze, start, goal, stats=None, workspace=None):
+    from algorithms.memory_bounded import sma_star
+    return sma_star(maze, start, goal, stats=stats, workspace=workspace)[0]
+
+
+register('bfs', 'BFS', bfs_path, optimal=True)
+register('dfs', 'DFS', dfs_path)
+register('astar', 'A*', astar_path, optimal=True)
+register('greedy', 'Greedy', 'algorithms.greedy:greedy')
+register('annealing', 'Simulated Annealing', annealing_path)
+register('bidirectional-bfs', 'Bidirectional BFS', bidirectional_bfs_path, optimal=True)
+register('bidirectional-astar', 'Bidirectional A*', bidirectional_astar_path, optimal=True)
+register('jps', 'JPS', 'algorithms.jps:jps', optimal=True)
+register('dijkstra', 'Dijkstra', dijkstra_path, optimal=True)
+register('weighted-astar', 'Weighted A*', weighted_astar_path, optimal=True)
+register('weighted-greedy', 'Weighted Greedy', weighted_greedy_path)
+register('ida-star', 'IDA*', ida_star_path, optimal=True)
+register('sma-star', 'SMA*', sma_star_path)
@@ -0,0 +1,77 @@
+class SearchStats:
+    """Counters filled in by a solver when passed as stats=SearchStats().
+
+    expanded       nodes taken off the frontier and closed, the goal included
+                   (first expansion only)
+    reexpanded     expansions of a node that was already expanded in the same
+                   search (A* reopening under an inconsistent heuristic,
+                   annealing stepping back onto a cell it has already visited)
+    generated      neighbours produced by expansions, whether or not they
+                   were new
+    pushes, pops   frontier insertions and removals, including stale heap
+                   entries that are popped and skipped
+    peak_frontier  largest frontier (queue, stack or heap) seen
+    budget         largest budget given to a memory- or time-bounded search
+                   (sma_star's node_budget, ida_star's max_expansions)
+    cutoffs        searches that ended without a path because they ran out
+                   of budget, so the goal may still be reachable
+    cache_hits     queries answered by an algorithms.path_cache.PathCache
+                   without a search, suffixes of cached paths included
+    cache_misses   queries the PathCache had to pass on to the solver
+
+    Solvers keep the counters in locals and add them here once, on return.
+    Whatever can be recovered afterwards from the search's own structures
+    (pushes from pops plus what is left in the frontier, generated from the
+    expanded cells' neighbour masks) is only worked out when stats is given,
+    so with stats=None the hot loop pays at most one branch per pop.
+    Counts accumulate over calls (peak_frontier and budget keep the
+    maximum), so one object can total a batch of queries; call reset() to
+    start over.
+    """
+
+    __slots__ = ("expanded", "generated", "peak_frontier", "pushes", "pops", "reexpanded", "budget", "cutoffs",
+                 "cache_hits", "cache_misses")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.expanded = 0
+        self.generated = 0
+        self.peak_frontier = 0
+        self.pushes = 0
+        self.pops = 0
+        self.reexpanded = 0
+        self.budget = 0
+        self.cutoffs = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def record(self, expanded=0, generated=0, peak_frontier=0, pushes=0, pops=0, reexpanded=0,
+               budget=0, cutoffs=0, cache_hits=0, cache_misses=0):
+        """Add one search's counts"""
+        self.expanded += expanded
+        self.generated += generated
+        self.pushes += pushes
+        self.pops += pops
+        self.reexpanded += reexpanded
+        self.cutoffs += cutoffs
+        self.cache_hits += cache_hits
+        self.cache_misses += cache_misses
+        if peak_frontier > self.peak_frontier:
+            self.peak_frontier = peak_frontier
+        if budget > self.budget:
+            self.budget = budget
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"SearchStats({fields})"
+
+
+def count_generated(adjacency, nodes):
+    """Neighbours generated by expanding each of nodes (cell indices) once"""
+    masks, steps = adjacency.masks, adjacency.steps
+    return sum(len(steps[masks[node]]) for node in nodes)
@@ -0,0 +1,230 @@
+from maze.grid import Maze
+from algorithms.stats import count_generated
+from algorithms.workspace import SearchWorkspace
+
+
+class BucketQueue:
+    """Dial's bucket priority queue for small non-negative integer priorities.
+
+    Valid while priorities are pushed in a window: every pushed priority must
+    lie in [last popped, last popped + span). Dijkstra with edge costs of at
+    most C satisfies this with span C + 1, so push and pop are O(1) apart
+    from skipping empty buckets, which costs at most span steps per distinct
+    priority. Items with equal priority come out last in, first out.
+    """
+
+    __slots__ = ("buckets", "span", "current", "size")
+
+    def __init__(self, span):
+        self.buckets = [[] for _ in range(span)]
+        self.span = span
+        self.current = 0  # Priority of the bucket pop() looks at first
+        self.size = 0
+
+    def push(self, priority, item):
+        self.buckets[priority % self.span].append(item)
+        self.size += 1
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority"""
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        buckets, span = self.buckets, self.span
+        current = self.current
+        while not buckets[current % span]:
+            current += 1
+        self.current = current
+        self.size -= 1
+        return current, buckets[current % span].pop()
+
+    def __len__(self):
+        return self.size
+
+
+def dijkstra(maze, start, goal, stats=None, workspace=None):
+    """Cheapest path over the maze's cost layer (unit costs without one).
+
+    Returns (path, cost) like bfs(), with cost the sum of the costs of every
+    cell entered after start, or (None, 0). Costs are uint8, so the open set
+    is a BucketQueue with one bucket per possible distance modulo 256. Like
+    the unit-cost solvers it keeps g scores, parents and closed marks in the
+    arrays of workspace (an algorithms.workspace.SearchWorkspace) if given.
+    """
+    grid = Maze.coerce(maze)
+    return _weighted_search(grid, start, goal, 0, stats, workspace)
+
+
+def weighted_astar(maze, start, goal, stats=None, workspace=None):
+    """A* over the maze's cost layer, returns (path, cost) like dijkstra().
+
+    The heuristic is the Manhattan distance times the cheapest cell cost,
+    which never overestimates and is consistent, so the result is a cheapest
+    path and f values only grow by at most the largest cell cost plus the
+    cheapest per expansion; the open set is a BucketQueue over f.
+    """
+    grid = Maze.coerce(maze)
+    min_cost, _ = grid.derived("cost_range", _cost_range)
+    return _weighted_search(grid, start, goal, min_cost, stats, workspace)
+
+
+def weighted_greedy(maze, start, goal, stats=None, workspace=None):
+    """Greedy best-first search that also weighs the cost of the next cell.
+
+    Candidates are ordered by the estimated cost from the cell to goal (the
+    Manhattan distance times the cheapest cell cost) plus the cost of
+    stepping onto the cell, so slow cells next to the frontier are avoided
+    when a cheap one is about as close. Like greedy() it is fast but not
+    optimal. Returns (path, cost) like dijkstra(). Its priorities can fall
+    as well as rise, so it uses a binary heap rather than a BucketQueue.
+    """
+    from heapq import heappush, heappop
+
+    grid = Maze.coerce(maze)
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    costs = grid.costs
+    min_cost, _ = grid.derived("cost_range", _cost_range)
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal_row, goal_col = goal
+
+    open_heap = [(0, start_index)]
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    closed = reached + 1
+    stamps, came_from = workspace.stamps, workspace.parent
+    stamps[start_index] = reached
+    came_from[start_index] = -1
+    expanded = 0
+    counting = stats is not None
+    if counting:
+        log = workspace.queue  # Closed cells in order, to count generated from
+    pops = peak_frontier = 0
+    found = False
+    while open_heap:
+        current = heappop(open_heap)[1]
+        if counting:
+            pops += 1
+            if len(open_heap) >= peak_frontier:
+                peak_frontier = len(open_heap) + 1  # Its size before the pop
+            if stamps[current] != closed:
+                log[expanded] = current
+        if stamps[current] == closed:
+            continue
+        stamps[current] = closed
+        expanded += 1
+        if current == goal_index:
+            found = True
+            break
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            if stamps[neighbor] >= reached:
+                continue
+            stamps[neighbor] = reached
+            came_from[neighbor] = current
+            row, col = divmod(neighbor, width)
+            h = (abs(row - goal_row) + abs(col - goal_col)) * min_cost
+            heappush(open_heap, (h + (costs[neighbor] if costs is not None else 1), neighbor))
+
+    if counting:
+        generated = count_generated(adjacency, log[:expanded - found])  # The goal is closed, not expanded
+        stats.record(expanded, generated, peak_frontier, pops + len(open_heap), pops)
+    if not found:
+        return None, 0
+    return _path_and_cost(grid, came_from, goal_index)
+
+
+def _weighted_search(grid, start, goal, heuristic_scale, stats, workspace):
+    # Dijkstra when heuristic_scale is 0, A* with a scaled Manhattan heuristic otherwise
+    adjacency = grid.adjacency()
+    masks, steps, width = adjacency.masks, adjacency.steps, grid.width
+    costs = grid.costs
+    _, max_cost = grid.derived("cost_range", _cost_range)
+    start_index = start[0] * width + start[1]
+    goal_index = goal[0] * width + goal[1]
+    goal_row, goal_col = goal
+
+    def h(index):
+        row, col = divmod(index, width)
+        return (abs(row - goal_row) + abs(col - goal_col)) * heuristic_scale
+
+    # f grows by at most max_cost + heuristic_scale from a node to its neighbour
+    open_set = BucketQueue(max_cost + heuristic_scale + 1)
+    start_f = h(start_index)
+    open_set.current = start_f
+    open_set.push(start_f, start_index)
+    workspace = SearchWorkspace.for_search(grid, workspace)
+    reached = workspace.begin()
+    closed = reached + 1
+    # No path is dearer than max_cost per cell: past 2**31 - 1 the g scores
+    # need 64 bits
+    stamps, came_from = workspace.stamps, workspace.parent
+    g_score = workspace.scores_up_to(max_cost * grid.size)
+    stamps[start_index] = reached
+    came_from[start_index] = -1
+    g_score[start_index] = 0
+    expanded = 0
+    counting = stats is not None
+    if counting:
+        log = workspace.queue  # Closed cells in order, to count generated from
+    pops = peak_frontier = 0
+    found = False
+    while open_set.size:
+        f, current = open_set.pop()
+        if counting:
+            pops += 1
+            if open_set.size >= peak_frontier:
+                peak_frontier = open_set.size + 1  # Its size before the pop
+            if stamps[current] != closed:
+                log[expanded] = current
+        if stamps[current] == closed:
+            continue  # Stale entry; with a consistent heuristic the first pop is the cheapest
+        stamps[current] = closed
+        expanded += 1
+        if current == goal_index:
+            found = True
+            break
+        g = g_score[current]
+        for step in steps[masks[current]]:
+            neighbor = current + step
+            mark = stamps[neighbor]
+            if mark == closed:
+                continue
+            tentative_g_score = g + (costs[neighbor] if costs is not None else 1)
+            if mark != reached or tentative_g_score < g_score[neighbor]:
+                stamps[neighbor] = reached
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                open_set.push(tentative_g_score + h(neighbor), neighbor)
+
+    if counting:
+        generated = count_generated(adjacency, log[:expanded - found])  # The goal is closed, not expanded
+        stats.record(expanded, generated, peak_frontier, pops + open_set.size, pops)
+    if not found:
+        return None, 0
+    return _path_and_cost(grid, came_from, goal_index)
+
+
+def _cost_range(grid):
+    # (cheapest, dearest) cost of any free cell, cached per Maze version. The
+    # cheapest cost scales the heuristic, the dearest sizes the BucketQueue.
+    if grid.costs is None:
+        return 1, 1
+    free_costs = [cost for cell, cost in zip(grid.cells, grid.costs) if cell]
+    return (min(free_costs), max(free_costs)) if free_costs else (1, 1)
+
+
+def _path_and_cost(grid, came_from, goal_index):
+    # came_from is a parent array in which the start holds -1
+    width, costs = grid.width, grid.costs
+    path = []
+    cost = 0
+    current = goal_index
+    while current != -1:
+        path.append(divmod(current, width))
+        previous = came_from[current]
+        if previous != -1:
+            cost += costs[current] if costs is not None else 1
+        current = previous
+    path.reverse()
+    return path, cost
@@ -0,0 +1,124 @@
+"""
+Reusable per-cell search buffers, so repeated queries on one maze allocate nothing
+
+Every solver keeps its per-query state (reached and expanded marks, parents,
+g scores, a queue) in flat arrays indexed by cell (row * width + col).
+Without a workspace those arrays are allocated for each call and freed on
+return. A SearchWorkspace keeps them between calls instead:
+
+    workspace = SearchWorkspace(maze)
+    for start, goal in queries:
+        path = astar(maze, start, goal, workspace=workspace)
+
+Nothing is cleared between queries. Each search starts with begin(), which
+moves the workspace to a new generation: a cell counts as reached in the
+current search only if its stamp equals the generation (reached) or the
+generation + 1 (expanded), and the values kept for it in parent, scores and
+queue are only meaningful then. Older stamps are simply out of date, so
+starting a search costs O(1) whatever the size of the maze. Only when the
+32-bit generation counter runs out are the stamps zeroed.
+
+A workspace serves one search at a time and is not thread-safe; give each
+thread (and each of a process pool's workers) its own. Searches from both
+ends use the workspace's mirror, a second workspace for the backward side.
+"""
+
+from array import array
+
+from maze.grid import Maze
+
+# Stamps are array('I') entries; generations are even, leaving generation + 1
+# for the expanded mark
+_LAST_GENERATION = 2 ** 32 - 2
+
+# Largest value an array('i') score holds
+_LARGEST_SCORE = 2 ** 31 - 1
+
+
+class SearchWorkspace:
+    """Preallocated search buffers for mazes of one shape, reset by generation.
+
+    stamps (array('I')) marks cells reached or expanded in the current
+    search, see begin(). parent and scores (array('i')) and queue (an
+    array('i') used as a FIFO queue or a log of expanded cells) are
+    allocated the first time a solver asks for them, so a workspace only
+    holds the buffers its solvers use; see scores_up_to() for scores that
+    may not fit in 32 bits.
+    """
+
+    __slots__ = ("height", "width", "size", "generation", "stamps", "_parent", "_scores", "_wide_scores",
+                 "_queue", "_mirror")
+
+    def __init__(self, maze):
+        grid = Maze.coerce(maze)
+        self._allocate(grid.height, grid.width)
+
+    def _allocate(self, height, width):
+        self.height, self.width, self.size = height, width, height * width
+        self.generation = 0
+        self.stamps = array('I', [0]) * self.size
+        self._parent = self._scores = self._wide_scores = self._queue = self._mirror = None
+
+    @classmethod
+    def for_search(cls, grid, workspace=None):
+        """workspace itself if given, checked against grid, otherwise a new one for a single search"""
+        if workspace is None:
+            return cls(grid)
+        if (grid.height, grid.width) != (workspace.height, workspace.width):
+            raise ValueError(f"Workspace is for {workspace.height}x{workspace.width} mazes, "
+                             f"got a {grid.height}x{grid.width} maze")
+        return workspace
+
+    def begin(self):
+        """Start a new search: returns the generation, and every cell counts as unreached"""
+        if self.generation >= _LAST_GENERATION:
+            # Zeroed in place: a search may still hold the stamps array
+            self.stamps[:] = array('I', [0]) * self.size
+            self.generation = 0
+        self.generation += 2
+        return self.generation
+
+    @property
+    def parent(self):
+        if self._parent is None:
+            self._parent = array('i', [0]) * self.size
+        return self._parent
+
+    @property
+    def scores(self):
+        if self._scores is None:
+            self._scores = array('i', [0]) * self.size
+        return self._scores
+
+    def scores_up_to(self, largest):
+        """scores if it holds every value up to largest, otherwise a 64-bit array('q') of the same length"""
+        if largest <= _LARGEST_SCORE:
+            return self.scores
+        if self._wide_scores is None:
+            self._wide_scores = array('q', [0]) * self.size
+        return self._wide_scores
+
+    @property
+    def queue(self):
+        if self._queue is None:
+            self._queue = array('i', [0]) * self.size
+        return self._queue
+
+    @property
+    def mirror(self):
+        """A second workspace of the same shape, for the backward half of a bidirectional search"""
+        if self._mirror is None:
+            self._mirror = SearchWorkspace.__new__(SearchWorkspace)
+            self._mirror._allocate(self.height, self.width)
+        return self._mirror
+
+    @property
+    def nbytes(self):
+        """Bytes held in buffers, the mirror's included"""
+        held = sum(len(buffer) * buffer.itemsize
+                   for buffer in (self.stamps, self._parent, self._scores, self._wide_scores, self._queue)
+                   if buffer is not None)
+        return held + (self._mirror.nbytes if self._mirror is not None else 0)
+
+    def __repr__(self):
+        return f"SearchWorkspace({self.height}x{self.width}, generation={self.generation}, nbytes={self.nbytes})"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Simulated annealing tuning benchmark
+
+Annealing is randomised, so its quality is a success rate rather than a
+yes/no. For each configuration below this runs algorithms.annealing's
+simulated_annealing over many seeds on the bundled test cases and on
+generated mazes, and reports:
+
+- success: share of (query, seed) runs that reached goal
+- ms/query: median time per run, failed runs included (the time a caller
+  actually waits)
+- ms/solution: total time divided by solved runs, the expected cost of one
+  solution when retrying until success
+- stretch: mean solved path length over the BFS shortest path
+
+    python benchmarks/annealing.py --seeds 20 --kinds braided backtracker --size 41
+"""
+
+import sys
+import os
+import argparse
+import statistics
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Maze
+from maze.maze_map import MAZE
+from maze.test_cases import TEST_CASES
+from maze.generator import GENERATORS, generate, solvable_queries
+from algorithms.annealing import simulated_annealing
+from algorithms.bfs import bfs
+
+# name -> keyword arguments for simulated_annealing; "single chain" has no
+# reheating, restarts or revisit penalty and stands in for the old single
+# random walk
+CONFIGURATIONS = {
+    'single chain': dict(chains=1, reheat_after=10 ** 9, restart_after=10 ** 9, revisit_penalty=0),
+    'single + reheat': dict(chains=1, revisit_penalty=0),
+    'no revisit cost': dict(revisit_penalty=0),
+    'defaults': dict(),
+    '16 chains': dict(chains=16),
+    'long chains': dict(max_iterations=5000),
+    'slow cooling': dict(cooling_rate=0.999),
+    'hot start': dict(initial_temp=5.0),
+}
+
+
+def run_configuration(mazes, seeds, options, workers=None):
+    """(success rate, median seconds per run, seconds per solution, mean stretch) over every maze, query and seed"""
+    times, stretches = [], []
+    solved = 0
+    for grid, queries in mazes:
+        for start, goal in queries:
+            shortest = bfs(grid, start, goal)[1]
+            for seed in range(seeds):
+                start_time = time.perf_counter()
+                path, steps = simulated_annealing(grid, start, goal, seed=seed, workers=workers, **options)
+                times.append(time.perf_counter() - start_time)
+                if path:
+                    solved += 1
+                    stretches.append(steps / shortest if shortest else 1.0)
+    runs = len(times)
+    per_solution = sum(times) / solved if solved else float('inf')
+    stretch = statistics.mean(stretches) if stretches else float('nan')
+    return solved / runs, statistics.median(times), per_solution, stretch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Success rate and time to solution of simulated annealing")
+    parser.add_argument('--seeds', type=int, default=10, help="Runs per query")
+    parser.add_argument('--kinds', nargs='+', choices=sorted(GENERATORS), default=['braided', 'backtracker'])
+    parser.add_argument('--size', type=int, default=41)
+    parser.add_argument('--queries', type=int, default=5, help="Solvable queries per generated maze")
+    parser.add_argument('--workers', type=int, default=None, help="Run each query's chains in a process pool")
+    parser.add_argument('--configs', nargs='+', choices=list(CONFIGURATIONS), default=list(CONFIGURATIONS))
+    args = parser.parse_args()
+
+    bundled = Maze.from_rows(MAZE)
+    suites = [("bundled 15x15", [(bundled, [case for case in TEST_CASES if bfs(bundled, *case)[0]])])]
+    for kind in args.kinds:
+        grid = generate(kind, args.size, args.size, seed=0)
+        suites.append((f"{kind} {args.size}x{args.size}", [(grid, solvable_queries(grid, args.queries, seed=0))]))
+
+    for suite_name, mazes in suites:
+        print(f"\n{suite_name}, {args.seeds} seeds per query")
+        print(f"{'configuration':<18} {'success':>8} {'ms/query':>9} {'ms/solution':>12} {'stretch':>8}")
+        print("-" * 59)
+        for name in args.configs:
+            success, median_time, per_solution, stretch = run_configuration(mazes, args.seeds, CONFIGURATIONS[name], args.workers)
+            print(f"{name:<18} {success:>7.0%} {median_time * 1000:>9.2f} "
+                  f"{per_solution * 1000:>12.2f} {stretch:>8.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
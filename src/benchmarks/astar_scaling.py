@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+A* scaling benchmark
+
+Runs A* corner to corner on serpentine mazes of increasing size (the same
+corridor layout as rows 5-13 of the bundled maze, repeated) and reports the
+number of expanded nodes together with the time spent per expanded node.
+With the heap-based open set the time per expansion should stay roughly
+flat as the grid grows, i.e. total time is linear in expanded nodes.
+"""
+
+import sys
+import os
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algorithms.astar import astar_search
+
+
+def serpentine_maze(size):
+    """Build a size x size maze of horizontal corridors joined at alternating ends"""
+    maze = [["#"] * size for _ in range(size)]
+    for row in range(1, size - 1, 2):
+        for col in range(1, size - 1):
+            maze[row][col] = "."
+    for i, row in enumerate(range(2, size - 2, 2)):
+        col = size - 2 if i % 2 == 0 else 1
+        maze[row][col] = "."
+    return maze
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [51, 101, 201, 401, 801]
+
+    print(f"{'size':>6} {'expanded':>10} {'time (ms)':>10} {'us/node':>8}")
+    print("-" * 38)
+    for size in sizes:
+        maze = serpentine_maze(size)
+        start = (1, 1)
+        last_row = size - 2 if (size - 2) % 2 == 1 else size - 3
+        goal = (last_row, size - 2 if ((last_row - 1) // 2) % 2 == 0 else 1)
+
+        start_time = time.perf_counter()
+        path, expanded = astar_search(maze, start, goal)
+        elapsed = time.perf_counter() - start_time
+
+        if path is None:
+            print(f"{size:>6} no path found")
+            continue
+        print(f"{size:>6} {expanded:>10,} {elapsed * 1000:>10.1f} {elapsed / expanded * 1e6:>8.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
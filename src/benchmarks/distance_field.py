@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Distance field benchmark
+
+Compares the per-cell BFS loops (algorithms.bfs.bfs searching for the far
+corner, and the array-backed algorithms.bfs.bfs_tree) against the
+frontier-at-a-time NumPy engine (algorithms.distance_field.distance_field)
+when computing distances from one corner of an open room to every cell.
+"""
+
+import sys
+import os
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Maze
+from algorithms.bfs import bfs, bfs_tree
+from algorithms.distance_field import distance_field
+
+
+def open_room(size):
+    """size x size room of free cells surrounded by a wall"""
+    grid = Maze(size, size, bytearray([1]) * (size * size))
+    for i in range(size):
+        grid.cells[i] = grid.cells[(size - 1) * size + i] = 0
+        grid.cells[i * size] = grid.cells[i * size + size - 1] = 0
+    return grid
+
+
+def best_of(repeats, func, *args):
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 300, 1000, 2000]
+
+    print(f"{'size':>6} {'bfs (ms)':>10} {'bfs_tree (ms)':>14} {'numpy (ms)':>11} {'speedup':>8}")
+    print("-" * 53)
+    for size in sizes:
+        grid = open_room(size)
+        grid.adjacency()  # Build the neighbour index outside the timed region
+        start, corner = (1, 1), (size - 2, size - 2)
+
+        bfs_time = best_of(3, bfs, grid, start, corner)
+        tree_time = best_of(3, bfs_tree, grid, start)
+        field_time = best_of(3, distance_field, grid, start)
+        print(f"{size:>6} {bfs_time * 1000:>10.1f} {tree_time * 1000:>14.1f} "
+              f"{field_time * 1000:>11.1f} {bfs_time / field_time:>7.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Many-agent routing benchmark
+
+Routes a growing number of agents, each heading to one of a few shared goal
+cells, to their goals in a generated maze two ways:
+
+- per-agent A*: one algorithms.astar.astar_search call per agent
+- flow fields: one algorithms.flow_field.FlowField per distinct goal, built
+  by a FlowFieldScheduler, then every agent walks its goal's field
+
+and reports total time and time per agent for each, plus the scheduler's
+cache size. Flow fields cost a whole-maze search per goal up front but each
+agent is then answered by lookups, so they win once agents outnumber goals
+by enough.
+
+    python benchmarks/flow_field.py --size 201 --goals 4 --agents 10 100 1000
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.generator import GENERATORS, generate, largest_component
+from algorithms.astar import astar_search
+from algorithms.flow_field import FlowFieldScheduler
+
+
+def place_agents(maze, agents, goals, seed):
+    """agents (start, goal) pairs with starts and goals drawn from the largest open region"""
+    rng = random.Random(seed)
+    cells = [divmod(index, maze.width) for index in largest_component(maze)]
+    goal_cells = rng.sample(cells, goals)
+    return [(rng.choice(cells), rng.choice(goal_cells)) for _ in range(agents)]
+
+
+def route_astar(maze, pairs):
+    for start, goal in pairs:
+        astar_search(maze, start, goal)
+
+
+def route_flow_fields(maze, pairs):
+    scheduler = FlowFieldScheduler(maze)
+    for start, goal in pairs:
+        scheduler.path(start, goal)
+    return scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-agent A* vs shared flow fields")
+    parser.add_argument('--kind', choices=sorted(GENERATORS), default='braided')
+    parser.add_argument('--size', type=int, default=201)
+    parser.add_argument('--goals', type=int, default=4)
+    parser.add_argument('--agents', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    maze = generate(args.kind, args.size, args.size, seed=args.seed)
+    maze.adjacency()  # Build the shared neighbour index outside the timed region
+    print(f"{args.kind} {args.size}x{args.size}, {args.goals} shared goals")
+    print(f"{'agents':>7} {'A* ms':>9} {'A* us/agent':>12} {'field ms':>9} "
+          f"{'field us/agent':>15} {'speedup':>8} {'cache KB':>9}")
+    print("-" * 75)
+    for agents in args.agents:
+        pairs = place_agents(maze, agents, args.goals, args.seed)
+
+        start_time = time.perf_counter()
+        route_astar(maze, pairs)
+        astar_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        scheduler = route_flow_fields(maze, pairs)
+        field_time = time.perf_counter() - start_time
+
+        print(f"{agents:>7} {astar_time * 1000:>9.1f} {astar_time / agents * 1e6:>12.1f} "
+              f"{field_time * 1000:>9.1f} {field_time / agents * 1e6:>15.1f} "
+              f"{astar_time / field_time:>7.1f}x {scheduler.nbytes / 1024:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
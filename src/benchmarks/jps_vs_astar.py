@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Jump Point Search vs A* benchmark
+
+Runs plain A* and 4-connected JPS on the bundled maze test cases and on
+generated open-room maps (large rooms with scattered rectangular pillars),
+reporting expanded nodes and time for each. Both engines' per-maze indices
+(A*'s neighbour masks, JPS's jump table) are built before timing; the jump
+table build time is reported separately since it is paid once per maze.
+"""
+
+import sys
+import os
+import random
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Maze
+from maze.maze_map import MAZE
+from maze.test_cases import TEST_CASES
+from algorithms.astar import astar_search
+from algorithms.jps import jps_search, JumpTable
+
+
+def open_rooms_map(size, pillars, seed=0):
+    """size x size walled room with random rectangular pillars"""
+    rng = random.Random(seed)
+    grid = Maze(size, size, bytearray([1]) * (size * size))
+    for i in range(size):
+        grid.cells[i] = grid.cells[(size - 1) * size + i] = 0
+        grid.cells[i * size] = grid.cells[i * size + size - 1] = 0
+    for _ in range(pillars):
+        top, left = rng.randrange(2, size - 8), rng.randrange(2, size - 8)
+        for r in range(top, top + rng.randint(1, 6)):
+            for c in range(left, left + rng.randint(1, 6)):
+                grid.cells[r * size + c] = 0
+    grid.cells[size + 1] = grid.cells[(size - 2) * size + size - 2] = 1  # Keep the corners free
+    return grid
+
+
+def run(search, grid, queries):
+    expanded = 0
+    start_time = time.perf_counter()
+    for start, goal in queries:
+        expanded += search(grid, start, goal)[1]
+    return expanded, time.perf_counter() - start_time
+
+
+def main():
+    grid = Maze.from_rows(MAZE)
+    cases = [("bundled 15x15 (10 queries)", grid, TEST_CASES)]
+    for size in (100, 300, 600):
+        cases.append((f"open rooms {size}x{size}", open_rooms_map(size, size // 4), [((1, 1), (size - 2, size - 2))]))
+
+    print(f"{'map':<28} {'A* nodes':>9} {'A* ms':>8} {'JPS nodes':>10} {'JPS ms':>8} {'table ms':>9}")
+    print("-" * 77)
+    for name, grid, queries in cases:
+        grid.adjacency()
+        start_time = time.perf_counter()
+        grid.derived("jump_table", JumpTable)
+        table_time = time.perf_counter() - start_time
+
+        astar_nodes, astar_time = run(astar_search, grid, queries)
+        jps_nodes, jps_time = run(jps_search, grid, queries)
+        print(f"{name:<28} {astar_nodes:>9,} {astar_time * 1000:>8.1f} {jps_nodes:>10,} "
+              f"{jps_time * 1000:>8.1f} {table_time * 1000:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Memory-bounded search benchmark: A* vs IDA* vs SMA*
+
+For each generated maze size this runs A*, IDA* and SMA* (at node budgets
+set as fractions of the nodes A* held) on the same solvable queries and
+reports, summed over the queries:
+
+- ms: time per query
+- peak KiB: largest traced allocation of one query (tracemalloc)
+- held: largest number of nodes held at once (A*: cells given a g score,
+  IDA*: its transposition table and path, SMA*: nodes within the budget)
+- expanded / reexpanded: first and repeated expansions
+- solved / optimal: queries with a path, and with a shortest one
+
+A memory cap pays off where reexpanded stays small next to expanded; IDA*
+is capped at --max-expansions per query and counts as unsolved past it.
+
+    python benchmarks/memory_bounded.py --kinds backtracker rooms --sizes 21 41 61
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.generator import GENERATORS, generate, solvable_queries
+from algorithms.astar import astar
+from algorithms.bfs import bfs
+from algorithms.memory_bounded import ida_star, sma_star
+from algorithms.stats import SearchStats
+from utils.benchmark import measure_memory
+
+# SMA* budgets, as fractions of the most nodes A* held on any of the queries
+BUDGET_FRACTIONS = (1.0, 0.5, 0.25, 0.1)
+
+
+def run(search, maze, queries):
+    """Time one engine over queries: (stats, seconds, peak traced bytes, held, paths)"""
+    stats = SearchStats()
+    paths, held = [], 0
+    seconds = peak = 0.0
+    for start, goal in queries:
+        start_time = time.perf_counter()
+        path, nodes = search(maze, start, goal, stats)
+        seconds += time.perf_counter() - start_time
+        peak = max(peak, measure_memory(search, (maze, start, goal, None))[2])
+        paths.append(path)
+        held = max(held, nodes)
+    return stats, seconds, peak, held, paths
+
+
+def astar_held(maze, start, goal, stats):
+    # A* holds a g score for every cell it pushed
+    own = SearchStats()
+    path = astar(maze, start, goal, stats=own)
+    if stats is not None:
+        stats.record(**own.as_dict())
+    return path, own.pushes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time and memory of A*, IDA* and SMA* per maze size")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[21, 41])
+    parser.add_argument('--kinds', nargs='+', choices=sorted(GENERATORS), default=['backtracker', 'rooms'])
+    parser.add_argument('--queries', type=int, default=5)
+    parser.add_argument('--max-expansions', type=int, default=500_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for kind in args.kinds:
+        for size in args.sizes:
+            maze = generate(kind, size, size, seed=args.seed)
+            queries = solvable_queries(maze, args.queries, seed=args.seed)
+            maze.adjacency()  # Build shared indices before timing
+            shortest = [bfs(maze, start, goal)[1] for start, goal in queries]
+
+            engines = [('A*', astar_held)]
+            engines.append(('IDA*', lambda m, s, g, stats: ida_star(
+                m, s, g, stats=stats, max_expansions=args.max_expansions)))
+            astar_nodes = max(astar_held(maze, start, goal, None)[1] for start, goal in queries)
+            for fraction in BUDGET_FRACTIONS:
+                budget = max(1, int(astar_nodes * fraction))
+                engines.append((f'SMA* {budget}', lambda m, s, g, stats, budget=budget: sma_star(
+                    m, s, g, budget, stats=stats)))
+
+            print(f"\n{kind} {size}x{size}, {len(queries)} queries")
+            print(f"{'engine':<12} {'ms':>9} {'peak KiB':>9} {'held':>7} {'expanded':>10} "
+                  f"{'reexpanded':>11} {'solved':>7} {'optimal':>8}")
+            print("-" * 80)
+            for name, search in engines:
+                stats, seconds, peak, held, paths = run(search, maze, queries)
+                solved = sum(path is not None for path in paths)
+                optimal = sum(path is not None and len(path) - 1 == steps for path, steps in zip(paths, shortest))
+                print(f"{name:<12} {seconds * 1000 / len(queries):>9.2f} {peak / 1024:>9.1f} "
+                      f"{held:>7} {stats.expanded:>10} {stats.reexpanded:>11} {solved:>7} {optimal:>8}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Size sweep over generated mazes
+
+For each maze kind in maze.generator and each size, generates a seeded maze
+and a set of solvable queries, then reports per algorithm the median time per
+query (untraced, see utils.benchmark) and the peak traced memory of one query
+batch. A final table gives each algorithm's growth exponent k from fitting
+time ~ cells^k between the smallest and largest size, so e.g. k ~ 1 means
+time grows linearly with the number of cells.
+
+    python benchmarks/scaling.py --sizes 51 101 201 401 --kinds kruskal rooms
+"""
+
+import sys
+import os
+import argparse
+import math
+import time
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.generator import GENERATORS, generate, solvable_queries
+from algorithms.registry import SOLVERS
+from utils.benchmark import time_runs, measure_memory, summarize
+
+# Every registered solver except simulated annealing, which is
+# iteration-capped and mostly fails on large mazes, so its time says nothing
+# about scaling, and IDA*, whose re-expansions grow exponentially with the
+# number of equal-cost routes (see benchmarks/memory_bounded.py)
+ALGORITHMS = {solver.label: solver.find_path for name, solver in SOLVERS.items()
+              if name not in ('annealing', 'ida-star')}
+
+
+def run_queries(solver, maze, queries):
+    for start, goal in queries:
+        solver(maze, start, goal)
+
+
+def sweep(kinds, sizes, queries, repeats, seed):
+    """Yield (kind, size, algorithm, seconds per query, peak bytes) rows"""
+    for kind in kinds:
+        for size in sizes:
+            start_time = time.perf_counter()
+            maze = generate(kind, size, size, seed=seed)
+            generated = time.perf_counter() - start_time
+            pairs = solvable_queries(maze, queries, seed=seed)
+            maze.adjacency()  # Build shared indices before timing
+            print(f"{kind} {size}x{size}: generated in {generated * 1000:.0f} ms, "
+                  f"{sum(maze.cells):,} free cells")
+            for name, solver in ALGORITHMS.items():
+                _, samples = time_runs(run_queries, (solver, maze, pairs), repeats, warmup=1)
+                _, _, peak = measure_memory(run_queries, (solver, maze, pairs))
+                yield kind, size, name, summarize(samples)['median'] / len(pairs), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep maze size per generator and algorithm")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[51, 101, 201, 401])
+    parser.add_argument('--kinds', nargs='+', choices=sorted(GENERATORS),
+                        default=['backtracker', 'kruskal', 'braided', 'rooms', 'obstacles'])
+    parser.add_argument('--queries', type=int, default=5, help="Solvable queries per maze")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'kind':<12} {'size':>6} {'algorithm':<18} {'ms/query':>10} {'peak KB':>10}")
+    print("-" * 60)
+    for row in sweep(args.kinds, args.sizes, args.queries, args.repeats, args.seed):
+        kind, size, name, seconds, peak = row
+        rows.append(row)
+        print(f"{kind:<12} {size:>6} {name:<18} {seconds * 1000:>10.2f} {peak / 1024:>10.1f}")
+
+    if len(args.sizes) < 2:
+        return 0
+    smallest, largest = min(args.sizes), max(args.sizes)
+    by_key = {(kind, size, name): (seconds, peak) for kind, size, name, seconds, peak in rows}
+    cell_ratio = math.log((largest / smallest) ** 2)
+    print(f"\nGrowth exponent k (time ~ cells^k, memory ~ cells^k) from {smallest} to {largest}")
+    print(f"{'kind':<12} {'algorithm':<18} {'time k':>8} {'memory k':>9}")
+    print("-" * 50)
+    for kind in args.kinds:
+        for name in ALGORITHMS:
+            (t0, m0), (t1, m1) = by_key[kind, smallest, name], by_key[kind, largest, name]
+            time_k = math.log(t1 / t0) / cell_ratio if t0 > 0 and t1 > 0 else float('nan')
+            memory_k = math.log(m1 / m0) / cell_ratio if m0 > 0 and m1 > 0 else float('nan')
+            print(f"{kind:<12} {name:<18} {time_k:>8.2f} {memory_k:>9.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
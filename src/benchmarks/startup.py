@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark
+
+Batch jobs run many short-lived solver processes, so the cost of starting
+Python, importing main and solving one query matters as much as solver
+speed. This starts fresh interpreters that import main and solve one bundled
+test case with BFS, and reports:
+
+- solve time: from the first import to the returned path, measured inside
+  the child (interpreter boot excluded), checked against STARTUP_BUDGET
+- wall time: the whole child process, as a batch job sees it
+- any of the heavy analysis/plotting modules that got imported
+
+Exits non-zero if the median solve time is over budget or a heavy module
+was imported. unit_tests/test_startup.py checks the heavy modules only,
+leaving the timing to this benchmark.
+"""
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds from "import main" to a solved query
+STARTUP_BUDGET = 0.050
+
+# Modules a single solve must not pull in
+HEAVY_MODULES = ('matplotlib', 'seaborn', 'pandas', 'numpy', 'utils.analysis')
+
+CHILD = f"""
+import time
+start_time = time.perf_counter()
+import main
+main.SOLVERS['bfs'].solve(main.GRID, *main.TEST_CASES[0])
+elapsed = time.perf_counter() - start_time
+import json, sys
+print(json.dumps({{'solve': elapsed, 'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure_startup(runs=5):
+    """Start runs fresh interpreters; return (solve times, wall times, heavy modules seen)"""
+    solve_times, wall_times, heavy = [], [], set()
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-c', CHILD], cwd=SRC_DIR,
+                                   capture_output=True, text=True, check=True)
+        wall_times.append(time.perf_counter() - start_time)
+        report = json.loads(completed.stdout.strip().splitlines()[-1])
+        solve_times.append(report['solve'])
+        heavy.update(report['heavy'])
+    return solve_times, wall_times, sorted(heavy)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    solve_times, wall_times, heavy = measure_startup(runs)
+    solve, wall = statistics.median(solve_times), statistics.median(wall_times)
+
+    print(f"Import main + one BFS solve: {solve * 1000:.1f} ms median over {runs} processes "
+          f"(budget {STARTUP_BUDGET * 1000:.0f} ms)")
+    print(f"Whole process wall time:     {wall * 1000:.1f} ms median")
+    print(f"Heavy modules imported:      {', '.join(heavy) or 'none'}")
+    return 0 if solve <= STARTUP_BUDGET and not heavy else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Search workspace benchmark: per-query allocation vs a reused SearchWorkspace
+
+Without a workspace every query allocates its per-cell arrays (stamps,
+parents, g scores, queue), O(cells) work even when the search itself only
+touches a few cells. With one SearchWorkspace per maze the arrays are
+allocated once and each query only starts a new generation.
+
+For each solver this runs the same queries on a large maze both ways and
+reports the median time per query and the peak traced allocation of one
+query, plus the time per query through Solver.solve with the workspace,
+which always collects SearchStats as solve.py and the analyzer do.
+
+Local queries (goal a short random walk away from start) are where the
+allocation dominates; far queries (solvable_queries) show the cost once
+searches cover much of the maze.
+
+    python benchmarks/workspace.py --size 1001 --kind rooms --queries 200
+"""
+
+import sys
+import os
+import argparse
+import random
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.generator import GENERATORS, generate, solvable_queries
+from algorithms.registry import SOLVERS
+from algorithms.workspace import SearchWorkspace
+from utils.benchmark import time_runs, measure_memory, summarize
+
+DEFAULT_SOLVERS = ['bfs', 'dfs', 'astar', 'greedy', 'jps', 'bidirectional-bfs', 'dijkstra']
+
+
+def local_queries(maze, count, walk, seed=0):
+    """count (start, goal) pairs with goal a random walk of up to walk steps from start"""
+    rng = random.Random(seed)
+    adjacency = maze.adjacency()
+    free = [index for index in range(maze.size) if maze.cells[index]]
+    pairs = []
+    while len(pairs) < count:
+        start = current = rng.choice(free)
+        for _ in range(walk):
+            neighbors = adjacency.neighbors(current)
+            if not neighbors:
+                break
+            current = rng.choice(neighbors)
+        pairs.append((maze.coords(start), maze.coords(current)))
+    return pairs
+
+
+def run_queries(solver, maze, queries, workspace):
+    for start, goal in queries:
+        solver(maze, start, goal, None, workspace)
+
+
+def run_solve(solver, maze, queries, workspace):
+    for start, goal in queries:
+        solver.solve(maze, start, goal, workspace=workspace)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per query with and without a reused SearchWorkspace")
+    parser.add_argument('--size', type=int, default=501)
+    parser.add_argument('--kind', choices=sorted(GENERATORS), default='rooms')
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('--walk', type=int, default=20, help="Random walk length of local queries")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--solvers', nargs='+', choices=sorted(SOLVERS), default=DEFAULT_SOLVERS)
+    args = parser.parse_args()
+
+    maze = generate(args.kind, args.size, args.size, seed=0)
+    maze.adjacency()  # Build shared indices before timing
+    suites = [("local", local_queries(maze, args.queries, args.walk)),
+              ("far", solvable_queries(maze, max(1, args.queries // 20), seed=0))]
+
+    for suite_name, queries in suites:
+        print(f"\n{args.kind} {args.size}x{args.size}, {len(queries)} {suite_name} queries")
+        print(f"{'solver':<20} {'ms/query':>9} {'reused':>9} {'speedup':>8} {'solve()':>9} "
+              f"{'KiB/query':>10} {'reused':>9}")
+        print("-" * 80)
+        for name in args.solvers:
+            solver = SOLVERS[name]
+            workspace = SearchWorkspace(maze)
+            row = []
+            for shared in (None, workspace):
+                _, samples = time_runs(run_queries, (solver, maze, queries, shared), args.repeats, warmup=1)
+                _, _, peak = measure_memory(solver, (maze, *queries[0], None, shared))
+                row.append((summarize(samples)['median'] / len(queries), peak))
+            (fresh, fresh_peak), (reused, reused_peak) = row
+            _, samples = time_runs(run_solve, (solver, maze, queries, workspace), args.repeats, warmup=1)
+            solved = summarize(samples)['median'] / len(queries)
+            print(f"{name:<20} {fresh * 1000:>9.3f} {reused * 1000:>9.3f} {fresh / reused:>7.1f}x "
+                  f"{solved * 1000:>9.3f} {fresh_peak / 1024:>10.1f} {reused_peak / 1024:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,33 @@
 # maze-solver-ai/src/main.py
 
-import time
-from algorithms.bfs import bfs
-from algorithms.dfs import dfs
-from algorithms.astar import astar
-from algorithms.greedy import greedy
-from algorithms.annealing import simulated_annealing
+from algorithms.registry import SOLVERS, SearchResult
 from maze.maze_map import MAZE
+from maze.grid import Maze
 from maze.test_cases import TEST_CASES
 from utils.display import display_maze
-from utils.analysis import analyze_results
+from utils.benchmark import benchmark
+# utils.analysis (matplotlib, seaborn, numpy) is imported only when the
+# comprehensive analysis is requested, keeping single solves fast to start
+
+# Packed copy of MAZE handed to the solvers, built once
+GRID = Maze.from_rows(MAZE)
+
+# Timed runs behind each reported time, after a few untimed warmup runs
+RUN_REPEATS = 10
+RUN_WARMUP = 2
+
+# Measured queries, so picking the same algorithm and test case again reuses
+# the measurement; keyed on the maze content, so edits to GRID invalidate it.
+# Created by path_cache() on first use, keeping it out of single-solve startup
+PATH_CACHE = None
+
+def path_cache():
+    """The shared PathCache, importing algorithms.path_cache on first use"""
+    global PATH_CACHE
+    if PATH_CACHE is None:
+        from algorithms.path_cache import PathCache
+        PATH_CACHE = PathCache()
+    return PATH_CACHE
 
 def main_menu():
     print("Maze Solver AI")
@@ -42,50 +60,22 @@ def get_memory_stats():
     
     return snapshot
 
-def run_algorithm(algorithm, start, goal):
-    import tracemalloc
-    import gc
-    
-    # Force garbage collection before measurement
-    gc.collect()
-    
-    # Start memory tracking
-    tracemalloc.start()
-    
-    start_time = time.perf_counter()
-    result = algorithm(MAZE, start, goal)
-    end_time = time.perf_counter()
-    time_taken = end_time - start_time
-    
-    # Get memory usage
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
-    # Calculate memory usage based on algorithm-specific data structures
-    if algorithm.__name__ == "greedy":
-        path = result
-        steps = len(path) - 1 if path else 0
-    elif isinstance(result, tuple):
-        # BFS returns: path, steps
-        if len(result) == 2 and algorithm.__name__ == "bfs":
-            path, steps = result
-        # DFS returns: path, path_found, visited_count
-        elif len(result) == 3 and algorithm.__name__ == "dfs":
-            path, path_found, visited_count = result
-            steps = len(path) - 1 if path else 0
-        # Annealing returns: best_path, path_length
-        elif len(result) == 2 and algorithm.__name__ == "simulated_annealing":
-            path, steps = result
-        # A* returns only path
-        elif len(result) == 1:
-            path = result[0]
-            steps = len(path) - 1 if path else 0
-        else:
-            path, steps = result
-    else:
-        path = result
-        steps = len(path) - 1 if path else 0
-
+def run_algorithm(solver, start, goal, repeats=RUN_REPEATS, warmup=RUN_WARMUP, cache=None):
+    # Median time over untraced repeats; memory from a separate traced run.
+    # Every registered solver's find_path returns the path or None.
+    search = cache.get(solver, GRID, start, goal, subpaths=False) if cache is not None else None
+    if search is None or search.measurement is None:
+        measurement = benchmark(solver.find_path, (GRID, start, goal), repeats, warmup)
+        search = SearchResult.from_coords(solver.name, measurement['result'], GRID.width,
+                                          measurement['timing']['median'], costs=GRID.costs)
+        search.measurement = measurement
+        if cache is not None:
+            cache.put(solver, GRID, start, goal, search)
+    measurement = search.measurement
+    path = measurement['result']
+    steps = len(path) - 1 if path else 0
+    time_taken = measurement['timing']['median']
+    current, peak = measurement['current_memory'], measurement['peak_memory']
     return path, steps, time_taken, current, peak
 
 def main():
@@ -99,11 +89,11 @@ def main():
             break
         
         algorithm_map = {
-            '1': (bfs, "Breadth-First Search"),
-            '2': (dfs, "Depth-First Search"),
-            '3': (astar, "A* Search"),
-            '4': (greedy, "Greedy Best-First Search"),
-            '5': (simulated_annealing, "Simulated Annealing"),
+            '1': (SOLVERS['bfs'], "Breadth-First Search"),
+            '2': (SOLVERS['dfs'], "Depth-First Search"),
+            '3': (SOLVERS['astar'], "A* Search"),
+            '4': (SOLVERS['greedy'], "Greedy Best-First Search"),
+            '5': (SOLVERS['annealing'], "Simulated Annealing"),
         }
         
         if choice == '6':
@@ -133,12 +123,12 @@ def main():
                 
                 if test_case_choice.isdigit() and 1 <= int(test_case_choice) <= len(TEST_CASES):
                     start, goal = TEST_CASES[int(test_case_choice) - 1]
-                    path, steps, time_taken, current_memory, peak_memory = run_algorithm(algorithm, start, goal)
+                    path, steps, time_taken, current_memory, peak_memory = run_algorithm(algorithm, start, goal, cache=path_cache())
 
                     if path:
                         print(f"\nPath Found: {path}")
                         print(f"Steps Taken: {steps}")
-                        print(f"Time Taken: {time_taken*1000000:.2f} microseconds")
+                        print(f"Time Taken: {time_taken*1000000:.2f} microseconds (median of {RUN_REPEATS} runs)")
                         print(f"Current Memory: {current_memory:,} bytes")
                         print(f"Peak Memory: {peak_memory:,} bytes")
                         display_maze(MAZE, path, start, goal)
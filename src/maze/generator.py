@@ -0,0 +1,278 @@
+# Seeded procedural maze generators for stress benchmarks
+
+# Every generator returns a packed Maze (maze.grid) and is deterministic for a
+# given seed, so benchmark runs can be reproduced exactly. Sizes from 10x10 up
+# to 10k x 10k are supported: the maze costs one byte per cell and the
+# generators keep their bookkeeping in bytearrays and int arrays. Room and
+# obstacle maps are built with slice writes and take about a second at
+# 10k x 10k (open_rooms 1.2 s, most of it placing 1.4 million doors;
+# random_obstacles 0.9 s); the carved mazes visit each cell in Python, about
+# 1.5 s per million cells.
+#
+# Perfect mazes (recursive_backtracker, kruskal, prim) carve passages between
+# cells at odd coordinates, so odd dimensions give a maze with a solid border;
+# with even dimensions the last row or column stays wall.
+
+import random
+from array import array
+from collections import deque
+
+from maze.grid import Maze, OPEN, WALL
+
+
+def recursive_backtracker(height, width, seed=None):
+    """Perfect maze by depth-first carving: long winding corridors, few branches"""
+    rng = random.Random(seed)
+    maze = Maze(height, width)
+    cells = maze.cells
+    rows, cols = (height - 1) // 2, (width - 1) // 2
+    if rows <= 0 or cols <= 0:
+        return maze
+
+    def index(r, c):
+        return (2 * r + 1) * width + 2 * c + 1
+
+    # Explicit stack of lattice cell ids (r * cols + c); a perfect maze can be
+    # one long corridor, so recursion would overflow and tuples would not fit
+    visited = bytearray(rows * cols)
+    first = rng.randrange(rows * cols)
+    stack = array('i', [first])
+    visited[first] = 1
+    cells[index(*divmod(first, cols))] = OPEN
+    while stack:
+        r, c = divmod(stack[-1], cols)
+        options = [(r + dr) * cols + c + dc for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                   if 0 <= r + dr < rows and 0 <= c + dc < cols and not visited[(r + dr) * cols + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        chosen = rng.choice(options)
+        nr, nc = divmod(chosen, cols)
+        visited[chosen] = 1
+        cells[index(nr, nc)] = OPEN
+        cells[(index(r, c) + index(nr, nc)) // 2] = OPEN  # Wall between the two cells
+        stack.append(chosen)
+    return maze
+
+
+def kruskal(height, width, seed=None):
+    """Perfect maze by randomized Kruskal: many short dead ends, uniform texture"""
+    rng = random.Random(seed)
+    maze = Maze(height, width)
+    cells = maze.cells
+    rows, cols = (height - 1) // 2, (width - 1) // 2
+    if rows <= 0 or cols <= 0:
+        return maze
+
+    # Union-find and edge list as int arrays so 10k x 10k stays in a few hundred MB
+    parent = array('i', range(rows * cols))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    # Edge ids: the first rows * (cols - 1) join a cell to its right-hand
+    # neighbour, the rest join a cell to the one below
+    horizontal = rows * (cols - 1)
+    edges = array('i', range(horizontal + (rows - 1) * cols))
+    rng.shuffle(edges)
+
+    for r in range(rows):
+        for c in range(cols):
+            cells[(2 * r + 1) * width + 2 * c + 1] = OPEN
+    for edge in edges:
+        if edge < horizontal:
+            r, c = divmod(edge, cols - 1)
+            a, b = r * cols + c, r * cols + c + 1
+        else:
+            a = edge - horizontal
+            b = a + cols
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_a] = root_b
+            (ra, ca), (rb, cb) = divmod(a, cols), divmod(b, cols)
+            cells[(ra + rb + 1) * width + ca + cb + 1] = OPEN
+    return maze
+
+
+def prim(height, width, seed=None):
+    """Perfect maze by randomized Prim: short corridors radiating from the start"""
+    rng = random.Random(seed)
+    maze = Maze(height, width)
+    cells = maze.cells
+    rows, cols = (height - 1) // 2, (width - 1) // 2
+    if rows <= 0 or cols <= 0:
+        return maze
+
+    in_maze = bytearray(rows * cols)
+    frontier = []
+
+    def add(r, c):
+        in_maze[r * cols + c] = 1
+        cells[(2 * r + 1) * width + 2 * c + 1] = OPEN
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < rows and 0 <= nc < cols and not in_maze[nr * cols + nc]:
+                frontier.append((nr, nc, r, c))
+
+    add(rng.randrange(rows), rng.randrange(cols))
+    while frontier:
+        # Swap-remove a random frontier edge
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        r, c, from_r, from_c = frontier.pop()
+        if in_maze[r * cols + c]:
+            continue
+        cells[(r + from_r + 1) * width + c + from_c + 1] = OPEN
+        add(r, c)
+    return maze
+
+
+def braid(maze, fraction=0.5, seed=None):
+    """Add loops to a perfect maze by opening a wall at a fraction of its dead ends.
+
+    Works in place on the given Maze and returns it.
+    """
+    rng = random.Random(seed)
+    height, width, cells = maze.height, maze.width, maze.cells
+    for r in range(1, height - 1, 2):
+        for c in range(1, width - 1, 2):
+            i = r * width + c
+            if not cells[i]:
+                continue
+            # A dead end has exactly one open side
+            if sum(1 for step in (-width, width, -1, 1) if cells[i + step]) != 1:
+                continue
+            # Interior walls that lead on to another cell
+            walls = [i + step for step, ok in
+                     ((-width, r > 1), (width, r + 2 < height - 1), (-1, c > 1), (1, c + 2 < width - 1))
+                     if ok and not cells[i + step] and cells[i + 2 * step]]
+            if walls and rng.random() < fraction:
+                cells[rng.choice(walls)] = OPEN
+    maze.cells_changed()
+    return maze
+
+
+def braided(height, width, fraction=0.5, seed=None):
+    """Recursive-backtracker maze with loops added at a fraction of its dead ends"""
+    return braid(recursive_backtracker(height, width, seed), fraction, seed)
+
+
+def open_rooms(height, width, room_size=16, doors=2, seed=None):
+    """Grid of open rooms separated by one-cell walls with a few doorways in each wall"""
+    rng = random.Random(seed)
+    # Door offsets come from random() rather than randrange(), which costs
+    # several times more and is called twice per door per room
+    uniform = rng.random
+    maze = Maze(height, width)
+    cells = maze.cells
+    interior = bytes([OPEN]) * (width - 2)
+    for r in range(1, height - 1):
+        cells[r * width + 1:(r + 1) * width - 1] = interior
+
+    step = room_size + 1
+    for wall_row in range(step, height - 1, step):
+        base = wall_row * width
+        cells[base:base + width] = bytes(width)
+        for left in range(1, width - 1, step):
+            span = min(room_size, width - 1 - left)
+            for _ in range(doors):
+                cells[base + left + int(uniform() * span)] = OPEN
+    for wall_col in range(step, width - 1, step):
+        # The whole column in one strided write; doors never fall on it
+        cells[width + wall_col:(height - 1) * width:width] = bytes(height - 2)
+        for top in range(1, height - 1, step):
+            span = min(room_size, height - 1 - top)
+            for _ in range(doors):
+                cells[(top + int(uniform() * span)) * width + wall_col] = OPEN
+    return maze
+
+
+def random_obstacles(height, width, density=0.3, seed=None):
+    """Each cell is a wall with probability density (quantized to 1/256)"""
+    rng = random.Random(seed)
+    threshold = round(density * 256)
+    # Map random bytes straight to cells: below threshold -> wall, else free
+    table = bytes(WALL if value < threshold else OPEN for value in range(256))
+    cells = bytearray(rng.randbytes(height * width).translate(table))
+    return Maze(height, width, cells)
+
+
+GENERATORS = {
+    'backtracker': recursive_backtracker,
+    'kruskal': kruskal,
+    'prim': prim,
+    'braided': braided,
+    'rooms': open_rooms,
+    'obstacles': random_obstacles,
+}
+
+
+def generate(kind, height, width, seed=None, **options):
+    """Generate a maze by name, e.g. generate('kruskal', 255, 255, seed=1)"""
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown maze kind {kind!r}, expected one of {sorted(GENERATORS)}")
+    return GENERATORS[kind](height, width, seed=seed, **options)
+
+
+def largest_component(maze):
+    """Indices of the free cells in the largest connected region, as an array('i').
+
+    A first flood fill only sizes each region, marking cells in a bytearray;
+    a second one collects the largest region's cells, so no region but the
+    answer is ever held as a list.
+    """
+    adjacency = maze.adjacency()
+    masks, steps, cells = adjacency.masks, adjacency.steps, maze.cells
+
+    def flood(origin, seen, collect=None):
+        seen[origin] = 1
+        size = 1
+        queue = deque([origin])
+        while queue:
+            current = queue.popleft()
+            if collect is not None:
+                collect.append(current)
+            for step in steps[masks[current]]:
+                neighbor = current + step
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    size += 1
+                    queue.append(neighbor)
+        return size
+
+    seen = bytearray(maze.size)
+    best_origin, best_size = None, 0
+    for origin in range(maze.size):
+        if cells[origin] and not seen[origin]:
+            size = flood(origin, seen)
+            if size > best_size:
+                best_origin, best_size = origin, size
+
+    component = array('i')
+    if best_origin is not None:
+        flood(best_origin, bytearray(maze.size), component)
+    return component
+
+
+def solvable_queries(maze, count, seed=None):
+    """count (start, goal) pairs that are guaranteed to have a path.
+
+    Both ends are drawn from the largest connected region, so every query is
+    solvable; start and goal differ whenever the region has two or more cells.
+    """
+    rng = random.Random(seed)
+    component = largest_component(maze)
+    if not component:
+        raise ValueError("Maze has no free cells")
+    width = maze.width
+    queries = []
+    for _ in range(count):
+        if len(component) >= 2:
+            start, goal = rng.sample(component, 2)
+        else:
+            start = goal = component[0]
+        queries.append((divmod(start, width), divmod(goal, width)))
+    return queries
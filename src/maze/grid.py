@@ -0,0 +1,194 @@
+# Compact maze representation
+
+# A Maze stores its cells in one flat bytearray (1 = free cell, 0 = wall) with
+# a height and width, and addresses cells by integer index (row * width + col).
+# A 4096x4096 grid takes 16 MB this way instead of ~1 GB of one-char strings.
+# Solvers accept either a Maze or the nested-list format of maze.maze_map.MAZE;
+# Maze.coerce() converts the latter once at the start of a search.
+# The cell buffer can also be a memoryview over a memory-mapped .maze file
+# (see maze.mazefile), so large mazes need not be read into memory at all.
+#
+# An optional cost layer (one uint8 per cell, the cost of stepping onto that
+# cell) models slow terrain; without one every move costs 1. Only the
+# weighted solvers in algorithms.weighted read it; see maze.terrain for
+# building cost layers.
+
+from maze.adjacency import Adjacency
+
+WALL = 0
+OPEN = 1
+
+
+class Maze:
+    __slots__ = ("height", "width", "cells", "costs", "version", "_derived")
+
+    def __init__(self, height, width, cells=None, costs=None):
+        if height <= 0 or width <= 0:
+            raise ValueError(f"Maze dimensions must be positive, got {height}x{width}")
+        if cells is None:
+            cells = bytearray(height * width)  # All walls
+        elif len(cells) != height * width:
+            raise ValueError(f"Expected {height * width} cells, got {len(cells)}")
+        self.height = height
+        self.width = width
+        self.cells = cells
+        self.costs = None  # Per-cell move cost (bytearray), None for unit cost
+        self.version = 0  # Bumped on every change to the cells or costs
+        self._derived = {}  # Precomputed indices built from the cells, by name
+        if costs is not None:
+            self.set_costs(costs)
+            self.version = 0
+
+    @classmethod
+    def from_rows(cls, rows, open_chars="."):
+        """Build a Maze from a list of rows, each a list of one-char strings or a string"""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        cells = bytearray(height * width)
+        for r, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError(f"Row {r} has {len(row)} cells, expected {width}")
+            base = r * width
+            for c, cell in enumerate(row):
+                if cell in open_chars:
+                    cells[base + c] = OPEN
+        return cls(height, width, cells)
+
+    @classmethod
+    def coerce(cls, maze):
+        """Return maze unchanged if it is already a Maze, otherwise convert it"""
+        if isinstance(maze, cls):
+            return maze
+        return cls.from_rows(maze)
+
+    def to_rows(self):
+        """Convert back to the nested-list format used by maze.maze_map"""
+        return [self[r] for r in range(self.height)]
+
+    def to_numpy(self):
+        """Return a (height, width) uint8 NumPy view over the cell buffer"""
+        import numpy as np
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    def derived(self, name, build):
+        """Return the index stored under name, calling build(self) on first use"""
+        index = self._derived.get(name)
+        if index is None:
+            index = self._derived[name] = build(self)
+        return index
+
+    def adjacency(self):
+        """Neighbour index for this maze, built on first use and then reused"""
+        return self.derived("adjacency", Adjacency)
+
+    def set_open(self, row, col, is_open=True):
+        """Open or close one cell (doors, obstacles), keeping derived indices valid.
+
+        The neighbour index is patched in place around the cell; every other
+        derived index is dropped and rebuilt on next use.
+        """
+        if not self.in_bounds(row, col):
+            raise IndexError(f"Cell {(row, col)} is outside the {self.height}x{self.width} maze")
+        index = row * self.width + col
+        value = OPEN if is_open else WALL
+        if self.cells[index] == value:
+            return
+        self.cells[index] = value
+        if is_open and self.costs is not None and not self.costs[index]:
+            self.costs[index] = 1  # Keep the free-cell invariant of set_costs()
+        adjacency = self._changed()
+        if adjacency is not None:
+            adjacency.refresh(self, row, col)
+
+    def set_costs(self, costs):
+        """Attach a cost layer (bytes-like, one value 1-255 per cell), or None for unit cost.
+
+        Values under walls are ignored; a free cell with cost 0 is an error.
+        """
+        if costs is not None:
+            if len(costs) != self.size:
+                raise ValueError(f"Expected {self.size} costs, got {len(costs)}")
+            costs = bytearray(costs)
+            if any(cell and not cost for cell, cost in zip(self.cells, costs)):
+                raise ValueError("Free cells must cost at least 1")
+        self.costs = costs
+        self._changed()
+
+    def set_cost(self, row, col, cost):
+        """Change the cost of one cell, adding a unit cost layer first if needed"""
+        if not self.in_bounds(row, col):
+            raise IndexError(f"Cell {(row, col)} is outside the {self.height}x{self.width} maze")
+        if not 1 <= cost <= 255:
+            raise ValueError(f"Cell cost must be in 1..255, got {cost}")
+        if self.costs is None:
+            self.costs = bytearray([1]) * self.size
+        self.costs[row * self.width + col] = cost
+        self._changed()
+
+    def cells_changed(self):
+        """Record a bulk edit made directly to cells (e.g. by a generator pass).
+
+        Bumps the version and drops every derived index, the neighbour index
+        included, since the changed cells are not known.
+        """
+        self.version += 1
+        self._derived.clear()
+
+    def _changed(self):
+        # Bump the version and drop derived indices, except the neighbour
+        # index which callers patch in place; returns it (or None)
+        self.version += 1
+        adjacency = self._derived.get("adjacency")
+        self._derived.clear()
+        if adjacency is not None:
+            self._derived["adjacency"] = adjacency
+        return adjacency
+
+    def cost(self, row, col):
+        """Cost of stepping onto a cell (1 without a cost layer)"""
+        return self.costs[row * self.width + col] if self.costs is not None else 1
+
+    def fingerprint(self):
+        """Content hash of the dimensions, cells and costs, stable across processes"""
+        import hashlib
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.height}x{self.width}:".encode())
+        digest.update(self.cells)
+        if self.costs is not None:
+            digest.update(b"costs:")
+            digest.update(self.costs)
+        return digest.hexdigest()
+
+    @property
+    def size(self):
+        return self.height * self.width
+
+    @property
+    def nbytes(self):
+        return len(self.cells)
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    def coords(self, index):
+        return divmod(index, self.width)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def is_open(self, row, col):
+        return 0 <= row < self.height and 0 <= col < self.width and self.cells[row * self.width + col] == OPEN
+
+    def __len__(self):
+        # Compatibility with code written against the nested-list format
+        return self.height
+
+    def __getitem__(self, row):
+        # Compatibility view: maze[r][c] gives "." or "#" like the nested lists
+        if not 0 <= row < self.height:
+            raise IndexError("maze row out of range")
+        base = row * self.width
+        return ["." if cell else "#" for cell in self.cells[base:base + self.width]]
+
+    def __repr__(self):
+        return f"Maze({self.height}x{self.width}, {sum(self.cells)} open cells)"
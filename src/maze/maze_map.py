@@ -21,5 +21,6 @@ MAZE = [
     ["#", "#", "#", "#", "#", "#", "#", "#", "#", "#", "#", "#", "#", "#", "#"],
 ]
 
-for cell in MAZE:
-    print(cell)
\ No newline at end of file
+if __name__ == "__main__":
+    for cell in MAZE:
+        print(cell)
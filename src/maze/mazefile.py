@@ -0,0 +1,185 @@
+# Binary on-disk maze format
+
+# A .maze file is a 16-byte little-endian header followed by the cells:
+#
+#     offset  size  field
+#     0       4     magic b"MAZE"
+#     4       1     format version (1)
+#     5       1     encoding: 0 = one byte per cell, 1 = one bit per cell
+#     6       2     reserved (0)
+#     8       4     height
+#     12      4     width
+#     16      ...   cells, row-major, 1 = free cell, 0 = wall
+#
+# The byte encoding is exactly Maze.cells, so load() memory-maps the file and
+# hands the mapping to Maze as its cell buffer: there is no parse step and no
+# per-cell Python object, and cells are read straight from the page cache.
+# Opening is O(1) in the maze size; the first solve is O(cells). It builds
+# the neighbour index (maze.adjacency, one byte per cell in memory, about
+# 0.5 s per 100 million cells), and a search without a SearchWorkspace
+# allocates its stamps, parents and queue, about 12 bytes per cell, however
+# short the path. Reuse one workspace per maze to pay that once. The bit
+# encoding (rows packed MSB first into one continuous bit stream, as
+# numpy.packbits does) is 8x smaller on disk but has to be unpacked into
+# memory on load.
+#
+# Text files hold one row per line with "." for free cells and "#" for walls,
+# the same characters as maze.maze_map. Convert between formats with
+#
+#     python -m maze.mazefile big.txt big.maze
+#     python -m maze.mazefile big.maze big.txt
+
+import mmap
+import struct
+import sys
+
+from maze.grid import Maze, OPEN, WALL
+
+MAGIC = b"MAZE"
+FORMAT_VERSION = 1
+BYTE_ENCODING = 0
+BIT_ENCODING = 1
+ENCODINGS = {"byte": BYTE_ENCODING, "bit": BIT_ENCODING}
+
+HEADER = struct.Struct("<4sBBHII")
+
+# mmap access for each load() mode
+ACCESS_MODES = {
+    "r": mmap.ACCESS_READ,    # Read-only; set_open() raises TypeError
+    "c": mmap.ACCESS_COPY,    # Copy-on-write; changes stay in this process
+    "r+": mmap.ACCESS_WRITE,  # Changes are written through to the file
+}
+
+
+def save(maze, path, encoding="byte"):
+    """Write a Maze (or nested-list maze) to path in the binary format"""
+    maze = Maze.coerce(maze)
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding {encoding!r}, expected 'byte' or 'bit'")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, ENCODINGS[encoding], 0, maze.height, maze.width))
+        if encoding == "byte":
+            f.write(maze.cells)
+        else:
+            import numpy as np
+            f.write(np.packbits(np.frombuffer(maze.cells, dtype=np.uint8)).tobytes())
+
+
+def read_header(path):
+    """Return (encoding name, height, width) from a .maze file's header"""
+    with open(path, "rb") as f:
+        return _parse_header(f.read(HEADER.size), path)
+
+
+def load(path, mode="r"):
+    """Open a .maze file as a Maze.
+
+    Byte-encoded files are memory-mapped (see ACCESS_MODES for mode); the
+    returned Maze's cells are a memoryview over the mapping, which stays open
+    for as long as the Maze is alive. Bit-encoded files are unpacked into a
+    new bytearray and mode is ignored.
+    """
+    if mode not in ACCESS_MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {sorted(ACCESS_MODES)}")
+    with open(path, "r+b" if mode == "r+" else "rb") as f:
+        encoding, height, width = _parse_header(f.read(HEADER.size), path)
+        size = height * width
+
+        if encoding == "bit":
+            packed = f.read((size + 7) // 8)
+            if len(packed) != (size + 7) // 8:
+                raise ValueError(f"{path}: truncated, expected {(size + 7) // 8} bytes of cells")
+            import numpy as np
+            cells = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=size)
+            return Maze(height, width, bytearray(cells.tobytes()))
+
+        mapping = mmap.mmap(f.fileno(), 0, access=ACCESS_MODES[mode])
+    if len(mapping) < HEADER.size + size:
+        mapping.close()
+        raise ValueError(f"{path}: truncated, expected {size} bytes of cells")
+    return Maze(height, width, memoryview(mapping)[HEADER.size:HEADER.size + size])
+
+
+def _parse_header(header, path):
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path}: too short for a maze header")
+    magic, version, encoding, _, height, width = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a maze file (bad magic {magic!r})")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported format version {version}")
+    if encoding not in (BYTE_ENCODING, BIT_ENCODING):
+        raise ValueError(f"{path}: unknown cell encoding {encoding}")
+    return ("byte" if encoding == BYTE_ENCODING else "bit"), height, width
+
+
+# Text <-> cells translation tables
+_TEXT_TO_CELLS = bytes(OPEN if value == ord(".") else WALL for value in range(256))
+_CELLS_TO_TEXT = bytes.maketrans(bytes([WALL, OPEN]), b"#.")
+
+
+def from_text(text):
+    """Build a Maze from text with one row per line ('.' free, '#' wall)"""
+    if isinstance(text, str):
+        text = text.encode()
+    lines = text.split()
+    if not lines:
+        raise ValueError("Empty maze text")
+    width = len(lines[0])
+    for r, line in enumerate(lines):
+        if len(line) != width:
+            raise ValueError(f"Row {r} has {len(line)} cells, expected {width}")
+    return Maze(len(lines), width, bytearray(b"".join(lines).translate(_TEXT_TO_CELLS)))
+
+
+def to_text(maze):
+    """Render a Maze as text, one row per line"""
+    maze = Maze.coerce(maze)
+    width = maze.width
+    cells = bytes(maze.cells).translate(_CELLS_TO_TEXT)
+    return "\n".join(cells[r * width:(r + 1) * width].decode() for r in range(maze.height)) + "\n"
+
+
+def read_text(path):
+    with open(path, "rb") as f:
+        return from_text(f.read())
+
+
+def write_text(maze, path):
+    with open(path, "w") as f:
+        f.write(to_text(maze))
+
+
+def from_list(rows):
+    """Build a Maze from the nested-list format of maze.maze_map"""
+    return Maze.from_rows(rows)
+
+
+def to_list(maze):
+    """Convert a Maze to the nested-list format of maze.maze_map"""
+    return Maze.coerce(maze).to_rows()
+
+
+def convert(source, destination, encoding="byte"):
+    """Convert between .maze and text files, chosen by the .maze extension"""
+    maze = load(source) if source.endswith(".maze") else read_text(source)
+    if destination.endswith(".maze"):
+        save(maze, destination, encoding)
+    else:
+        write_text(maze, destination)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert mazes between text and .maze files")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--encoding", choices=sorted(ENCODINGS), default="byte",
+                        help="Cell encoding when writing a .maze file")
+    args = parser.parse_args(argv)
+    convert(args.source, args.destination, args.encoding)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
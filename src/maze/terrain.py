@@ -0,0 +1,87 @@
+# Weighted terrain: building and reading Maze cost layers
+
+# A cost layer gives each cell the cost (1-255) of stepping onto it, so slow
+# zones such as mud or crowds can be modelled without changing the walls.
+# In text form a digit 1-9 is a free cell with that cost, "." a free cell of
+# cost 1 and "#" a wall:
+#
+#     #######
+#     #..55.#
+#     #.#99.#
+#     #######
+
+import random
+
+from maze.grid import Maze, OPEN
+
+
+def from_cost_rows(rows):
+    """Build a Maze with a cost layer from rows of '#', '.' and digits 1-9"""
+    height = len(rows)
+    width = len(rows[0]) if height else 0
+    cells = bytearray(height * width)
+    costs = bytearray([1]) * (height * width)
+    for r, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"Row {r} has {len(row)} cells, expected {width}")
+        base = r * width
+        for c, cell in enumerate(row):
+            if cell == ".":
+                cells[base + c] = OPEN
+            elif cell in "123456789":
+                cells[base + c] = OPEN
+                costs[base + c] = int(cell)
+            elif cell != "#":
+                raise ValueError(f"Unexpected cell {cell!r} at {(r, c)}")
+    return Maze(height, width, cells, costs)
+
+
+def to_cost_rows(maze):
+    """Render a weighted Maze as strings ('#' wall, '.' cost 1, digits for 2-9, '+' above 9)"""
+    maze = Maze.coerce(maze)
+    costs = maze.costs
+    rows = []
+    for r in range(maze.height):
+        base = r * maze.width
+        row = []
+        for i in range(base, base + maze.width):
+            cost = costs[i] if costs is not None else 1
+            if not maze.cells[i]:
+                row.append("#")
+            elif cost == 1:
+                row.append(".")
+            else:
+                row.append(str(cost) if cost <= 9 else "+")
+        rows.append("".join(row))
+    return rows
+
+
+def add_slow_zones(maze, zones, size=5, cost=5, seed=None):
+    """Scatter zones square patches of the given cost over a Maze, in place.
+
+    Patch corners and sizes (1 to size cells a side) are drawn from a seeded
+    RNG; only free cells get the cost, walls are left alone.
+    """
+    rng = random.Random(seed)
+    height, width = maze.height, maze.width
+    cells = maze.cells
+    costs = bytearray(maze.costs) if maze.costs is not None else bytearray([1]) * maze.size
+    for _ in range(zones):
+        side = rng.randint(1, size)
+        top, left = rng.randrange(height), rng.randrange(width)
+        for r in range(top, min(top + side, height)):
+            for c in range(left, min(left + side, width)):
+                if cells[r * width + c]:
+                    costs[r * width + c] = cost
+    maze.set_costs(costs)
+    return maze
+
+
+def path_cost(maze, path):
+    """Total cost of a path of (row, col) cells: the cost of every cell after the first"""
+    if not path:
+        return 0
+    if maze.costs is None:
+        return len(path) - 1
+    costs, width = maze.costs, maze.width
+    return sum(costs[row * width + col] for row, col in path[1:])
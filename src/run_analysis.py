@@ -17,6 +17,7 @@ It generates:
 
 import sys
 import os
+import argparse
 
 # Add the src directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -25,6 +26,11 @@ from utils.analysis import analyze_results
 
 def main():
     """Main function to run the comprehensive analysis"""
+    parser = argparse.ArgumentParser(description="Run the maze-solving algorithms analysis")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="run the benchmarks on this many worker processes (default: serial)")
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("MAZE-SOLVING ALGORITHMS COMPREHENSIVE ANALYSIS")
     print("=" * 80)
@@ -35,11 +41,13 @@ def main():
     print("3. A* Search")
     print("4. Greedy Best-First Search")
     print("5. Simulated Annealing")
+    print("6. Bidirectional BFS")
+    print("7. Bidirectional A*")
     print()
     print("Evaluation Metrics:")
     print("- Completeness: Path finding success rate")
     print("- Cost Optimality: Average steps taken")
-    print("- Time Complexity: Average execution time")
+    print("- Time Complexity: Median execution time over repeated runs")
     print("- Space Complexity: Average memory usage")
     print()
     print("Test Cases: 10 different start-goal pairs")
@@ -47,7 +55,7 @@ def main():
     
     try:
         # Run the comprehensive analysis
-        analyzer, results, metrics = analyze_results()
+        analyzer, results, metrics = analyze_results(workers=args.workers)
         
         print("\n" + "=" * 80)
         print("ANALYSIS COMPLETE!")
@@ -67,13 +75,13 @@ def main():
         best_cost = min(metrics['cost_optimality'].keys(), 
                        key=lambda x: metrics['cost_optimality'][x]['mean'])
         best_time = min(metrics['time_complexity'].keys(), 
-                       key=lambda x: metrics['time_complexity'][x]['mean'])
+                       key=lambda x: metrics['time_complexity'][x]['median'])
         best_memory = min(metrics['space_complexity'].keys(), 
                          key=lambda x: metrics['space_complexity'][x]['mean'])
         
         print(f"• Most Complete: {best_completeness} ({metrics['completeness'][best_completeness]['mean']*100:.1f}% success rate)")
         print(f"• Most Cost-Optimal: {best_cost} ({metrics['cost_optimality'][best_cost]['mean']:.1f} avg steps)")
-        print(f"• Fastest: {best_time} ({metrics['time_complexity'][best_time]['mean']*1000000:.0f} μs avg)")
+        print(f"• Fastest: {best_time} ({metrics['time_complexity'][best_time]['median']*1000000:.0f} μs median)")
         print(f"• Most Memory-Efficient: {best_memory} ({metrics['space_complexity'][best_memory]['mean']/1024:.1f} KB avg)")
         
         print()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Non-interactive batch solver
+
+Reads start/goal queries from stdin (or --queries FILE) and writes one JSON
+object per query to stdout as soon as it is solved, so arbitrarily long
+query streams can be piped through with constant memory:
+
+    python solve.py maze.txt --algorithm astar < queries.txt > results.jsonl
+
+The maze is a .maze file (see maze.mazefile, memory-mapped) or a text file
+with one row per line ('.' free, '#' wall). Each query line is either four
+integers "start_row start_col goal_row goal_col" (spaces or commas), or JSON:
+{"start": [r, c], "goal": [r, c]} or [[r, c], [r, c]]. Blank lines and lines
+starting with '#' are skipped.
+
+Each output line has start, goal, path (list of [row, col], or null), steps,
+time (seconds, this query only) and expansions (nodes expanded, see
+algorithms.stats). A query that cannot be read or solved gives
+a line with an "error" field instead, so output stays aligned with input.
+"""
+
+import sys
+import os
+import argparse
+import json
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from maze import mazefile
+from algorithms.registry import SOLVERS
+from algorithms.workspace import SearchWorkspace
+
+
+# Every registered solver (see algorithms.registry) can be chosen by name
+ALGORITHMS = tuple(SOLVERS)
+
+
+def load_maze(path):
+    """Load a .maze file (memory-mapped) or a text maze"""
+    if path.endswith('.maze'):
+        return mazefile.load(path)
+    return mazefile.read_text(path)
+
+
+def parse_query(line):
+    """Parse one query line into ((row, col), (row, col)), or None for blank/comment lines"""
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line[0] in '{[':
+        query = json.loads(line)
+        if isinstance(query, dict):
+            query = query['start'], query['goal']
+        (start_row, start_col), (goal_row, goal_col) = query
+        values = start_row, start_col, goal_row, goal_col
+    else:
+        values = line.replace(',', ' ').split()
+        if len(values) != 4:
+            raise ValueError(f"expected 4 integers, got {len(values)} fields")
+    start_row, start_col, goal_row, goal_col = (int(value) for value in values)
+    return (start_row, start_col), (goal_row, goal_col)
+
+
+def solve_stream(maze, lines, algorithm='bfs'):
+    """Yield one result dict per query line, solving lazily as lines are read"""
+    solver = SOLVERS[algorithm]
+    maze.adjacency()  # Build the shared neighbour index before the first timed query
+    workspace = SearchWorkspace(maze)  # Search buffers shared by every query
+    for line_number, line in enumerate(lines, 1):
+        try:
+            query = parse_query(line)
+        except (ValueError, TypeError, KeyError) as e:
+            yield {'line': line_number, 'error': f"bad query: {e}"}
+            continue
+        if query is None:
+            continue
+
+        start, goal = query
+        if not (maze.in_bounds(*start) and maze.in_bounds(*goal)):
+            yield {'line': line_number, 'start': start, 'goal': goal,
+                   'error': "start and goal must be inside the maze"}
+            continue
+
+        result = solver.solve(maze, start, goal, workspace=workspace)
+        yield {
+            'start': start,
+            'goal': goal,
+            'path': result.coords(),
+            'steps': result.cost,
+            'time': result.elapsed,
+            'expansions': result.expansions,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve start/goal queries and stream JSON Lines results")
+    parser.add_argument('maze', help="maze file: .maze binary or text rows of '.' and '#'")
+    parser.add_argument('-a', '--algorithm', choices=ALGORITHMS, default='bfs')
+    parser.add_argument('-q', '--queries', default='-',
+                        help="query file, one query per line (default: stdin)")
+    args = parser.parse_args(argv)
+
+    maze = load_maze(args.maze)
+    queries = sys.stdin if args.queries == '-' else open(args.queries)
+    out = sys.stdout
+    try:
+        for result in solve_stream(maze, queries, args.algorithm):
+            out.write(json.dumps(result, separators=(',', ':')))
+            out.write('\n')
+            out.flush()  # Downstream consumers see each result as soon as it exists
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head): stop quietly, and point
+        # stdout at devnull so the interpreter's final flush cannot fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -92,6 +92,55 @@ def test_metrics_calculation():
         print(f"✗ Metrics calculation test failed: {e}")
         return False
 
+def test_benchmark_statistics():
+    """The timing summary used by the benchmark harness, on known samples"""
+    from utils.benchmark import summarize, benchmark
+    from maze.maze_map import MAZE
+    from algorithms.bfs import bfs
+
+    # An outlier moves p95 and the maximum but barely the median and MAD
+    timing = summarize([5.0, 1.0, 3.0, 2.0, 4.0, 100.0])
+    assert (timing['median'], timing['p95'], timing['mad']) == (3.5, 100.0, 1.5)
+    assert (timing['min'], timing['max'], timing['count']) == (1.0, 100.0, 6)
+    assert timing['mean'] == 115.0 / 6
+
+    timing = summarize([float(sample) for sample in range(20, 0, -1)])
+    assert (timing['median'], timing['p95'], timing['mad']) == (10.5, 19.0, 5.0)
+    assert summarize([7.0]) == {'median': 7.0, 'p95': 7.0, 'mad': 0.0, 'mean': 7.0,
+                                'min': 7.0, 'max': 7.0, 'count': 1}
+    try:
+        summarize([])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("summarize([]) should raise ValueError")
+
+    measurement = benchmark(bfs, (MAZE, (1, 1), (13, 13)), repeats=5, warmup=1)
+    assert len(measurement['samples']) == 5 and measurement['timing']['count'] == 5
+    assert measurement['timing']['median'] == summarize(measurement['samples'])['median']
+    assert measurement['result'][1] == 24
+    assert measurement['peak_memory'] > 0
+
+def test_parallel_analysis():
+    """The process pool runner returns the serial runner's layout and paths"""
+    from utils.analysis import AlgorithmAnalyzer
+    from maze.test_cases import TEST_CASES
+
+    serial = AlgorithmAnalyzer(test_cases=TEST_CASES[:3], repeats=1, warmup=0)
+    parallel = AlgorithmAnalyzer(test_cases=TEST_CASES[:3], repeats=1, warmup=0)
+    serial_results = serial.run_comprehensive_analysis()
+    parallel_results = parallel.run_comprehensive_analysis(workers=2)
+
+    assert list(serial_results) == list(parallel_results) and len(serial_results) == 3
+    for test_case, results in serial_results.items():
+        assert list(results) == list(parallel_results[test_case]) == list(serial.algorithms)
+        for algorithm, run in results.items():
+            # Shortest path lengths do not depend on where the solver ran
+            if serial.algorithms[algorithm].optimal:
+                other = parallel_results[test_case][algorithm]
+                assert run['path_found'] and other['path_found'], (test_case, algorithm)
+                assert run['steps'] == other['steps'] == 24, (test_case, algorithm)
+
 def main():
     """Run all tests"""
     print("Testing Maze-Solving Algorithms Analysis Module")
@@ -100,7 +149,9 @@ def main():
     tests = [
         ("Import Test", test_imports),
         ("Single Algorithm Test", test_single_algorithm),
-        ("Metrics Calculation Test", test_metrics_calculation)
+        ("Metrics Calculation Test", test_metrics_calculation),
+        ("Benchmark Statistics Test", test_benchmark_statistics),
+        ("Parallel Analysis Test", test_parallel_analysis)
     ]
     
     passed = 0
@@ -108,7 +159,13 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\nRunning {test_name}...")
-        if test_func():
+        try:
+            # Older tests report failure by returning False, newer ones assert
+            ok = test_func() is not False
+        except AssertionError as e:
+            print(f"✗ {e}")
+            ok = False
+        if ok:
             passed += 1
             print(f"✓ {test_name} PASSED")
         else:
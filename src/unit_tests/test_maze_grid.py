@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tests for the packed Maze representation and its use by the solvers
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Maze
+from maze.maze_map import MAZE
+from maze.test_cases import TEST_CASES
+from maze import mazefile
+from maze.adjacency import VECTORIZE_MIN_CELLS
+from maze.generator import GENERATORS, braid, generate, largest_component, solvable_queries
+from algorithms.bfs import bfs
+from algorithms.dfs import dfs
+from algorithms.astar import astar
+from algorithms.greedy import greedy
+
+
+def test_round_trip():
+    """Packing and unpacking MAZE gives back the same rows"""
+    grid = Maze.from_rows(MAZE)
+    assert (grid.height, grid.width) == (15, 15)
+    assert grid.nbytes == 15 * 15
+    assert grid.to_rows() == MAZE
+    assert Maze.coerce(grid) is grid
+
+
+def test_cell_addressing():
+    """Cells are addressed by row * width + col"""
+    grid = Maze.from_rows(["#..", "..#"])
+    assert grid.index(1, 2) == 5
+    assert grid.coords(5) == (1, 2)
+    assert grid.is_open(0, 1) and not grid.is_open(0, 0)
+    assert not grid.is_open(-1, 0) and not grid.is_open(2, 0)
+    assert grid[1] == [".", ".", "#"]
+
+
+def test_adjacency_index():
+    """The neighbour index lists free neighbours in Up, Down, Left, Right order"""
+    grid = Maze.from_rows(["...", ".#.", "..."])
+    adjacency = grid.adjacency()
+    assert adjacency is grid.adjacency()
+    assert adjacency.neighbors(grid.index(0, 1)) == [grid.index(0, 0), grid.index(0, 2)]
+    assert adjacency.neighbors(grid.index(1, 0)) == [grid.index(0, 0), grid.index(2, 0)]
+    assert adjacency.neighbors(grid.index(2, 2)) == [grid.index(1, 2), grid.index(2, 1)]
+
+    # Large mazes are indexed with NumPy shifts; same masks as a per-cell check
+    grid = generate('obstacles', 257, 301, density=0.4, seed=3)
+    assert grid.size >= VECTORIZE_MIN_CELLS
+    masks = grid.adjacency().masks
+    for index in range(grid.size):
+        row, col = grid.coords(index)
+        expected = [(row + dr) * grid.width + col + dc for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                    if grid.in_bounds(row + dr, col + dc) and grid.is_open(row + dr, col + dc)]
+        assert grid.adjacency().neighbors(index) == expected, (row, col, masks[index])
+
+
+def test_set_open_keeps_adjacency_current():
+    """Opening or closing a cell patches the neighbour index and bumps the version"""
+    grid = Maze.from_rows(["...", ".#.", "..."])
+    adjacency = grid.adjacency()
+    middle = grid.index(1, 1)
+    grid.set_open(1, 1)
+    assert grid.version == 1 and grid.adjacency() is adjacency
+    assert middle in adjacency.neighbors(grid.index(0, 1))
+    grid.set_open(0, 1, False)
+    assert adjacency.neighbors(middle) == [grid.index(2, 1), grid.index(1, 0), grid.index(1, 2)]
+    assert adjacency.neighbors(grid.index(0, 0)) == [grid.index(1, 0)]
+
+
+def test_solvers_accept_both_formats():
+    """Every solver gives the same answer for the nested lists and the packed grid"""
+    grid = Maze.from_rows(MAZE)
+    for start, goal in TEST_CASES:
+        assert bfs(MAZE, start, goal) == bfs(grid, start, goal)
+        assert dfs(MAZE, start, goal) == dfs(grid, start, goal)
+        assert astar(MAZE, start, goal) == astar(grid, start, goal)
+        assert greedy(MAZE, start, goal) == greedy(grid, start, goal)
+
+
+def test_generators_are_seeded_and_solvable():
+    for kind in GENERATORS:
+        grid = generate(kind, 41, 61, seed=7)
+        assert (grid.height, grid.width) == (41, 61)
+        assert generate(kind, 41, 61, seed=7).cells == grid.cells, f"{kind} is not deterministic"
+        for start, goal in solvable_queries(grid, 10, seed=1):
+            assert bfs(grid, start, goal)[0] is not None, f"{kind}: no path {start} -> {goal}"
+
+    # Perfect mazes are spanning trees over the 20x30 cell lattice
+    for kind in ('backtracker', 'kruskal', 'prim'):
+        grid = generate(kind, 41, 61, seed=7)
+        free = sum(grid.cells)
+        assert free == 2 * 20 * 30 - 1, f"{kind} has {free} free cells"
+        assert len(largest_component(grid)) == free
+
+    # Braiding only opens walls, adding loops, and drops the stale neighbour index
+    assert sum(generate('braided', 41, 61, seed=7).cells) > sum(generate('backtracker', 41, 61, seed=7).cells)
+    grid = generate('backtracker', 41, 61, seed=7)
+    adjacency = grid.adjacency()
+    braid(grid, 1.0, seed=7)
+    assert grid.version == 1 and grid.adjacency() is not adjacency
+
+
+def test_mazefile_round_trip():
+    grid = Maze.from_rows(MAZE)
+    with tempfile.TemporaryDirectory() as directory:
+        for encoding in ("byte", "bit"):
+            path = os.path.join(directory, f"maze_{encoding}.maze")
+            mazefile.save(grid, path, encoding)
+            assert mazefile.read_header(path) == (encoding, grid.height, grid.width)
+            loaded = mazefile.load(path)
+            assert loaded.cells == grid.cells, f"{encoding} cells differ"
+            assert loaded.fingerprint() == grid.fingerprint()
+            for start, goal in TEST_CASES:
+                assert bfs(loaded, start, goal) == bfs(grid, start, goal)
+                assert astar(loaded, start, goal) == astar(grid, start, goal)
+
+        # Byte files are mapped, not copied: read-only by default, copy-on-write with "c"
+        path = os.path.join(directory, "maze_byte.maze")
+        assert isinstance(mazefile.load(path).cells, memoryview)
+        try:
+            mazefile.load(path).set_open(1, 1, False)
+            assert False, "read-only mapping accepted a write"
+        except TypeError:
+            pass
+        private = mazefile.load(path, "c")
+        private.set_open(1, 1, False)
+        assert not private.is_open(1, 1) and mazefile.load(path).is_open(1, 1)
+
+        text_path = os.path.join(directory, "maze.txt")
+        mazefile.convert(path, text_path)
+        assert mazefile.read_text(text_path).cells == grid.cells
+        assert mazefile.to_list(mazefile.from_text(mazefile.to_text(grid))) == MAZE
+
+
+def main():
+    """Run all tests"""
+    tests = [test_round_trip, test_cell_addressing, test_adjacency_index,
+             test_set_open_keeps_adjacency_current, test_solvers_accept_both_formats,
+             test_generators_are_seeded_and_solvable,
+             test_mazefile_round_trip]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__} PASSED")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} FAILED {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the non-interactive batch solver (solve.py)
+"""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze import mazefile
+from maze.grid import Maze
+from maze.maze_map import MAZE
+from maze.test_cases import TEST_CASES
+from algorithms.bfs import bfs
+from solve import ALGORITHMS, parse_query, solve_stream
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_parse_query_formats():
+    expected = ((1, 2), (13, 12))
+    assert parse_query("1 2 13 12\n") == expected
+    assert parse_query("1,2,13,12") == expected
+    assert parse_query('{"start": [1, 2], "goal": [13, 12]}') == expected
+    assert parse_query("[[1, 2], [13, 12]]") == expected
+    assert parse_query("   ") is None and parse_query("# header") is None
+
+
+def test_stream_is_lazy_and_aligned():
+    grid = Maze.from_rows(MAZE)
+    consumed = []
+
+    def lines():
+        for start, goal in TEST_CASES:
+            consumed.append(start)
+            yield f"{start[0]} {start[1]} {goal[0]} {goal[1]}"
+        yield "not a query"
+        yield "99 99 1 1"  # Outside the maze
+
+    results = solve_stream(grid, lines(), 'astar')
+    first = next(results)
+    assert len(consumed) == 1, "solve_stream read ahead of the query it answered"
+    assert first['steps'] == bfs(grid, *TEST_CASES[0])[1] and first['expansions'] > 0
+
+    rest = list(results)
+    assert len(rest) == len(TEST_CASES) + 1
+    assert 'error' in rest[-2] and rest[-2]['line'] == len(TEST_CASES) + 1
+    assert 'error' in rest[-1]
+
+
+def test_cli_end_to_end():
+    with tempfile.TemporaryDirectory() as directory:
+        maze_path = os.path.join(directory, "maze.maze")
+        mazefile.save(MAZE, maze_path)
+        queries = "".join(f"{s[0]} {s[1]} {g[0]} {g[1]}\n" for s, g in TEST_CASES)
+        for algorithm in ALGORITHMS:
+            completed = subprocess.run([sys.executable, "solve.py", maze_path, "-a", algorithm],
+                                       input=queries, cwd=SRC_DIR, capture_output=True, text=True, check=True)
+            results = [json.loads(line) for line in completed.stdout.splitlines()]
+            assert len(results) == len(TEST_CASES), f"{algorithm}: {len(results)} results"
+            for result, (start, goal) in zip(results, TEST_CASES):
+                assert result['start'] == list(start) and result['goal'] == list(goal)
+                assert set(result) == {'start', 'goal', 'path', 'steps', 'time', 'expansions'}
+                if result['path']:
+                    assert result['path'][0] == list(start) and result['path'][-1] == list(goal)
+
+
+def main():
+    """Run all tests"""
+    tests = [test_parse_query_formats, test_stream_is_lazy_and_aligned, test_cli_end_to_end]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__} PASSED")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} FAILED {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
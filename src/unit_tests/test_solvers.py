@@ -0,0 +1,682 @@
+#!/usr/bin/env python3
+"""
+Tests for the search engines in algorithms/ beyond the five classic solvers
+"""
+
+import sys
+import os
+import random
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze.grid import Maze
+from maze.maze_map import MAZE
+from maze.test_cases import TEST_CASES
+from algorithms.bfs import bfs
+
+
+def random_maze(rng, height, width, density=0.3):
+    """Random obstacle grid used to cross-check solvers against plain BFS"""
+    rows = [["#" if rng.random() < density else "." for _ in range(width)] for _ in range(height)]
+    return Maze.from_rows(rows)
+
+
+def random_queries(rng, grid, count):
+    free = [grid.coords(i) for i in range(grid.size) if grid.cells[i]]
+    return [tuple(rng.sample(free, 2)) for _ in range(count)] if len(free) >= 2 else []
+
+
+def test_solve_many_matches_bfs():
+    """Batched queries give shortest paths, in input order"""
+    from algorithms.batch import solve_many
+
+    rng = random.Random(4)
+    grid = random_maze(rng, 20, 25)
+    starts = random_queries(rng, grid, 5)
+    pairs = [(start, goal) for start, _ in starts for _, goal in random_queries(rng, grid, 8)]
+    rng.shuffle(pairs)
+
+    results = list(solve_many(grid, pairs, algorithm="bfs"))
+    assert len(results) == len(pairs)
+    for (start, goal), (path, steps) in zip(pairs, results):
+        expected_path, expected_steps = bfs(grid, start, goal)
+        assert steps == expected_steps
+        if path:
+            assert path[0] == start and path[-1] == goal
+
+    # Interleaved starts with room for one tree at a time: trees are dropped
+    # and grown again, with the same answers
+    assert list(solve_many(grid, pairs, algorithm="bfs", max_trees=1)) == results
+
+    # Non-tree algorithms run per query but report the same format
+    for (start, goal), (path, steps) in zip(TEST_CASES, solve_many(MAZE, TEST_CASES, algorithm="greedy")):
+        assert path[0] == start and path[-1] == goal and steps == len(path) - 1
+
+
+def is_valid_path(grid, path, start, goal):
+    """Path runs from start to goal through free cells in unit steps"""
+    if path[0] != tuple(start) or path[-1] != tuple(goal):
+        return False
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        if abs(r1 - r2) + abs(c1 - c2) != 1 or not grid.is_open(r2, c2):
+            return False
+    return True
+
+
+def test_distance_field_matches_bfs():
+    """The vectorised distance field agrees with per-cell BFS"""
+    from algorithms.distance_field import distance_field, bfs_numpy
+
+    rng = random.Random(5)
+    for _ in range(20):
+        grid = random_maze(rng, rng.randint(2, 30), rng.randint(2, 30))
+        for start, goal in random_queries(rng, grid, 5):
+            dist = distance_field(grid, start)
+            path, steps = bfs(grid, start, goal)
+            assert dist[goal] == (steps if path else -1)
+            numpy_path, numpy_steps = bfs_numpy(grid, start, goal)
+            assert numpy_steps == steps
+            if path:
+                assert is_valid_path(grid, numpy_path, start, goal)
+
+
+def test_distance_oracle():
+    """Exact oracles match BFS, landmark bounds are admissible, both survive a save/load"""
+    import tempfile
+    from algorithms.oracle import DistanceOracle
+    from algorithms.astar import astar
+
+    rng = random.Random(6)
+    grid = random_maze(rng, 20, 20)
+    exact = DistanceOracle.build(grid)
+    landmarks = DistanceOracle.build(grid, landmarks=4, max_exact_cells=0)
+    assert exact.exact and not landmarks.exact
+    free = sum(grid.cells)
+    assert exact.distances.shape == (free, free)
+
+    for start, goal in random_queries(rng, grid, 30):
+        path, steps = bfs(grid, start, goal)
+        assert exact.distance(start, goal) == (steps if path else None)
+        for oracle in (exact, landmarks):
+            # The per-pair bound reads the same value as the whole bound field
+            field = oracle.lower_bound_field(goal)
+            assert oracle.lower_bound(start, goal) == field[start[0] * grid.width + start[1]]
+        if path:
+            assert landmarks.lower_bound(start, goal) <= steps
+            assert exact.lower_bound(start, goal) == steps
+            assert len(astar(grid, start, goal, heuristic=landmarks.heuristic)) - 1 == steps
+            assert len(astar(grid, start, goal, heuristic=exact.heuristic)) - 1 == steps
+
+    with tempfile.TemporaryDirectory() as directory:
+        oracle_path = os.path.join(directory, "oracle.npz")
+        landmarks.save(oracle_path)
+        loaded = DistanceOracle.load(oracle_path, maze=grid)
+        assert (loaded.distances == landmarks.distances).all()
+        try:
+            DistanceOracle.load(oracle_path, maze=MAZE)
+            assert False, "loading an oracle for a different maze should fail"
+        except ValueError:
+            pass
+
+
+def test_bidirectional_searches_are_shortest():
+    """Both bidirectional solvers return shortest paths in bfs() format"""
+    from algorithms.bidirectional import bidirectional_bfs, bidirectional_astar
+
+    rng = random.Random(7)
+    for _ in range(40):
+        grid = random_maze(rng, rng.randint(2, 25), rng.randint(2, 25), rng.choice([0.1, 0.3, 0.4]))
+        for start, goal in random_queries(rng, grid, 5):
+            path, steps = bfs(grid, start, goal)
+            for solver in (bidirectional_bfs, bidirectional_astar):
+                solver_path, solver_steps = solver(grid, start, goal)
+                assert solver_steps == steps, solver.__name__
+                assert (solver_path is None) == (path is None)
+                if path:
+                    assert is_valid_path(grid, solver_path, start, goal)
+
+    # A wall goal has no path, though its neighbours are reachable
+    grid = Maze.from_rows(MAZE)
+    assert not grid.is_open(1, 4) and bfs(grid, (1, 1), (1, 4)) == (None, 0)
+    for solver in (bidirectional_bfs, bidirectional_astar):
+        assert solver(grid, (1, 1), (1, 4)) == (None, 0), solver.__name__
+        assert solver(grid, (1, 4), (1, 4)) == bfs(grid, (1, 4), (1, 4)), solver.__name__
+
+
+def test_jump_point_search_is_shortest():
+    """JPS returns full, valid shortest paths on open and cluttered grids"""
+    from algorithms.jps import jps
+
+    rng = random.Random(8)
+    for _ in range(60):
+        grid = random_maze(rng, rng.randint(2, 25), rng.randint(2, 25), rng.choice([0.0, 0.1, 0.3, 0.45]))
+        for start, goal in random_queries(rng, grid, 5):
+            path, steps = bfs(grid, start, goal)
+            jps_path = jps(grid, start, goal)
+            assert (jps_path is None) == (path is None)
+            if path:
+                assert len(jps_path) - 1 == steps
+                assert is_valid_path(grid, jps_path, start, goal)
+
+
+def test_incremental_planner_tracks_changes():
+    """D* Lite replans match a fresh BFS after cells open and close"""
+    from algorithms.astar import astar
+    from algorithms.incremental import IncrementalPlanner
+
+    rng = random.Random(9)
+    for _ in range(30):
+        grid = random_maze(rng, rng.randint(3, 20), rng.randint(3, 20), 0.25)
+        queries = random_queries(rng, grid, 1)
+        if not queries:
+            continue
+        start, goal = queries[0]
+        planner = IncrementalPlanner(grid, start, goal)
+        for _ in range(10):
+            path = planner.replan()
+            expected_path, steps = bfs(grid, start, goal)
+            assert (path is None) == (expected_path is None)
+            if path:
+                assert len(path) - 1 == steps and is_valid_path(grid, path, start, goal)
+
+            cells = [(rng.randrange(grid.height), rng.randrange(grid.width)) for _ in range(2)]
+            planner.update_cells([(cell, rng.random() < 0.5) for cell in cells if cell not in (start, goal)])
+            if path and len(path) > 2 and grid.is_open(*path[1]):
+                start = path[1]
+                planner.move_start(start)
+
+    # Starts on a wall (test cases 4 and 10) leave through a free neighbour, as in astar()
+    grid = Maze.from_rows(MAZE)
+    for start, goal in (TEST_CASES[3], TEST_CASES[9]):
+        assert not grid.is_open(*start)
+        planner = IncrementalPlanner(grid, start, goal)
+        path = planner.replan()
+        assert path is not None and len(path) == len(astar(grid, start, goal)) == 25
+        assert path[0] == start and is_valid_path(grid, path[1:], path[1], goal)
+
+    # ... and keep doing so while the cells around them change
+    for _ in range(30):
+        grid = random_maze(rng, rng.randint(3, 15), rng.randint(3, 15), 0.3)
+        walls = [divmod(index, grid.width) for index in range(grid.size) if not grid.cells[index]]
+        free = [divmod(index, grid.width) for index in range(grid.size) if grid.cells[index]]
+        if not walls or not free:
+            continue
+        start, goal = rng.choice(walls), rng.choice(free)
+        planner = IncrementalPlanner(grid, start, goal)
+        for _ in range(10):
+            path = planner.replan()
+            expected = astar(grid, start, goal)
+            assert (path is None) == (expected is None)
+            if path:
+                assert len(path) == len(expected) and path[0] == start
+            row, col = start
+            cells = [(row + rng.choice((-1, 0, 1)), col + rng.choice((-1, 0, 1))) for _ in range(2)]
+            planner.update_cells([(cell, rng.random() < 0.5) for cell in cells
+                                  if grid.in_bounds(*cell) and cell not in (start, goal)])
+
+
+def test_search_stats():
+    from algorithms.stats import SearchStats
+    from algorithms.dfs import dfs
+    from algorithms.astar import astar, astar_search
+    from algorithms.greedy import greedy
+    from algorithms.annealing import simulated_annealing
+    from algorithms.bidirectional import bidirectional_bfs, bidirectional_astar
+    from algorithms.jps import jps, jps_search
+
+    # A 1x5 corridor: every cell expanded once, the queue never holds more than one
+    corridor = Maze.from_rows(["....."])
+    stats = SearchStats()
+    bfs(corridor, (0, 0), (0, 4), stats=stats)
+    assert stats.as_dict() == {'expanded': 5, 'generated': 7, 'peak_frontier': 1,
+                               'pushes': 5, 'pops': 5, 'reexpanded': 0, 'budget': 0, 'cutoffs': 0,
+                               'cache_hits': 0, 'cache_misses': 0}, stats
+
+    rng = random.Random(16)
+    solvers = [bfs, dfs, astar, greedy, simulated_annealing, bidirectional_bfs, bidirectional_astar, jps]
+    for _ in range(30):
+        grid = random_maze(rng, rng.randint(3, 20), rng.randint(3, 20))
+        for start, goal in random_queries(rng, grid, 3):
+            for solver in solvers:
+                stats = SearchStats()
+                result = solver(grid, start, goal, stats=stats)
+                if solver is not simulated_annealing:
+                    assert result == solver(grid, start, goal), f"{solver.__name__}: stats changed the result"
+                assert stats.expanded >= 1 and stats.pops <= stats.pushes, f"{solver.__name__}: {stats}"
+                assert 1 <= stats.peak_frontier <= stats.pushes, f"{solver.__name__}: {stats}"
+
+            stats = SearchStats()
+            _, expanded = astar_search(grid, start, goal, stats=stats)
+            assert stats.expanded == expanded and stats.reexpanded == 0
+            stats = SearchStats()
+            _, expanded = jps_search(grid, start, goal, stats=stats)
+            assert stats.expanded == expanded
+
+    # Counts accumulate over calls until reset()
+    stats = SearchStats()
+    bfs(corridor, (0, 0), (0, 4), stats=stats)
+    bfs(corridor, (0, 0), (0, 4), stats=stats)
+    assert stats.expanded == 10 and stats.peak_frontier == 1
+    stats.reset()
+    assert stats.expanded == 0
+
+
+def test_solver_registry():
+    from array import array
+    from algorithms.registry import SOLVERS, SearchResult, register, get_solver
+    from algorithms.batch import solve_many
+    from utils.analysis import AlgorithmAnalyzer
+
+    grid = Maze.from_rows(MAZE)
+    for start, goal in TEST_CASES:
+        shortest = bfs(grid, start, goal)[1]
+        for name, solver in SOLVERS.items():
+            result = solver.solve(grid, start, goal)
+            assert isinstance(result, SearchResult) and isinstance(result.path, array)
+            assert result.expansions == result.stats.expanded >= 1
+            if result.found:
+                assert is_valid_path(grid, result.coords(), start, goal), name
+                assert result.cost == len(result.path) - 1
+            if name in ('bfs', 'astar', 'bidirectional-bfs', 'bidirectional-astar', 'jps',
+                        'dijkstra', 'weighted-astar', 'ida-star', 'sma-star'):
+                assert result.cost == shortest, f"{name}: {result.cost} != {shortest}"
+    assert get_solver('A*') is SOLVERS['astar']
+
+    # Cells outside the maze are not flattened into cells inside it
+    small = Maze.from_rows(["...", "..."])
+    for name, solver in SOLVERS.items():
+        for start, goal in (((0, 0), (0, 3)), ((0, 0), (2, 0)), ((-1, 0), (1, 1))):
+            assert not solver.solve(small, start, goal).found, name
+    assert list(solve_many(small, [((0, 0), (0, 3))], 'greedy')) == [(None, 0)]
+
+    # A new engine only needs a find_path function to be run by the harness
+    def reversed_bfs(maze, start, goal, stats=None):
+        path = bfs(maze, goal, start, stats=stats)[0]
+        return path[::-1] if path else None
+
+    register('reversed-bfs', 'Reversed BFS', reversed_bfs)
+    try:
+        analyzer = AlgorithmAnalyzer(grid, TEST_CASES[:2], repeats=1, warmup=0,
+                                     algorithms=['bfs', 'reversed-bfs'])
+        results = analyzer.run_comprehensive_analysis()
+        for case in results.values():
+            assert case['Reversed BFS']['steps'] == case['BFS']['steps']
+            assert case['Reversed BFS']['visited_count'] > 0
+    finally:
+        del SOLVERS['reversed-bfs']
+
+
+def test_weighted_search():
+    """Dijkstra and weighted A* find cheapest paths over a cost layer"""
+    from heapq import heappush, heappop
+    from algorithms.weighted import BucketQueue, dijkstra, weighted_astar, weighted_greedy
+    from algorithms.registry import SOLVERS
+    from maze.terrain import add_slow_zones, path_cost
+
+    def cheapest(grid, start, goal):
+        # Reference Dijkstra over (row, col) with a binary heap
+        distances, heap = {start: 0}, [(0, start)]
+        while heap:
+            distance, (row, col) = heappop(heap)
+            if distance > distances[row, col]:
+                continue
+            for cell in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if grid.is_open(*cell) and distance + grid.cost(*cell) < distances.get(cell, float('inf')):
+                    distances[cell] = distance + grid.cost(*cell)
+                    heappush(heap, (distances[cell], cell))
+        return distances.get(tuple(goal))
+
+    queue = BucketQueue(4)
+    for priority, item in ((2, 'b'), (0, 'a'), (3, 'c'), (2, 'd')):
+        queue.push(priority, item)
+    assert [queue.pop() for _ in range(len(queue))] == [(0, 'a'), (2, 'd'), (2, 'b'), (3, 'c')]
+
+    rng = random.Random(9)
+    for _ in range(30):
+        grid = random_maze(rng, rng.randint(2, 25), rng.randint(2, 25), rng.choice([0.0, 0.2, 0.35]))
+        add_slow_zones(grid, rng.randint(0, 6), rng.randint(1, 6), rng.randint(2, 50), seed=rng.random())
+        for start, goal in random_queries(rng, grid, 5):
+            expected = cheapest(grid, start, goal)
+            for solver in (dijkstra, weighted_astar, weighted_greedy):
+                path, cost = solver(grid, start, goal)
+                assert (path is None) == (expected is None), solver.__name__
+                if path:
+                    assert is_valid_path(grid, path, start, goal)
+                    assert cost == path_cost(grid, path)
+                    if solver is weighted_greedy:
+                        assert cost >= expected
+                    else:
+                        assert cost == expected, f"{solver.__name__}: {cost} != {expected}"
+            if expected is not None:
+                assert SOLVERS['weighted-astar'].solve(grid, start, goal).cost == expected
+
+
+def test_flow_field_scheduler():
+    """Flow fields give shortest next steps and the scheduler's LRU respects its byte cap"""
+    from algorithms.flow_field import FlowField, FlowFieldScheduler
+    from algorithms.weighted import dijkstra
+    from maze.terrain import add_slow_zones
+
+    rng = random.Random(10)
+    for _ in range(20):
+        grid = random_maze(rng, rng.randint(2, 20), rng.randint(2, 20), rng.choice([0.1, 0.3]))
+        if rng.random() < 0.5:
+            add_slow_zones(grid, rng.randint(1, 4), 4, rng.randint(2, 9), seed=rng.random())
+        for start, goal in random_queries(rng, grid, 5):
+            field = FlowField(grid, goal)
+            cost = dijkstra(grid, start, goal)[1] if dijkstra(grid, start, goal)[0] else None
+            assert field.distance(start) == cost
+            if cost is None:
+                assert field.next_step(start) is None and field.path(start) is None
+                continue
+            path = field.path(start)
+            assert is_valid_path(grid, path, start, goal)
+            assert sum(grid.cost(*cell) for cell in path[1:]) == cost
+            assert field.next_step(start) == path[1] and field.next_step(goal) == goal
+
+    grid = Maze.from_rows(MAZE)
+    # A wall goal gives an empty field, weighted or not: nothing walks into the wall
+    for costs in (None, bytes([2]) * grid.size):
+        grid.set_costs(costs)
+        field = FlowField(grid, (1, 4))
+        assert all(distance == -1 for distance in field.distances) and not any(field.moves)
+        for cell in ((1, 1), (1, 3), (1, 4)):
+            assert field.path(cell) is None and field.next_step(cell) is None and field.distance(cell) is None
+    grid.set_costs(None)
+
+    goals = [goal for _, goal in TEST_CASES[:3]]
+    one_field = FlowField(grid, goals[0]).nbytes
+    scheduler = FlowFieldScheduler(grid, max_bytes=2 * one_field)
+    agents = [(start, goals[i % 3]) for i, (start, _) in enumerate(TEST_CASES)]
+    steps = scheduler.step_all(agents)
+    for (start, goal), step in zip(agents, steps):
+        path, distance = bfs(grid, start, goal)
+        if path is None:
+            assert step is None
+        else:
+            assert step == goal if start == goal else bfs(grid, step, goal)[1] == distance - 1
+    assert len(scheduler.fields) == 2 and scheduler.nbytes <= 2 * one_field
+    assert scheduler.evictions == scheduler.misses - 2 and scheduler.hits == 0
+
+    scheduler.field(goals[2])
+    assert scheduler.hits == 1
+    open_cell = next((r, c) for r, row in enumerate(MAZE) for c, ch in enumerate(row) if ch == ".")
+    grid.set_open(*open_cell, False)  # Any change to the maze drops the cached fields
+    scheduler.field(goals[2])
+    assert scheduler.hits == 1 and len(scheduler.fields) == 1
+
+
+def test_path_cache():
+    """Cached queries and suffixes of optimal paths are reused until the maze changes"""
+    from algorithms.path_cache import PathCache
+    from algorithms.registry import SOLVERS
+    from algorithms.stats import SearchStats
+    from utils.analysis import AlgorithmAnalyzer
+
+    grid = Maze.from_rows(MAZE)
+    cache = PathCache(max_entries=4)
+    start, goal = TEST_CASES[0]
+    first = cache.solve('astar', grid, start, goal)
+    assert cache.solve('astar', Maze.from_rows(MAZE), start, goal) is first  # Same content, same entry
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Any cell on an optimal path reaches goal along the rest of it
+    middle = first.coords()[len(first.path) // 2]
+    suffix = cache.solve('astar', grid, middle, goal)
+    assert cache.subpath_hits == 1 and suffix.coords() == first.coords()[len(first.path) // 2:]
+    assert suffix.cost == bfs(grid, middle, goal)[1]
+    cache.solve('greedy', grid, start, goal)
+    cache.solve('greedy', grid, middle, goal)  # Greedy paths are not optimal: no suffix reuse
+    assert cache.misses == 3 and abs(cache.hit_rate - 2 / 5) < 1e-9
+
+    for other_start, other_goal in TEST_CASES[1:4]:
+        cache.solve('bfs', grid, other_start, other_goal)
+    assert len(cache.entries) == 4 and cache.evictions == 2
+    assert cache.get('astar', grid, start, goal) is None  # Least recently used went first
+
+    cell = next(cell for cell in first.coords()[1:-1])
+    cache.solve('bfs', grid, start, goal)
+    grid.set_open(*cell, False)
+    result = cache.solve('bfs', grid, start, goal)
+    assert cell not in (result.coords() or [])
+    assert result.cost == bfs(grid, start, goal)[1]
+
+    # Lookups are counted in the search's SearchStats, next to its counters
+    cache = PathCache()
+    stats = SearchStats()
+    first = cache.solve('astar', grid, start, goal, stats)
+    assert first.stats is stats and (stats.cache_hits, stats.cache_misses) == (0, 1) and stats.expanded > 0
+    expanded = stats.expanded
+    assert cache.solve('astar', grid, start, goal, stats) is first
+    assert (stats.cache_hits, stats.cache_misses, stats.expanded) == (1, 1, expanded)
+    assert cache.solve('dfs', grid, start, goal).stats.cache_misses == 1
+
+    # A second analysis of the same maze reuses every measurement
+    cache = PathCache()
+    for _ in range(2):
+        analyzer = AlgorithmAnalyzer(Maze.from_rows(MAZE), TEST_CASES[:2], repeats=1, warmup=0,
+                                     algorithms=['bfs', 'astar'], cache=cache)
+        results = analyzer.run_comprehensive_analysis()
+    assert all(run['cached'] for case in results.values() for run in case.values())
+    assert cache.hits == 4 and cache.misses == 4
+
+
+def test_simulated_annealing_chains():
+    """Seeded annealing is repeatable, returns loop-free paths and matches its process-pool run"""
+    from algorithms.annealing import simulated_annealing
+    from algorithms.stats import SearchStats
+
+    grid = Maze.from_rows(MAZE)
+    solved = 0
+    for start, goal in TEST_CASES:
+        reachable = bfs(grid, start, goal)[0] is not None
+        for seed in range(3):
+            path, steps = simulated_annealing(grid, start, goal, seed=seed)
+            assert (path, steps) == simulated_annealing(grid, start, goal, seed=seed)
+            if path:
+                solved += 1
+                assert reachable and is_valid_path(grid, path, start, goal)
+                assert len(set(path)) == len(path) == steps + 1
+    assert solved >= 0.9 * 3 * sum(bfs(grid, *case)[0] is not None for case in TEST_CASES)
+
+    # Every chain gets max_iterations before the search gives up
+    start, goal = TEST_CASES[0]
+    stats = SearchStats()
+    assert simulated_annealing(grid, start, goal, max_iterations=1, chains=3, stats=stats) == ([], 0)
+    assert stats.generated == 3
+
+    assert (simulated_annealing(grid, start, goal, seed=5, chains=4, workers=2)
+            == simulated_annealing(grid, start, goal, seed=5, chains=4))
+
+
+def test_greedy_queues_each_cell_once():
+    """Greedy finds valid paths, queues every cell at most once and breaks ties by insertion order"""
+    from algorithms.greedy import greedy
+    from algorithms.stats import SearchStats
+
+    rng = random.Random(11)
+    for _ in range(40):
+        grid = random_maze(rng, rng.randint(2, 25), rng.randint(2, 25), rng.choice([0.0, 0.2, 0.35]))
+        for start, goal in random_queries(rng, grid, 5):
+            stats = SearchStats()
+            path = greedy(grid, start, goal, stats=stats)
+            assert (path is None) == (bfs(grid, start, goal)[0] is None)
+            if path:
+                assert is_valid_path(grid, path, start, goal)
+            assert stats.pushes <= sum(grid.cells) and stats.reexpanded == 0
+            assert stats.peak_frontier <= stats.pushes
+
+    # Both neighbours of the start are one step closer to goal: the first one
+    # pushed (Down, before Right) is expanded first
+    open_room = Maze.from_rows(["...", "...", "..."])
+    assert greedy(open_room, (0, 0), (2, 2)) == [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]
+
+
+def test_memory_bounded_searches():
+    """IDA* and SMA* find shortest paths, SMA* never holds more than its budget"""
+    from algorithms.memory_bounded import ida_star, sma_star
+    from algorithms.stats import SearchStats
+
+    rng = random.Random(23)
+    for _ in range(60):
+        grid = random_maze(rng, rng.randint(2, 12), rng.randint(2, 12), rng.choice([0.0, 0.2, 0.35]))
+        for start, goal in random_queries(rng, grid, 3):
+            reference, shortest = bfs(grid, start, goal)
+            stats = SearchStats()
+            path, peak = ida_star(grid, start, goal, stats=stats, max_expansions=20_000)
+            assert (path is None) == (not reference) and stats.cutoffs == 0
+            if path:
+                assert is_valid_path(grid, path, start, goal) and len(path) - 1 == shortest
+                assert len(path) <= peak <= sum(grid.cells) and stats.expanded <= sum(grid.cells)
+
+            # With room for every free cell SMA* is A*; with less it may
+            # re-expand or fail, but stays within the budget
+            path, peak = sma_star(grid, start, goal, grid.size)
+            if path:
+                assert is_valid_path(grid, path, start, goal) and len(path) - 1 == shortest
+            for budget in (1, 4, 16):
+                stats = SearchStats()
+                path, peak = sma_star(grid, start, goal, budget, stats=stats)
+                assert peak <= budget and stats.peak_frontier == peak and stats.budget == budget
+                assert stats.cutoffs == (path is None) or not reference
+                if path:
+                    assert is_valid_path(grid, path, start, goal) and len(path) <= budget
+
+    # The goal is walled off from above, so the cells straight towards it
+    # lead nowhere; with 9 nodes some must be forgotten and expanded again
+    pocket = Maze.from_rows([".#...", "#....", "....#", "...#.", "....."])
+    stats = SearchStats()
+    path, peak = sma_star(pocket, (1, 4), (3, 4), 9, stats=stats)
+    assert len(path) - 1 == bfs(pocket, (1, 4), (3, 4))[1] and peak <= 9
+    assert stats.reexpanded > 0
+
+    # Out of expansions, IDA* gives up and says so
+    stats = SearchStats()
+    assert ida_star(pocket, (1, 4), (3, 4), stats=stats, max_expansions=3)[0] is None
+    assert stats.cutoffs == 1 and stats.budget == 3
+
+
+def test_sma_star_budget_boundary():
+    """On a maze without loops SMA* needs exactly shortest depth + 1 nodes"""
+    from algorithms.memory_bounded import sma_star
+    from algorithms.stats import SearchStats
+    from maze.generator import generate, solvable_queries
+
+    for seed in range(8):
+        maze = generate('backtracker', 15, 15, seed=seed)
+        for start, goal in solvable_queries(maze, 4, seed=seed):
+            shortest = bfs(maze, start, goal)[1]
+            stats = SearchStats()
+            assert sma_star(maze, start, goal, shortest, stats=stats)[0] is None
+            assert stats.cutoffs == 1
+            path, peak = sma_star(maze, start, goal, shortest + 1)
+            assert len(path) - 1 == shortest and peak == shortest + 1
+
+    # Routes meet here, and a shortest path fits in depth + 1 = 6 nodes
+    # only if the branch forgotten first is taken up again in f order
+    loops = Maze.from_rows([".#..", "..#.", "#...", "....", "#..#", "....", "...#", "...."])
+    assert sma_star(loops, (2, 1), (0, 2), 5)[0] is None
+    assert len(sma_star(loops, (2, 1), (0, 2), 6)[0]) == 6
+
+
+def test_solvers_keep_flat_search_state():
+    """BFS, A* and greedy hold a few bytes per cell, not a dict entry per reached cell"""
+    from algorithms.astar import astar
+    from algorithms.greedy import greedy
+    from algorithms.dfs import dfs
+    from utils.benchmark import measure_memory
+
+    grid = Maze.from_rows(["." * 150] * 150)
+    grid.adjacency()
+    for solver in (bfs, astar, greedy):
+        _, _, peak = measure_memory(solver, (grid, (0, 0), (149, 149)))
+        assert peak < 16 * grid.size, f"{solver.__name__}: {peak / grid.size:.1f} bytes per cell"
+
+    # Parents walked back from the goal still give the same paths
+    rng = random.Random(24)
+    for _ in range(30):
+        grid = random_maze(rng, rng.randint(2, 20), rng.randint(2, 20))
+        for start, goal in random_queries(rng, grid, 4):
+            shortest = bfs(grid, start, goal)
+            path, found, _ = dfs(grid, start, goal)
+            assert found == (shortest[0] is not None)
+            if found:
+                assert is_valid_path(grid, path, start, goal)
+                assert len(astar(grid, start, goal)) - 1 == shortest[1]
+
+
+def test_search_workspace_reuse():
+    """Every solver gives the same answer with a reused SearchWorkspace as without one"""
+    from algorithms.registry import SOLVERS
+    from algorithms.stats import SearchStats
+    from algorithms.workspace import SearchWorkspace
+    from algorithms.batch import solve_many
+    from algorithms.annealing import simulated_annealing
+
+    rng = random.Random(25)
+    for _ in range(15):
+        grid = random_maze(rng, rng.randint(2, 14), rng.randint(2, 14))
+        workspace = SearchWorkspace(grid)
+        for start, goal in random_queries(rng, grid, 4) + [((0, 0), (0, 0))]:
+            for name, solver in SOLVERS.items():
+                fresh, reused = SearchStats(), SearchStats()
+                expected = solver(grid, start, goal, fresh)
+                path = solver(grid, start, goal, reused, workspace)
+                if name == 'annealing':
+                    # Unseeded here; seeded runs are compared below
+                    assert path is None or is_valid_path(grid, path, start, goal)
+                    continue
+                assert path == expected, name
+                assert fresh.as_dict() == reused.as_dict(), name
+            if start != goal:
+                assert (simulated_annealing(grid, start, goal, seed=5, workspace=workspace) ==
+                        simulated_annealing(grid, start, goal, seed=5))
+        assert list(solve_many(grid, [((0, 0), (0, 0))], 'dfs')) == [([(0, 0)], 0)]
+
+    # A new search starts with every cell unreached, including across the
+    # wrap of the generation counter
+    grid = Maze.from_rows(["....", ".##.", "...."])
+    workspace = SearchWorkspace(grid)
+    workspace.generation = 2 ** 32 - 4
+    for _ in range(3):
+        assert bfs(grid, (0, 0), (2, 3), workspace=workspace) == bfs(grid, (0, 0), (2, 3))
+    assert workspace.generation == 4
+
+    # g scores that may pass 2**31 - 1 get a 64-bit array of their own
+    assert workspace.scores_up_to(2 ** 31 - 1) is workspace.scores
+    wide = workspace.scores_up_to(255 * 2 ** 24)
+    assert wide.typecode == 'q' and len(wide) == grid.size
+    wide[0] = 255 * 2 ** 24
+
+    try:
+        bfs(Maze.from_rows(["..."]), (0, 0), (0, 2), workspace=workspace)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("a workspace for another maze shape must be rejected")
+
+
+def main():
+    """Run all tests"""
+    tests = [test_solve_many_matches_bfs, test_distance_field_matches_bfs,
+             test_distance_oracle, test_bidirectional_searches_are_shortest,
+             test_jump_point_search_is_shortest, test_incremental_planner_tracks_changes,
+             test_search_stats, test_solver_registry, test_weighted_search,
+             test_flow_field_scheduler, test_path_cache, test_simulated_annealing_chains,
+             test_greedy_queues_each_cell_once, test_memory_bounded_searches,
+             test_sma_star_budget_boundary,
+             test_solvers_keep_flat_search_state, test_search_workspace_reuse]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__} PASSED")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} FAILED {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
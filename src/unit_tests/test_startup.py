@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Startup tests: a single solve must not load the analysis stack
+
+The millisecond budget itself is checked by benchmarks/startup.py, not
+here, since a wall-clock limit fails on a busy machine.
+"""
+
+import sys
+import os
+import subprocess
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.startup import measure_startup, SRC_DIR
+
+
+def test_single_solve_skips_analysis_stack():
+    """No numpy, matplotlib, seaborn, pandas or utils.analysis after import main + one solve"""
+    _, _, heavy = measure_startup(runs=1)
+    assert not heavy, f"Single solve imported {heavy}"
+
+
+def test_registry_imports_engines_lazily():
+    """A BFS solve through the registry loads algorithms.bfs and no other engine"""
+    code = ("import sys, main; main.SOLVERS['bfs'].solve(main.GRID, *main.TEST_CASES[0]); "
+            "print(sorted(m for m in sys.modules if m.startswith('algorithms.')))")
+    completed = subprocess.run([sys.executable, '-c', code], cwd=SRC_DIR,
+                               capture_output=True, text=True, check=True)
+    loaded = set(eval(completed.stdout))
+    engines = {'algorithms.dfs', 'algorithms.astar', 'algorithms.greedy', 'algorithms.annealing',
+               'algorithms.bidirectional', 'algorithms.jps', 'algorithms.weighted',
+               'algorithms.memory_bounded', 'algorithms.path_cache'}
+    assert 'algorithms.bfs' in loaded
+    assert not loaded & engines, f"BFS solve imported {sorted(loaded & engines)}"
+
+
+def test_maze_map_import_is_silent():
+    completed = subprocess.run([sys.executable, '-c', 'import maze.maze_map'], cwd=SRC_DIR,
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout == "", f"Importing maze.maze_map printed {completed.stdout!r}"
+
+
+def main():
+    """Run all tests"""
+    tests = [test_single_solve_skips_analysis_stack, test_registry_imports_engines_lazily,
+             test_maze_map_import_is_silent]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__} PASSED")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__} FAILED {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
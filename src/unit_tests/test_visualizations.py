@@ -49,6 +49,18 @@ def test_visualizations():
                     'steps': 0,
                     'time_taken': 0.001,
                     'peak_memory': 5120
+                },
+                'Bidirectional BFS': {
+                    'path_found': True,
+                    'steps': 24,
+                    'time_taken': 0.0008,
+                    'peak_memory': 14336
+                },
+                'Bidirectional A*': {
+                    'path_found': True,
+                    'steps': 24,
+                    'time_taken': 0.002,
+                    'peak_memory': 10240
                 }
             },
             'Test Case 2': {
@@ -81,6 +93,18 @@ def test_visualizations():
                     'steps': 0,
                     'time_taken': 0.001,
                     'peak_memory': 5120
+                },
+                'Bidirectional BFS': {
+                    'path_found': True,
+                    'steps': 22,
+                    'time_taken': 0.0008,
+                    'peak_memory': 14336
+                },
+                'Bidirectional A*': {
+                    'path_found': True,
+                    'steps': 22,
+                    'time_taken': 0.002,
+                    'peak_memory': 10240
                 }
             }
         }
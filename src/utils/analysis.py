@@ -1,128 +1,159 @@
-import time
-import tracemalloc
-import gc
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Any
-import seaborn as sns
-from algorithms.bfs import bfs
-from algorithms.dfs import dfs
-from algorithms.astar import astar
-from algorithms.greedy import greedy
-from algorithms.annealing import simulated_annealing
+from typing import Dict, List, Tuple, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from utils.benchmark import benchmark, summarize, DEFAULT_REPEATS, DEFAULT_WARMUP
+from algorithms.registry import get_solver
+from algorithms.stats import SearchStats
+from algorithms.path_cache import PathCache
 from maze.maze_map import MAZE
+from maze.grid import Maze
 from maze.test_cases import TEST_CASES
 
+# Registered solvers (algorithms.registry) compared by default
+DEFAULT_ALGORITHMS = ['bfs', 'dfs', 'astar', 'greedy', 'annealing', 'bidirectional-bfs', 'bidirectional-astar']
+
+# Measured queries kept across analyze_results() calls, so running the
+# analysis again on an unchanged maze reuses every measurement
+ANALYSIS_CACHE = PathCache()
+
 class AlgorithmAnalyzer:
-    def __init__(self):
-        self.algorithms = {
-            'BFS': bfs,
-            'DFS': dfs,
-            'A*': astar,
-            'Greedy': greedy,
-            'Simulated Annealing': simulated_annealing
-        }
+    def __init__(self, maze=None, test_cases: Optional[List[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+                 repeats: int = DEFAULT_REPEATS, warmup: int = DEFAULT_WARMUP,
+                 algorithms: Optional[List[str]] = None, cache: Optional[PathCache] = None):
+        # Display label -> Solver, for any names or labels in the registry
+        solvers = [get_solver(key) for key in (DEFAULT_ALGORITHMS if algorithms is None else algorithms)]
+        self.algorithms = {solver.label: solver for solver in solvers}
         self.results = {}
-        
-    def run_single_algorithm(self, algorithm_name: str, algorithm_func, start: Tuple[int, int], goal: Tuple[int, int]) -> Dict[str, Any]:
-        """Run a single algorithm and collect performance metrics"""
-        # Force garbage collection before measurement
-        gc.collect()
-        
-        # Start memory tracking
-        tracemalloc.start()
-        
-        # Time the algorithm execution
-        start_time = time.perf_counter()
-        result = algorithm_func(MAZE, start, goal)
-        end_time = time.perf_counter()
-        time_taken = end_time - start_time
-        
-        # Get memory usage
-        current_memory, peak_memory = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        
-        # Parse results based on algorithm return format
-        path = None
-        steps = 0
-        visited_count = 0
-        path_found = False
-        
-        if algorithm_name == 'BFS':
-            if result and result[0]:
-                path, steps = result
-                path_found = True
-        elif algorithm_name == 'DFS':
-            if result and result[0]:
-                path, path_found, visited_count = result
-                steps = len(path) - 1 if path else 0
-        elif algorithm_name == 'A*':
-            if result:
-                path = result
-                steps = len(path) - 1 if path else 0
-                path_found = True
-        elif algorithm_name == 'Greedy':
-            if result:
-                path = result
-                steps = len(path) - 1 if path else 0
-                path_found = True
-        elif algorithm_name == 'Simulated Annealing':
-            if result and result[0]:
-                path, steps = result
-                path_found = True
+        # Solvers read the packed grid; MAZE stays the human-readable source
+        self.maze = Maze.coerce(MAZE if maze is None else maze)
+        self.test_cases = TEST_CASES if test_cases is None else test_cases
+        # Timed runs per measurement, after this many untimed warmup runs
+        self.repeats = repeats
+        self.warmup = warmup
+        # Optional PathCache of measured SearchResults (serial runs only)
+        self.cache = cache
+        
+    def run_single_algorithm(self, algorithm_name: str, solver, start: Tuple[int, int], goal: Tuple[int, int]) -> Dict[str, Any]:
+        """Run a single algorithm and collect performance metrics
+        
+        solver is a registered Solver (or its name), whose find_path returns
+        the path or None whatever the algorithm. time_taken is the median of
+        self.repeats untraced runs; memory comes from one separate run under
+        tracemalloc (see utils/benchmark.py), and search counters
+        (SearchStats) from one more run, so that counting does not touch the
+        timed runs. With a cache, a query measured before on the same maze
+        content is answered from it without running anything.
+        """
+        solver = get_solver(solver)
+        search = None
+        if self.cache is not None:
+            search = self.cache.get(solver, self.maze, start, goal, subpaths=False)
+        cached = search is not None and search.measurement is not None
+        if not cached:
+            measurement = benchmark(solver.find_path, (self.maze, start, goal), self.repeats, self.warmup)
+            search = solver.solve(self.maze, start, goal, SearchStats())
+            search.measurement = measurement
+            if self.cache is not None:
+                self.cache.put(solver, self.maze, start, goal, search)
+        measurement = search.measurement
+        timing = measurement['timing']
+        time_taken = timing['median']
+        current_memory = measurement['current_memory']
+        peak_memory = measurement['peak_memory']
+        path = measurement['result']
         
         return {
             'algorithm': algorithm_name,
             'start': start,
             'goal': goal,
-            'path_found': path_found,
+            'path_found': bool(path),
             'path': path,
-            'steps': steps,
+            'steps': len(path) - 1 if path else 0,
             'time_taken': time_taken,
+            'time_p95': timing['p95'],
+            'time_mad': timing['mad'],
+            'time_samples': measurement['samples'],
             'current_memory': current_memory,
             'peak_memory': peak_memory,
-            'visited_count': visited_count
+            'visited_count': search.expansions,
+            'search_stats': search.stats.as_dict(),
+            'cached': cached
         }
     
     def run_all_algorithms_on_test_case(self, test_case_idx: int) -> Dict[str, Dict[str, Any]]:
         """Run all algorithms on a specific test case"""
-        start, goal = TEST_CASES[test_case_idx]
         results = {}
         
-        for algorithm_name, algorithm_func in self.algorithms.items():
-            try:
-                result = self.run_single_algorithm(algorithm_name, algorithm_func, start, goal)
-                results[algorithm_name] = result
-            except Exception as e:
-                print(f"Error running {algorithm_name} on test case {test_case_idx + 1}: {e}")
-                results[algorithm_name] = {
-                    'algorithm': algorithm_name,
-                    'start': start,
-                    'goal': goal,
-                    'path_found': False,
-                    'path': None,
-                    'steps': 0,
-                    'time_taken': 0,
-                    'current_memory': 0,
-                    'peak_memory': 0,
-                    'visited_count': 0,
-                    'error': str(e)
-                }
+        for algorithm_name in self.algorithms:
+            results[algorithm_name] = self.run_test_case_task(test_case_idx, algorithm_name)
         
         return results
     
-    def run_comprehensive_analysis(self) -> Dict[str, Any]:
-        """Run all algorithms on all test cases"""
+    def run_test_case_task(self, test_case_idx: int, algorithm_name: str) -> Dict[str, Any]:
+        """Run one algorithm on one test case, recording any error in the result"""
+        start, goal = self.test_cases[test_case_idx]
+        try:
+            return self.run_single_algorithm(algorithm_name, self.algorithms[algorithm_name], start, goal)
+        except Exception as e:
+            print(f"Error running {algorithm_name} on test case {test_case_idx + 1}: {e}")
+            return {
+                'algorithm': algorithm_name,
+                'start': start,
+                'goal': goal,
+                'path_found': False,
+                'path': None,
+                'steps': 0,
+                'time_taken': 0,
+                'current_memory': 0,
+                'peak_memory': 0,
+                'visited_count': 0,
+                'search_stats': SearchStats().as_dict(),
+                'error': str(e)
+            }
+    
+    def run_comprehensive_analysis(self, workers: Optional[int] = None) -> Dict[str, Any]:
+        """Run all algorithms on all test cases.
+        
+        With workers > 1 the (test case, algorithm) runs are spread over a
+        process pool. Each worker process receives the maze once, when it
+        starts, and only indices travel with each task. tracemalloc runs
+        inside each worker, so memory figures are per process and never see
+        another run's allocations. Results come back in the same order as a
+        serial run, whichever worker finishes first. Worker processes do not
+        consult self.cache.
+        """
+        if workers is not None and workers > 1:
+            return self._run_comprehensive_analysis_parallel(workers)
+        
         all_results = {}
         
-        for test_case_idx in range(len(TEST_CASES)):
+        for test_case_idx in range(len(self.test_cases)):
             test_case_results = self.run_all_algorithms_on_test_case(test_case_idx)
             all_results[f'Test Case {test_case_idx + 1}'] = test_case_results
         
         self.results = all_results
         return all_results
     
+    def _run_comprehensive_analysis_parallel(self, workers: int) -> Dict[str, Any]:
+        tasks = [(test_case_idx, algorithm_name)
+                 for test_case_idx in range(len(self.test_cases))
+                 for algorithm_name in self.algorithms]
+        costs = self.maze.costs
+        maze_state = (self.maze.height, self.maze.width, bytes(self.maze.cells),
+                      bytes(costs) if costs is not None else None)
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(maze_state, self.test_cases, self.algorithms,
+                                           self.repeats, self.warmup)) as pool:
+            futures = [pool.submit(_run_worker_task, test_case_idx, algorithm_name)
+                       for test_case_idx, algorithm_name in tasks]
+            # Collect in submission order so the result layout is deterministic
+            all_results = {}
+            for (test_case_idx, algorithm_name), future in zip(tasks, futures):
+                all_results.setdefault(f'Test Case {test_case_idx + 1}', {})[algorithm_name] = future.result()
+        
+        self.results = all_results
+        return all_results
+    
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate comprehensive metrics for all algorithms"""
         if not self.results:
@@ -136,6 +167,9 @@ class AlgorithmAnalyzer:
             'overall_performance': {}
         }
         
+        # All timed runs per algorithm, pooled across test cases
+        time_distributions = {algorithm_name: [] for algorithm_name in self.algorithms.keys()}
+        
         # Initialize metrics for each algorithm
         for algorithm_name in self.algorithms.keys():
             metrics['completeness'][algorithm_name] = []
@@ -152,13 +186,15 @@ class AlgorithmAnalyzer:
                 # Cost optimality (steps taken)
                 metrics['cost_optimality'][algorithm_name].append(result['steps'])
                 
-                # Time complexity (time taken)
+                # Time complexity (median time taken, plus every timed run)
                 metrics['time_complexity'][algorithm_name].append(result['time_taken'])
+                time_distributions[algorithm_name].extend(result.get('time_samples') or [result['time_taken']])
                 
                 # Space complexity (memory usage)
                 metrics['space_complexity'][algorithm_name].append(result['peak_memory'])
         
         # Calculate averages and statistics
+        import numpy as np
         for metric_type in metrics:
             if metric_type != 'overall_performance':
                 for algorithm_name in metrics[metric_type]:
@@ -171,6 +207,13 @@ class AlgorithmAnalyzer:
                         'max': np.max(values)
                     }
         
+        # Robust statistics over the full timing distributions
+        for algorithm_name, samples in time_distributions.items():
+            if samples:
+                timing = summarize(samples)
+                metrics['time_complexity'][algorithm_name].update(
+                    median=timing['median'], p95=timing['p95'], mad=timing['mad'], runs=timing['count'])
+        
         return metrics
     
     def create_performance_comparison_charts(self, save_path: str = "performance_analysis"):
@@ -181,6 +224,8 @@ class AlgorithmAnalyzer:
         metrics = self.calculate_metrics()
         
         # Set up the plotting style
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         try:
             plt.style.use('seaborn-v0_8')
         except:
@@ -221,9 +266,9 @@ class AlgorithmAnalyzer:
                            f'{v:.1f}', ha='center', va='bottom', fontsize=11, fontweight='bold')
         
         # 3. Time Complexity Comparison (Algorithm vs Average Time)
-        time_data = [metrics['time_complexity'][alg]['mean'] * 1000000 for alg in self.algorithms.keys()]  # Convert to microseconds
+        time_data = [metrics['time_complexity'][alg]['median'] * 1000000 for alg in self.algorithms.keys()]  # Convert to microseconds
         bars3 = axes[1, 0].bar(self.algorithms.keys(), time_data, color='lightgreen', alpha=0.7)
-        axes[1, 0].set_title('Time Complexity: Average Execution Time', fontweight='bold', fontsize=14, pad=20)
+        axes[1, 0].set_title('Time Complexity: Median Execution Time', fontweight='bold', fontsize=14, pad=20)
         axes[1, 0].set_ylabel('Time (microseconds)', fontsize=12)
         axes[1, 0].tick_params(axis='x', rotation=45, labelsize=11)
         axes[1, 0].tick_params(axis='y', labelsize=11)
@@ -268,6 +313,8 @@ class AlgorithmAnalyzer:
         algorithms = list(self.algorithms.keys())
         
         # Set up the plotting style
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         try:
             plt.style.use('seaborn-v0_8')
         except:
@@ -380,12 +427,14 @@ class AlgorithmAnalyzer:
             f.write("\n")
             
             # Time Complexity Analysis
-            f.write("3. TIME COMPLEXITY ANALYSIS (Average Execution Time):\n")
+            f.write("3. TIME COMPLEXITY ANALYSIS (Median Execution Time):\n")
             f.write("-" * 50 + "\n")
             for alg in self.algorithms.keys():
-                avg_time = metrics['time_complexity'][alg]['mean'] * 1000000  # Convert to microseconds
-                std_time = metrics['time_complexity'][alg]['std'] * 1000000
-                f.write(f"{alg:20}: {avg_time:6.0f} +/- {std_time:.0f} us\n")
+                timing = metrics['time_complexity'][alg]
+                median_time = timing['median'] * 1000000  # Convert to microseconds
+                p95_time = timing['p95'] * 1000000
+                mad_time = timing['mad'] * 1000000
+                f.write(f"{alg:20}: {median_time:6.0f} us median, {p95_time:.0f} us p95, MAD {mad_time:.0f} us\n")
             f.write("\n")
             
             # Space Complexity Analysis
@@ -397,6 +446,22 @@ class AlgorithmAnalyzer:
                 f.write(f"{alg:20}: {avg_memory:6.1f} +/- {std_memory:.1f} KB\n")
             f.write("\n")
             
+            # Search effort behind the timings
+            f.write("5. SEARCH EFFORT (Average Nodes Expanded / Peak Frontier):\n")
+            f.write("-" * 50 + "\n")
+            for alg in self.algorithms.keys():
+                runs = [case[alg] for case in self.results.values() if alg in case]
+                expanded = sum(run['visited_count'] for run in runs) / max(len(runs), 1)
+                frontier = sum(run['search_stats']['peak_frontier'] for run in runs if 'search_stats' in run) / max(len(runs), 1)
+                f.write(f"{alg:20}: {expanded:6.1f} expanded, {frontier:.1f} peak frontier\n")
+            f.write("\n")
+            
+            if self.cache is not None:
+                reused = sum(run.get('cached', False) for case in self.results.values() for run in case.values())
+                total = sum(len(case) for case in self.results.values())
+                f.write(f"Path cache: {reused} of {total} runs reused, "
+                        f"{self.cache.hit_rate:.0%} hit rate over {len(self.cache.entries)} cached queries\n\n")
+            
             # Detailed Results for Each Test Case
             f.write("DETAILED RESULTS BY TEST CASE:\n")
             f.write("=" * 50 + "\n\n")
@@ -416,15 +481,28 @@ class AlgorithmAnalyzer:
         
         print(f"Detailed report saved to: {save_path}")
 
-def analyze_results():
+# Analyzer owned by a pool worker process, built once by _init_worker
+_worker_analyzer = None
+
+def _init_worker(maze_state, test_cases, algorithms, repeats, warmup):
+    """Process pool initializer: rebuild the maze once per worker"""
+    global _worker_analyzer
+    height, width, cells, costs = maze_state
+    _worker_analyzer = AlgorithmAnalyzer(Maze(height, width, bytearray(cells), costs), test_cases, repeats, warmup)
+    _worker_analyzer.algorithms = algorithms
+
+def _run_worker_task(test_case_idx: int, algorithm_name: str) -> Dict[str, Any]:
+    return _worker_analyzer.run_test_case_task(test_case_idx, algorithm_name)
+
+def analyze_results(workers: Optional[int] = None, cache: Optional[PathCache] = ANALYSIS_CACHE):
     """Main function to run the complete analysis"""
     print("Starting comprehensive algorithm analysis...")
     print("This may take a few moments as we test all algorithms on all test cases...")
     
-    analyzer = AlgorithmAnalyzer()
+    analyzer = AlgorithmAnalyzer(cache=cache)
     
     # Run comprehensive analysis
-    results = analyzer.run_comprehensive_analysis()
+    results = analyzer.run_comprehensive_analysis(workers=workers)
     
     # Generate charts and metrics
     metrics = analyzer.create_performance_comparison_charts()
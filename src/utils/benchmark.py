@@ -0,0 +1,93 @@
+"""
+Benchmark harness shared by main.py and utils/analysis.py
+
+Timing and memory are measured in separate runs. tracemalloc hooks every
+allocation and inflates wall time several-fold, so timed runs have tracing
+off (and the cyclic GC paused, as timeit does) and are repeated after a few
+warmup runs. Peak memory comes from one extra run with tracing on.
+
+statistics, tracemalloc and typing are kept off the import path: they made
+up most of this module's import time, which every short-lived solver process
+pays.
+"""
+
+import gc
+import math
+import time
+from collections.abc import Callable, Sequence
+
+DEFAULT_REPEATS = 20
+DEFAULT_WARMUP = 3
+
+
+def time_runs(func: Callable, args: Sequence, repeats: int = DEFAULT_REPEATS,
+              warmup: int = DEFAULT_WARMUP) -> tuple[object, list[float]]:
+    """Call func(*args) warmup + repeats times, returning the last result and the timed samples"""
+    result = None
+    for _ in range(warmup):
+        result = func(*args)
+
+    samples = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            result = func(*args)
+            samples.append(time.perf_counter() - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result, samples
+
+
+def measure_memory(func: Callable, args: Sequence) -> tuple[object, int, int]:
+    """Run func(*args) once under tracemalloc, returning (result, current bytes, peak bytes)"""
+    import tracemalloc
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def summarize(samples: Sequence[float]) -> dict[str, float]:
+    """Robust summary of a timing distribution: median, p95 and median absolute deviation"""
+    import statistics
+    if not samples:
+        raise ValueError("No samples to summarize")
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    # Nearest-rank percentile
+    p95 = ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    mad = statistics.median(abs(sample - median) for sample in ordered)
+    return {
+        'median': median,
+        'p95': p95,
+        'mad': mad,
+        'mean': statistics.fmean(ordered),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'count': len(ordered)
+    }
+
+
+def benchmark(func: Callable, args: Sequence, repeats: int = DEFAULT_REPEATS,
+              warmup: int = DEFAULT_WARMUP) -> dict[str, object]:
+    """Time func(*args) untraced over repeats, then take peak memory from one traced run.
+
+    The returned 'result' comes from the traced run.
+    """
+    _, samples = time_runs(func, args, repeats, warmup)
+    result, current, peak = measure_memory(func, args)
+    return {
+        'result': result,
+        'samples': samples,
+        'timing': summarize(samples),
+        'current_memory': current,
+        'peak_memory': peak
+    }